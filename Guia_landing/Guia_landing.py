@@ -1,13 +1,108 @@
+import functools
+
 import reflex as rx
-from Guia_landing.codigo_pagina import create_page
+from Guia_landing import bundle_report, codigo_pagina, flags, profiling
+from Guia_landing.atomic_css import STYLESHEET, AtomicStylesheet, extract_atomic_css
+from Guia_landing.flatten import flatten_dom
+from Guia_landing.i18n import SOURCE_LOCALE, available_locales
+from Guia_landing.icon_sprite import compile_icons
+from Guia_landing.image_pipeline import apply_background, build_responsive_image
+from Guia_landing.sites import load_site, site_files, site_slug
+from Guia_landing.static_app import StaticApp
+from Guia_landing.tailwind_purge import inline_tailwind
+from Guia_landing.vendor_assets import AssetVendor, vendor_assets
+from Guia_landing.zero_js import MARKER_META, needs_javascript
 
-def index() -> rx.Component:
-    return rx.box(
-        create_page(),
+# GUIA_ATOMIC_CSS=1 moves every inline style into one static atomic stylesheet.
+ATOMIC_CSS = flags.enabled("atomic_css")
+# GUIA_FLATTEN_DOM=1 merges wrapper elements that do not change the layout.
+FLATTEN_DOM = flags.enabled("flatten_dom")
+# GUIA_PURGE_TAILWIND=1 inlines only the used Tailwind utilities instead of the CDN sheet.
+PURGE_TAILWIND = flags.enabled("purge_tailwind")
+# GUIA_ICON_SPRITE=1 renders icons from one inline SVG sprite instead of lucide-react.
+ICON_SPRITE = flags.enabled("icon_sprite")
+# GUIA_VENDOR_ASSETS=1 serves every third-party file from a hashed same-origin copy out of vendor/assets/.
+VENDOR_ASSETS = flags.enabled("vendor_assets")
+# GUIA_ZERO_JS=1 marks the pages without state so that zero_js.py drops their JavaScript.
+ZERO_JS = flags.enabled("zero_js")
+# GUIA_SOURCE_MAPS=1 writes chunk source maps so that bundle_report.py can attribute the bundle.
+if flags.enabled("source_maps"):
+    bundle_report.enable_source_maps()
+# GUIA_PROFILE=1 records builder and compile timings into GUIA_PROFILE_DIR (default profile/).
+PROFILE = (
+    profiling.install(codigo_pagina, flags.value("profile_dir", profiling.DEFAULT_OUTPUT_DIR))
+    if flags.enabled("profile")
+    else None
+)
+# GUIA_SITES=<dir> adds one page per site file of that directory, routed by its slug.
+SITES_DIR = flags.value("sites")
+# GUIA_LOCALES=en,fr (or "all") adds every page again under /<lang>/, translated from locales/.
+LOCALES = flags.value("locales", SOURCE_LOCALE)
+LOCALES = available_locales() if LOCALES == "all" else LOCALES.split(",")
+
+# assets/hero.jpg, or else the asset cache's copy, is the default site's hero photo.
+HERO_IMAGE_URL = load_site()["hero"]["image"]
+# GUIA_RESPONSIVE_IMAGES=1 serves the hero photo as AVIF/WebP/JPEG variants.
+HERO_IMAGE = (
+    build_responsive_image(url=HERO_IMAGE_URL) if flags.enabled("responsive_images") else None
+)
+
+ATOMIC_SHEET = AtomicStylesheet()
+
+ASSET_VENDOR = AssetVendor()
+
+
+def site_page(site, locale=SOURCE_LOCALE) -> rx.Component:
+    page = rx.box(
+        codigo_pagina.create_page(site, locale),
         #commet
     )
+    if FLATTEN_DOM:
+        page = flatten_dom(page)
+    if PURGE_TAILWIND:
+        page = inline_tailwind(page)
+    if ICON_SPRITE:
+        page = compile_icons(page)
+    if HERO_IMAGE is not None:
+        page = apply_background(page, HERO_IMAGE_URL, HERO_IMAGE)
+    if VENDOR_ASSETS:
+        page = vendor_assets(page, vendor=ASSET_VENDOR)
+    if ATOMIC_CSS:
+        page = extract_atomic_css(page, sheet=ATOMIC_SHEET)
+    return page
+
+
+def index() -> rx.Component:
+    return site_page(load_site())
+
+
+def add_page(render, route=None, **kwargs):
+    """Add a page, marked for the zero-JS export when it needs no client code."""
+    if ZERO_JS:
+        route = route or render.__name__
+        render = render()
+        if not needs_javascript(render, kwargs.get("on_load")):
+            kwargs["meta"] = [*kwargs.get("meta", []), MARKER_META]
+    app.add_page(render, route=route, **kwargs)
 
 
-app = rx.App()
-app.add_page(index)
-#cambios
\ No newline at end of file
+app = StaticApp(
+    stylesheets=[f"/{STYLESHEET}"] if ATOMIC_CSS else [],
+    head_components=(
+        [HERO_IMAGE.placeholder_style(), *HERO_IMAGE.preload_links()] if HERO_IMAGE is not None else []
+    ),
+)
+add_page(index)
+for locale in LOCALES:
+    prefix = "" if locale == SOURCE_LOCALE else f"{locale}/"
+    if prefix:
+        add_page(functools.partial(site_page, load_site(), locale), route=locale)
+    for path in site_files(SITES_DIR) if SITES_DIR is not None else []:
+        site = load_site(path)
+        add_page(
+            functools.partial(site_page, site, locale),
+            route=prefix + site_slug(path),
+            title=site["brand"],
+            description=site["tagline"],
+        )
+#cambios
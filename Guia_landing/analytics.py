@@ -0,0 +1,189 @@
+"""First-party section views and CTA clicks, without a third-party script.
+
+    python -m Guia_landing.analytics public
+
+adds a small beacon to every exported page. It counts the first time each
+section comes into view and every click on an element with data-track (the
+CTA buttons), batches the events and sends them to /api/beacon with
+navigator.sendBeacon when the batch fills up or the page is hidden.
+
+BeaconCollector, served by `python -m Guia_landing.serve --analytics-dir`,
+keeps one fixed-size array of counters per UTC day: a hit is a dict lookup
+and an increment, and no raw event is stored. Every FLUSH_INTERVAL seconds
+the counters are added to <analytics-dir>/<day>.json and reset.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+from Guia_landing.service_worker import page_urls
+
+BEACON_PATH = "/api/beacon"
+
+DEFAULT_OUTPUT_DIR = Path("analytics")
+
+FLUSH_INTERVAL = 60.0
+
+MAX_BODY_BYTES = 4 * 1024
+
+# Events accepted from one beacon; the client sends at most BATCH_SIZE.
+MAX_EVENTS = 50
+
+BATCH_SIZE = 20
+
+# Element id -> section name, and the sections a data-track click may name.
+SECTION_IDS = {"welcome": "hero", "services": "services", "process": "process", "contact": "contact"}
+CLICK_TARGETS = ("cta",)
+
+METRICS = tuple(f"view:{section}" for section in SECTION_IDS.values()) + tuple(
+    f"click:{target}" for target in CLICK_TARGETS
+)
+
+SLOTS = {metric: slot for slot, metric in enumerate(METRICS)}
+
+BEACON_MARKER = "data-beacon"
+
+BEACON_SCRIPT = """\
+<script %(marker)s>(function(){
+if(!navigator.sendBeacon||!window.IntersectionObserver)return;
+var queue=[],ids=%(ids)s;
+function send(){if(queue.length){navigator.sendBeacon("%(path)s",JSON.stringify(queue));queue=[]}}
+function hit(event){queue.push(event);if(queue.length>=%(batch)d)send()}
+document.addEventListener("click",function(event){
+var target=event.target.closest&&event.target.closest("[data-track]");
+if(target)hit("click:"+target.getAttribute("data-track"))},true);
+addEventListener("visibilitychange",function(){if(document.visibilityState==="hidden")send()});
+addEventListener("pagehide",send);
+addEventListener("load",function(){
+var observer=new IntersectionObserver(function(entries){entries.forEach(function(entry){
+if(entry.isIntersecting){hit("view:"+ids[entry.target.id]);observer.unobserve(entry.target)}})},
+{rootMargin:"0px 0px -40%% 0px"});
+Object.keys(ids).forEach(function(id){var section=document.getElementById(id);if(section)observer.observe(section)})})
+})()</script>"""
+
+
+def beacon_script():
+    """Return the inline <script> that sends the page's events."""
+    return BEACON_SCRIPT % {
+        "marker": BEACON_MARKER,
+        "ids": json.dumps(SECTION_IDS, separators=(",", ":")),
+        "path": BEACON_PATH,
+        "batch": BATCH_SIZE,
+    }
+
+
+def add_beacon(path):
+    """Add the beacon to a page; returns whether the page changed."""
+    html = path.read_text()
+    if BEACON_MARKER in html or "</body>" not in html:
+        return False
+    path.write_text(html.replace("</body>", f"{beacon_script()}</body>", 1))
+    return True
+
+
+def today():
+    """Return the current UTC day as YYYY-MM-DD."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+
+class BeaconCollector:
+    """Per-day counters of the beacon's events, flushed to JSON rollups."""
+
+    def __init__(self, output_dir=DEFAULT_OUTPUT_DIR, flush_interval=FLUSH_INTERVAL):
+        self.output_dir = Path(output_dir)
+        self.flush_interval = flush_interval
+        self.days = {}
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="analytics")
+        self.task = None
+
+    def record(self, body):
+        """Count the events of one beacon; returns how many were known."""
+        try:
+            events = json.loads(body)
+        except ValueError:
+            return 0
+        if not isinstance(events, list):
+            return 0
+        day = today()
+        counters = self.days.get(day)
+        if counters is None:
+            counters = self.days[day] = array("Q", bytes(8 * len(METRICS)))
+        recorded = 0
+        for event in events[:MAX_EVENTS]:
+            slot = SLOTS.get(event) if isinstance(event, str) else None
+            if slot is not None:
+                counters[slot] += 1
+                recorded += 1
+        return recorded
+
+    def _write(self, days):
+        """Add the counters of each day to its rollup file."""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        for day, counters in days.items():
+            path = self.output_dir / f"{day}.json"
+            totals = json.loads(path.read_text()) if path.exists() else {}
+            for metric, count in zip(METRICS, counters):
+                totals[metric] = totals.get(metric, 0) + count
+            partial = path.with_name(path.name + ".tmp")
+            partial.write_text(json.dumps(totals, indent=2, sort_keys=True) + "\n")
+            os.replace(partial, path)
+
+    async def flush(self):
+        """Write the counters gathered so far and start new ones."""
+        days, self.days = self.days, {}
+        if not days:
+            return
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(self.executor, self._write, days)
+        except (OSError, ValueError) as error:
+            # Keep the counts for the next flush.
+            for day, counters in days.items():
+                current = self.days.setdefault(day, array("Q", bytes(8 * len(METRICS))))
+                for slot, count in enumerate(counters):
+                    current[slot] += count
+            print(f"Could not write the analytics rollup: {error}", file=sys.stderr, flush=True)
+
+    async def run(self):
+        """Flush every flush_interval seconds until cancelled."""
+        try:
+            while True:
+                await asyncio.sleep(self.flush_interval)
+                await self.flush()
+        finally:
+            await self.flush()
+
+    def start(self):
+        """Start the background flush task."""
+        self.task = asyncio.get_running_loop().create_task(self.run())
+        return self.task
+
+    def close(self):
+        """Stop the writer thread."""
+        self.executor.shutdown()
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(
+        prog="python -m Guia_landing.analytics", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument("public_dir", nargs="?", default="public")
+    args = parser.parse_args(argv)
+    if not Path(args.public_dir).is_dir():
+        parser.error(f"{args.public_dir} is not a directory")
+    pages = [path for _, path in page_urls(args.public_dir)]
+    changed = sum(add_beacon(path) for path in pages)
+    print(f"Beacon added to {changed} of {len(pages)} pages")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+"""Compile-time extraction of inline style props into atomic CSS classes."""
+
+import hashlib
+from pathlib import Path
+
+import reflex as rx
+from reflex.style import Style, format_as_emotion
+from reflex.utils.format import to_kebab_case
+from reflex.vars.base import LiteralVar, Var
+
+# Stylesheet written to assets/ and registered with rx.App(stylesheets=...).
+STYLESHEET = "atomic.css"
+
+MEDIA_PREFIX = "@media screen and (min-width: "
+
+
+def _literal(value):
+    """Return the plain value of a literal style value, or None if it is dynamic."""
+    if isinstance(value, LiteralVar):
+        value = getattr(value, "_var_value", None)
+    elif isinstance(value, Var):
+        return None
+    if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        return None
+    return str(value)
+
+
+def _flatten(style, media="", pseudo=""):
+    """Yield (media, pseudo, property, value) rules, or None for unsupported entries."""
+    for key, value in style.items():
+        if isinstance(value, dict):
+            if key.startswith("@media"):
+                yield from _flatten(value, key, pseudo)
+            elif key.startswith("&") and not pseudo:
+                yield from _flatten(value, media, key[1:])
+            else:
+                yield None
+            continue
+        literal = _literal(value)
+        if literal is None:
+            yield None
+            continue
+        prop = key if key.startswith("--") else to_kebab_case(key)
+        yield media, pseudo, prop, literal
+
+
+def _class_name(rule):
+    """Return the hashed atomic class name for a rule."""
+    digest = hashlib.sha1("|".join(rule).encode()).hexdigest()
+    return f"a{digest[:7]}"
+
+
+class AtomicStylesheet:
+    """Collects the atomic rules extracted from one or more component trees."""
+
+    def __init__(self):
+        self.rules = {}
+        self.extracted = 0
+
+    def extract(self, component):
+        """Move the literal styles of a component tree into atomic classes."""
+        for child in component.children:
+            if isinstance(child, rx.Component):
+                self.extract(child)
+        if not component.style or not isinstance(
+            component.class_name, (str, type(None))
+        ):
+            return component
+        emotion = format_as_emotion(component.style) or {}
+        rules = list(_flatten(emotion))
+        if not rules or None in rules:
+            return component
+        classes = []
+        for rule in rules:
+            name = self.rules.setdefault(rule, _class_name(rule))
+            if name not in classes:
+                classes.append(name)
+        component.class_name = " ".join(
+            filter(None, [component.class_name, *classes])
+        )
+        component.style = Style()
+        self.extracted += 1
+        return component
+
+    def render(self):
+        """Render the deduplicated rules, base rules first and media queries by width."""
+        groups = {}
+        for (media, pseudo, prop, value), name in self.rules.items():
+            groups.setdefault(media, []).append(f".{name}{pseudo}{{{prop}:{value}}}")
+
+        def width(media):
+            if not media.startswith(MEDIA_PREFIX):
+                return float("inf")
+            size = media[len(MEDIA_PREFIX) :].rstrip(")").strip()
+            return float("".join(c for c in size if c.isdigit() or c == ".") or 0)
+
+        lines = groups.pop("", [])
+        for media in sorted(groups, key=width):
+            lines.append(f"{media}{{{''.join(groups[media])}}}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, assets_dir="assets"):
+        """Write the stylesheet into the assets directory, only if it changed."""
+        path = Path(assets_dir) / STYLESHEET
+        css = self.render()
+        if not path.exists() or path.read_text() != css:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(css)
+        return path
+
+
+def extract_atomic_css(component, assets_dir="assets", sheet=None):
+    """Replace the inline styles of a tree with atomic classes and write the stylesheet.
+
+    Pages sharing one stylesheet pass the same sheet so every page's rules are written.
+    """
+    sheet = AtomicStylesheet() if sheet is None else sheet
+    sheet.extract(component)
+    sheet.write(assets_dir)
+    return component
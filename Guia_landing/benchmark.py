@@ -0,0 +1,247 @@
+"""Benchmarks for building, compiling and exporting the landing page.
+
+    python -m Guia_landing.benchmark run --output bench.json [--export]
+    python -m Guia_landing.benchmark compare baseline.json bench.json --threshold 10
+
+Every stage reports its median wall time, peak traced memory and the size of
+the component tree it worked on. Scaled variants multiply the feature boxes
+and process steps to show how compile cost grows with the tree.
+"""
+
+import argparse
+import functools
+import json
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from html.parser import HTMLParser
+from pathlib import Path
+
+import reflex as rx
+from reflex.compiler import compiler
+
+from Guia_landing.codigo_pagina import (
+    create_feature_box,
+    create_page,
+    create_process_step_box,
+)
+
+DEFAULT_SCALES = (10, 100)
+
+DEFAULT_REPEAT = 5
+
+# Metrics compared between two runs; each one regresses when it grows.
+METRICS = ("wall_s", "peak_bytes")
+
+
+def count_nodes(component):
+    """Count the components of a tree."""
+    return 1 + sum(
+        count_nodes(child)
+        for child in component.children
+        if isinstance(child, rx.Component)
+    )
+
+
+def _find(component, predicate):
+    """Return the first component of a tree matching a predicate."""
+    if predicate(component):
+        return component
+    for child in component.children:
+        if isinstance(child, rx.Component):
+            found = _find(child, predicate)
+            if found is not None:
+                return found
+    return None
+
+
+def _style_is(component, name, value):
+    """Return whether a component has a literal style value."""
+    return str(component.style.get(name, "")).strip('"') == value
+
+
+def _has_id(component, section_id):
+    """Return whether a component carries a given id."""
+    return str(getattr(component, "id", None) or "").strip('"') == section_id
+
+
+def create_scaled_page(factor):
+    """Create the page with factor times as many feature boxes and process steps."""
+    page = create_page()
+    services = _find(page, lambda c: _has_id(c, "services"))
+    grid = _find(services, lambda c: _style_is(c, "display", "grid"))
+    grid.children = [
+        create_feature_box(
+            icon_alt=f"Icono {index}",
+            icon_name=("bar-chart", "code", "target")[index % 3],
+            feature_title=f"Servicio {index}",
+            feature_description="Descripción sintética para medir el coste de compilación.",
+        )
+        for index in range(3 * factor)
+    ]
+    process = _find(page, lambda c: _has_id(c, "process"))
+    steps = _find(
+        process,
+        lambda c: c.children
+        and all("boxShadow" in getattr(s, "style", {}) for s in c.children),
+    )
+    steps.children = [
+        create_process_step_box(
+            step_number=str(index + 1),
+            step_title=f"Paso {index + 1}",
+            step_description="Paso sintético para medir el coste de compilación.",
+        )
+        for index in range(3 * factor)
+    ]
+    return page
+
+
+def measure(function, repeat=DEFAULT_REPEAT):
+    """Time a function and trace its peak memory; returns (result, metrics)."""
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, {"wall_s": statistics.median(timings), "peak_bytes": peak}
+
+
+def bench_page(name, build, repeat):
+    """Benchmark building a page tree and compiling it; returns two stages."""
+    page, build_metrics = measure(build, repeat)
+    nodes = count_nodes(page)
+    # One fresh tree per timed call, built beforehand so that only compiling is measured.
+    trees = iter([build() for _ in range(repeat + 1)])
+    _, compile_metrics = measure(
+        lambda: compiler.compile_page("index", next(trees), None), repeat
+    )
+    return {
+        f"{name}.build": {**build_metrics, "nodes": nodes},
+        f"{name}.compile": {**compile_metrics, "nodes": nodes},
+    }
+
+
+class _NodeCounter(HTMLParser):
+    """Counts the elements of an HTML document."""
+
+    def __init__(self):
+        super().__init__()
+        self.nodes = 0
+
+    def handle_starttag(self, tag, attrs):
+        self.nodes += 1
+
+
+def bench_export():
+    """Time a full `reflex export --frontend-only` in a child process."""
+    start = time.perf_counter()
+    subprocess.run(
+        ["reflex", "export", "--frontend-only", "--no-zip", "--loglevel", "warning"],
+        check=True,
+    )
+    wall = time.perf_counter() - start
+    peak_kib = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    counter = _NodeCounter()
+    index = Path(".web") / "_static" / "index.html"
+    if index.exists():
+        counter.feed(index.read_text())
+    return {"wall_s": wall, "peak_bytes": peak_kib * 1024, "nodes": counter.nodes}
+
+
+def run(scales=DEFAULT_SCALES, repeat=DEFAULT_REPEAT, export=False):
+    """Run every benchmark stage and return the results."""
+    from Guia_landing.Guia_landing import index
+
+    stages = {}
+    stages.update(bench_page("create_page", create_page, repeat))
+    stages.update(bench_page("index", index, repeat))
+    for factor in scales:
+        build = functools.partial(create_scaled_page, factor)
+        stages.update(bench_page(f"scaled_{factor}x", build, repeat))
+    if export:
+        stages["export"] = bench_export()
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "stages": stages,
+    }
+
+
+def compare(baseline, current, threshold):
+    """Return the (stage, metric, change %) entries that regressed past threshold."""
+    regressions = []
+    for stage, metrics in current["stages"].items():
+        before = baseline["stages"].get(stage)
+        if before is None:
+            continue
+        for metric in METRICS:
+            if not before.get(metric):
+                continue
+            change = (metrics[metric] - before[metric]) / before[metric] * 100
+            print(
+                f"{stage:<24} {metric:<11} {before[metric]:>14.4f} "
+                f"{metrics[metric]:>14.4f} {change:+8.1f}%"
+            )
+            if change > threshold:
+                regressions.append((stage, metric, change))
+    return regressions
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(
+        prog="python -m Guia_landing.benchmark", description=__doc__.splitlines()[0]
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("--output", default="bench.json")
+    run_parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    run_parser.add_argument(
+        "--scales", type=int, nargs="*", default=list(DEFAULT_SCALES)
+    )
+    run_parser.add_argument(
+        "--export", action="store_true", help="also time a full frontend export"
+    )
+    compare_parser = commands.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument(
+        "--threshold", type=float, default=10.0, help="allowed growth in percent"
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        results = run(args.scales, args.repeat, args.export)
+        Path(args.output).write_text(json.dumps(results, indent=2) + "\n")
+        for stage, metrics in results["stages"].items():
+            print(
+                f"{stage:<24} {metrics['wall_s']:.4f}s "
+                f"{metrics['peak_bytes'] / 1e6:.1f} MB {metrics['nodes']} nodes"
+            )
+        return 0
+
+    baseline = json.loads(Path(args.baseline).read_text())
+    current = json.loads(Path(args.current).read_text())
+    regressions = compare(baseline, current, args.threshold)
+    for stage, metric, change in regressions:
+        print(
+            f"Regression: {stage} {metric} grew {change:.1f}% "
+            f"(threshold {args.threshold}%)"
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,231 @@
+"""Offline page-weight and performance budget for the exported public/ directory.
+
+    python -m Guia_landing.budget public --budget budget.json
+
+Measures the exported files without a browser and exits non-zero when any
+figure is over the budget. Byte budgets are gzip sizes; raw sizes are
+reported alongside them.
+"""
+
+import argparse
+import gzip
+import json
+import re
+import sys
+from html.parser import HTMLParser
+from pathlib import Path
+from urllib.parse import urlsplit
+
+DEFAULT_BUDGET = Path("budget.json")
+
+FILE_TYPES = {
+    ".html": "html",
+    ".css": "css",
+    ".js": "js",
+    ".json": "data",
+    ".xml": "data",
+    ".txt": "data",
+    ".avif": "image",
+    ".webp": "image",
+    ".jpg": "image",
+    ".jpeg": "image",
+    ".png": "image",
+    ".svg": "image",
+    ".ico": "image",
+    ".woff2": "font",
+    ".woff": "font",
+    ".ttf": "font",
+}
+
+COMPRESSED_SUFFIXES = {".br", ".gz"}
+
+CSS_URL_RE = re.compile(r"url\(\s*['\"]?(https?:)?//([^/'\")\s]+)")
+
+
+class PageScan(HTMLParser):
+    """Collects what the browser needs before it can render a page."""
+
+    def __init__(self):
+        super().__init__()
+        self.nodes = 0
+        self.render_blocking = []
+        self.first_render = []
+        self.origins = set()
+        self._in_style = False
+        self._in_noscript = False
+
+    def _absolute(self, url):
+        """Record the origin of an absolute URL."""
+        parts = urlsplit(url or "")
+        if parts.netloc and parts.scheme in ("http", "https", ""):
+            self.origins.add(parts.netloc)
+
+    def handle_starttag(self, tag, attrs):
+        self.nodes += 1
+        attrs = dict(attrs)
+        if "style" in attrs:
+            self.handle_css(attrs["style"] or "")
+        if tag == "style":
+            self._in_style = True
+        elif tag == "noscript":
+            # Fallbacks for browsers without JavaScript are not fetched otherwise.
+            self._in_noscript = True
+        elif self._in_noscript:
+            return
+        elif tag == "link":
+            rel = (attrs.get("rel") or "").split()
+            href = attrs.get("href")
+            if "stylesheet" in rel:
+                self._absolute(href)
+                if attrs.get("media", "all") in ("all", "screen") and "onload" not in attrs:
+                    self.render_blocking.append(href)
+                    self.first_render.append(href)
+            elif "preload" in rel:
+                self._absolute(href)
+                self.first_render.append(href)
+        elif tag == "script" and attrs.get("src"):
+            self._absolute(attrs["src"])
+            deferred = {"defer", "async"} & set(attrs) or attrs.get("type") == "module"
+            if not deferred and "nomodule" not in attrs:
+                self.render_blocking.append(attrs["src"])
+                self.first_render.append(attrs["src"])
+        elif tag == "img" and attrs.get("loading") != "lazy":
+            self._absolute(attrs.get("src"))
+            self.first_render.append(attrs.get("src"))
+
+    def handle_endtag(self, tag):
+        if tag == "style":
+            self._in_style = False
+        elif tag == "noscript":
+            self._in_noscript = False
+
+    def handle_data(self, data):
+        if self._in_style:
+            self.handle_css(data)
+
+    def handle_css(self, css):
+        """Record the origins referenced by url() in inline CSS."""
+        for _, host in CSS_URL_RE.findall(css):
+            self.origins.add(host)
+
+
+def _gzip_size(path):
+    """Return the gzip size of a file, reusing a precompressed sibling."""
+    sibling = path.with_name(path.name + ".gz")
+    if sibling.exists() and sibling.stat().st_mtime >= path.stat().st_mtime:
+        return sibling.stat().st_size
+    return len(gzip.compress(path.read_bytes(), compresslevel=9, mtime=0))
+
+
+def measure_bytes(public_dir):
+    """Return raw and gzip byte totals per file type."""
+    totals = {}
+    for path in sorted(Path(public_dir).rglob("*")):
+        if not path.is_file() or path.suffix in COMPRESSED_SUFFIXES:
+            continue
+        kind = FILE_TYPES.get(path.suffix.lower(), "other")
+        entry = totals.setdefault(kind, {"raw": 0, "gzip": 0, "files": 0})
+        entry["raw"] += path.stat().st_size
+        entry["gzip"] += _gzip_size(path)
+        entry["files"] += 1
+    return totals
+
+
+def scan_page(path):
+    """Scan one HTML page for its first-render cost."""
+    scan = PageScan()
+    scan.feed(path.read_text())
+    return {
+        "dom_nodes": scan.nodes,
+        # The document itself plus everything fetched before the first paint.
+        "first_render_requests": 1 + len(scan.first_render),
+        "render_blocking": scan.render_blocking,
+        "third_party_origins": sorted(scan.origins),
+    }
+
+
+def measure(public_dir, pages):
+    """Collect every budgeted figure of an export."""
+    by_type = measure_bytes(public_dir)
+    report = {
+        "bytes": by_type,
+        "total_bytes": {
+            "raw": sum(entry["raw"] for entry in by_type.values()),
+            "gzip": sum(entry["gzip"] for entry in by_type.values()),
+        },
+        "pages": {},
+    }
+    for page in pages:
+        path = Path(public_dir) / page
+        if path.exists():
+            report["pages"][page] = scan_page(path)
+    return report
+
+
+def check(report, budget):
+    """Return the list of budget breaches of a report."""
+    breaches = []
+
+    def over(label, value, limit):
+        if limit is not None and value > limit:
+            breaches.append(f"{label}: {value} > {limit}")
+
+    over("total gzip bytes", report["total_bytes"]["gzip"], budget.get("total_gzip_bytes"))
+    for kind, limit in budget.get("gzip_bytes", {}).items():
+        over(f"{kind} gzip bytes", report["bytes"].get(kind, {}).get("gzip", 0), limit)
+    allowed = set(budget.get("allowed_origins", []))
+    for page, figures in report["pages"].items():
+        over(f"{page} DOM nodes", figures["dom_nodes"], budget.get("dom_nodes"))
+        over(
+            f"{page} first-render requests",
+            figures["first_render_requests"],
+            budget.get("first_render_requests"),
+        )
+        over(
+            f"{page} render-blocking resources",
+            len(figures["render_blocking"]),
+            budget.get("render_blocking"),
+        )
+        for origin in figures["third_party_origins"]:
+            if origin not in allowed:
+                breaches.append(f"{page} third-party origin not allowed: {origin}")
+    return breaches
+
+
+def _print_report(report):
+    """Print a short human readable summary of a report."""
+    for kind, entry in sorted(report["bytes"].items()):
+        print(f"{kind:<6} {entry['files']:>4} files {entry['raw']:>10} B {entry['gzip']:>9} B gzip")
+    total = report["total_bytes"]
+    print(f"{'total':<6} {'':>10} {total['raw']:>10} B {total['gzip']:>9} B gzip")
+    for page, figures in report["pages"].items():
+        print(
+            f"{page}: {figures['dom_nodes']} DOM nodes, "
+            f"{figures['first_render_requests']} first-render requests, "
+            f"{len(figures['render_blocking'])} render-blocking, "
+            f"origins: {', '.join(figures['third_party_origins']) or 'none'}"
+        )
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(
+        prog="python -m Guia_landing.budget", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument("public_dir", nargs="?", default="public")
+    parser.add_argument("--budget", default=str(DEFAULT_BUDGET))
+    parser.add_argument("--json", help="also write the measurements to this file")
+    args = parser.parse_args(argv)
+    budget = json.loads(Path(args.budget).read_text())
+    report = measure(args.public_dir, budget.get("pages", ["index.html"]))
+    _print_report(report)
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2) + "\n")
+    breaches = check(report, budget)
+    for breach in breaches:
+        print(f"Over budget: {breach}")
+    return 1 if breaches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+"""Content-hashed build cache for the static export.
+
+remote_build.sh asks this module whether the export inputs changed since the
+last build, and syncs a fresh export into public/ file by file::
+
+    python -m Guia_landing.build_cache check      # exit 0 when nothing changed
+    python -m Guia_landing.build_cache sync .web/_static public
+    python -m Guia_landing.build_cache record
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+
+# Files and directories whose content decides the exported site.
+INPUTS = (
+    "Guia_landing",
+    "rxconfig.py",
+    "requirements.txt",
+    "assets",
+    "vendor",
+    "sites",
+    "locales",
+    "remote_build.sh",
+    "budget.json",
+)
+
+# static_state.js is copied into .web/ on every compile (see static_app.py).
+INPUT_SUFFIXES = {"Guia_landing": {".py", ".js"}}
+
+# Files the build writes into its own inputs; they must not change the digest.
+GENERATED = {
+    Path("assets") / "atomic.css",
+    Path("assets") / "img",
+    Path("assets") / "vendor",
+}
+
+# Environment prefix of the export switches (see Guia_landing/flags.py).
+FLAG_PREFIX = "GUIA_"
+
+STATE_FILE = Path(".build-state.json")
+
+# Siblings written by the postbuild stage next to the files they compress.
+COMPRESSED_SUFFIXES = (".br", ".gz")
+
+
+def _is_generated(path, root):
+    """Return whether a path is build output living inside an input directory."""
+    relative = path.relative_to(root)
+    return any(relative == g or g in relative.parents for g in GENERATED)
+
+
+def input_files(root="."):
+    """Return the sorted input files of the export."""
+    root = Path(root)
+    files = []
+    for name in INPUTS:
+        path = root / name
+        if path.is_file():
+            files.append(path)
+        elif path.is_dir():
+            suffixes = INPUT_SUFFIXES.get(name)
+            files.extend(
+                child
+                for child in path.rglob("*")
+                if child.is_file()
+                and "__pycache__" not in child.parts
+                and (suffixes is None or child.suffix in suffixes)
+                and not _is_generated(child, root)
+            )
+    return sorted(files)
+
+
+def input_digest(root="."):
+    """Hash the export inputs and the export switches into one digest."""
+    root = Path(root)
+    digest = hashlib.sha256()
+    for path in input_files(root):
+        digest.update(path.relative_to(root).as_posix().encode() + b"\0")
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    for name in sorted(os.environ):
+        if name.startswith(FLAG_PREFIX):
+            digest.update(f"{name}={os.environ[name]}\0".encode())
+    return digest.hexdigest()
+
+
+def load_state(root="."):
+    """Return the state recorded by the last successful build."""
+    path = Path(root) / STATE_FILE
+    return json.loads(path.read_text()) if path.exists() else {}
+
+
+def is_up_to_date(root=".", public_dir="public"):
+    """Return whether public/ was built from the current inputs."""
+    state = load_state(root)
+    return (Path(root) / public_dir / "index.html").exists() and state.get(
+        "inputs"
+    ) == input_digest(root)
+
+
+def record(root="."):
+    """Store the digest of the inputs the current public/ was built from."""
+    state = {"inputs": input_digest(root)}
+    (Path(root) / STATE_FILE).write_text(json.dumps(state, indent=2) + "\n")
+    return state
+
+
+def _same_content(source, target):
+    """Compare two files, cheaply when their sizes differ."""
+    if source.stat().st_size != target.stat().st_size:
+        return False
+    return source.read_bytes() == target.read_bytes()
+
+
+def sync_tree(source_dir, target_dir):
+    """Make target_dir match source_dir, only writing files whose content changed.
+
+    Unchanged files keep their modification time, so the precompressed
+    siblings the postbuild stage wrote next to them stay valid; siblings of
+    changed or removed files are deleted. Returns (written, removed) counts.
+    """
+    source_dir = Path(source_dir)
+    target_dir = Path(target_dir)
+    target_dir.mkdir(parents=True, exist_ok=True)
+    written = 0
+    changed = set()
+    expected = set()
+    for source in sorted(source_dir.rglob("*")):
+        if not source.is_file():
+            continue
+        relative = source.relative_to(source_dir)
+        expected.add(relative)
+        target = target_dir / relative
+        if target.is_file() and _same_content(source, target):
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(source, target)
+        changed.add(relative)
+        written += 1
+    removed = 0
+    for target in sorted(target_dir.rglob("*"), reverse=True):
+        relative = target.relative_to(target_dir)
+        if target.is_dir():
+            if not any(target.iterdir()):
+                target.rmdir()
+            continue
+        if relative in expected:
+            continue
+        if target.suffix in COMPRESSED_SUFFIXES:
+            base = relative.with_suffix("")
+            if base in expected and base not in changed:
+                continue
+        target.unlink()
+        removed += 1
+    return written, removed
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(
+        prog="python -m Guia_landing.build_cache",
+        description=__doc__.splitlines()[0],
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    check = commands.add_parser("check", help="exit 0 if public/ is up to date")
+    check.add_argument("--public-dir", default="public")
+    sync = commands.add_parser("sync", help="copy only the changed export files")
+    sync.add_argument("source_dir")
+    sync.add_argument("target_dir")
+    commands.add_parser("record", help="store the digest of the current inputs")
+    args = parser.parse_args(argv)
+
+    if args.command == "check":
+        return 0 if is_up_to_date(public_dir=args.public_dir) else 1
+    if args.command == "sync":
+        written, removed = sync_tree(args.source_dir, args.target_dir)
+        print(f"{args.target_dir}: {written} files written, {removed} removed")
+        return 0
+    print(f"Recorded inputs {record()['inputs'][:12]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
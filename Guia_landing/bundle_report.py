@@ -0,0 +1,515 @@
+"""Attribution of the exported JavaScript to npm packages and Reflex components.
+
+    python -m Guia_landing.bundle_report .web/_static [--compare old-report.json]
+
+Reads every chunk under _next/static/chunks with its source map and
+attributes each generated byte to the source module it came from, then sums
+the modules per npm package and per Reflex component type used by the app's
+pages (a Radix Heading is credited with heading.js, an rx.icon with its
+lucide-react icon file). Sizes are raw, gzip and, when the brotli module is
+installed, brotli; the compressed size of a package or component is that of
+its code compressed on its own. Writes bundle-report.json and a static
+treemap, bundle-report.html. --compare takes an earlier report or export
+and adds the size change of every chunk, package and component.
+
+Next.js only writes source maps when the export ran with GUIA_SOURCE_MAPS=1.
+Analyze .web/_static before deterministic.py renames the chunks; chunks
+without a map are reported as one "(no source map)" module. --strip-maps
+then deletes the maps and their sourceMappingURL comments, so they are
+neither hashed into the chunk names nor published.
+"""
+
+import argparse
+import colorsys
+import functools
+import gzip
+import hashlib
+import html
+import json
+import re
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+CHUNKS_DIR = Path("_next") / "static" / "chunks"
+
+DEFAULT_JSON = Path("bundle-report.json")
+
+DEFAULT_HTML = Path("bundle-report.html")
+
+BASE64 = {char: index for index, char in enumerate(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+)}
+
+SOURCE_MAPPING_RE = re.compile(r"//[#@] sourceMappingURL=(\S+)\s*$")
+
+# The trailing source map comment of a chunk or a stylesheet.
+SOURCE_MAPPING_COMMENT_RE = re.compile(
+    r"\n?(?://[#@] sourceMappingURL=\S+|/\*[#@] sourceMappingURL=\S+ \*/)\s*$"
+)
+
+STATIC_DIR = Path("_next") / "static"
+
+# enable_source_maps patches a private Reflex function; versions it was checked against.
+SUPPORTED_REFLEX = ("0.6.",)
+
+CHUNK_HASH_RE = re.compile(r"-[0-9a-f]{16,20}(?=\.js$)")
+
+APP_PACKAGE = "(app)"
+
+UNMAPPED = "(unmapped)"
+
+NO_SOURCE_MAP = "(no source map)"
+
+TREEMAP_SIZE = (1200, 720)
+
+# Height of the label strip on top of each package in the treemap.
+LABEL_HEIGHT = 18
+
+
+def enable_source_maps():
+    """Make the Next.js export write a source map next to every chunk; returns whether it will."""
+    from reflex import constants
+    from reflex.utils import console, prerequisites
+
+    original = getattr(prerequisites, "_update_next_config", None)
+    if original is None or not constants.Reflex.VERSION.startswith(SUPPORTED_REFLEX):
+        console.warn(
+            f"Source maps are not supported with Reflex {constants.Reflex.VERSION}; "
+            "the bundle report will not attribute the chunks."
+        )
+        return False
+
+    @functools.wraps(original)
+    def with_source_maps(*args, **kwargs):
+        config = original(*args, **kwargs)
+        if "module.exports = {" not in config:
+            console.warn("Unexpected next.config.js; source maps stay off.")
+            return config
+        return config.replace(
+            "module.exports = {", "module.exports = {productionBrowserSourceMaps: true, ", 1
+        )
+
+    prerequisites._update_next_config = with_source_maps
+    return True
+
+
+def decode_vlq(segment):
+    """Decode one Base64 VLQ source map segment into its integer fields."""
+    values, value, shift = [], 0, 0
+    for char in segment:
+        digit = BASE64[char]
+        value += (digit & 31) << shift
+        if digit & 32:
+            shift += 5
+            continue
+        values.append(-(value >> 1) if value & 1 else value >> 1)
+        value, shift = 0, 0
+    return values
+
+
+def attribute(code, source_map):
+    """Return {source: [generated text, ...]} for a chunk and its source map."""
+    sources = source_map.get("sources", [])
+    pieces = defaultdict(list)
+    lines = code.split("\n")
+    source = 0
+    for line_number, mappings in enumerate(source_map.get("mappings", "").split(";")):
+        if line_number >= len(lines):
+            break
+        line = lines[line_number]
+        column, position, spans = 0, 0, []
+        for segment in mappings.split(","):
+            if not segment:
+                continue
+            fields = decode_vlq(segment)
+            column += fields[0]
+            owner = None
+            if len(fields) > 1:
+                source += fields[1]
+                owner = sources[source] if source < len(sources) else UNMAPPED
+            spans.append((column, owner))
+        # Text before the first segment, and segments without a source, are unmapped.
+        spans.append((len(line), None))
+        owner = None
+        for column, next_owner in spans:
+            if column > position:
+                pieces[owner or UNMAPPED].append(line[position:column])
+                position = column
+            owner = next_owner
+        pieces[UNMAPPED].append("\n")
+    for line in lines[len(source_map.get("mappings", "").split(";")) :]:
+        pieces[UNMAPPED].append(line + "\n")
+    return pieces
+
+
+def package_of(source):
+    """Return the npm package a source module belongs to, or (app) for the app's own code."""
+    if source in (UNMAPPED, NO_SOURCE_MAP):
+        return source
+    path = source.split("://", 1)[-1]
+    if "node_modules/" in path:
+        parts = path.rsplit("node_modules/", 1)[1].split("/")
+        return "/".join(parts[:2]) if parts[0].startswith("@") else parts[0]
+    if path.startswith("webpack/"):
+        return "(webpack runtime)"
+    return APP_PACKAGE
+
+
+def module_name(source):
+    """Return a source path without its webpack:// prefix and build-specific parts."""
+    path = source.split("://", 1)[-1]
+    if "node_modules/" in path:
+        return path.rsplit("node_modules/", 1)[1]
+    return re.sub(r"^_N_E/(\./)?", "", path)
+
+
+def kebab(name):
+    """Return the kebab-case file stem of a component tag (BarChart -> bar-chart)."""
+    return re.sub(r"(?<=[a-z0-9])(?=[A-Z])", "-", name).lower()
+
+
+def _encoders():
+    """Return the (name, compress) pairs used for the compressed sizes."""
+    encoders = [("gzip", lambda raw: gzip.compress(raw, compresslevel=9, mtime=0))]
+    try:
+        import brotli
+
+        encoders.append(("brotli", lambda raw: brotli.compress(raw, mode=brotli.MODE_TEXT, quality=11)))
+    except ImportError:
+        pass
+    return encoders
+
+
+def sizes(texts):
+    """Return the raw and compressed sizes of some code."""
+    raw = "".join(texts).encode()
+    result = {"raw": len(raw)}
+    for name, compress in _encoders():
+        result[name] = len(compress(raw)) if raw else 0
+    return result
+
+
+def chunk_key(relative):
+    """Return a chunk name without its content hash, stable across builds."""
+    return CHUNK_HASH_RE.sub("", relative)
+
+
+def load_source_map(path, code):
+    """Return the source map of a chunk, or None."""
+    candidates = [path.with_name(path.name + ".map")]
+    match = SOURCE_MAPPING_RE.search(code[-500:])
+    if match and not match[1].startswith("data:"):
+        candidates.append(path.parent / match[1])
+    for candidate in candidates:
+        if candidate.is_file():
+            return json.loads(candidate.read_text())
+    return None
+
+
+def strip_source_maps(export_dir):
+    """Delete the source maps of an export and the comments pointing at them; returns the count."""
+    static = Path(export_dir) / STATIC_DIR
+    removed = 0
+    for path in sorted(static.rglob("*")):
+        if not path.is_file():
+            continue
+        if path.suffix == ".map":
+            path.unlink()
+            removed += 1
+        elif path.suffix in (".js", ".css"):
+            text = path.read_text()
+            stripped = SOURCE_MAPPING_COMMENT_RE.sub("", text)
+            if stripped != text:
+                path.write_text(stripped)
+    return removed
+
+
+def component_libraries(pages=None):
+    """Return {component type: {"package", "tags", "count"}} for the app's pages."""
+    from reflex.components.component import Component
+    from reflex.utils.format import format_library_name
+
+    if pages is None:
+        from Guia_landing.Guia_landing import app
+
+        pages = list(app.pages.values())
+    components = {}
+
+    def visit(component):
+        entry = components.setdefault(
+            type(component).__name__, {"package": None, "tags": set(), "count": 0}
+        )
+        entry["count"] += 1
+        if component.library:
+            entry["package"] = format_library_name(component.library)
+            if component.tag:
+                entry["tags"].add(str(component.tag).removesuffix("Icon"))
+        for child in component.children:
+            if isinstance(child, Component):
+                visit(child)
+
+    for page in pages:
+        visit(page)
+    return components
+
+
+def analyze(export_dir, components=None):
+    """Return the attribution report of an export."""
+    export_dir = Path(export_dir)
+    chunks_dir = export_dir / CHUNKS_DIR
+    if not chunks_dir.is_dir():
+        raise FileNotFoundError(f"{chunks_dir} does not exist.")
+    components = component_libraries() if components is None else components
+    modules = defaultdict(list)
+    module_chunks = defaultdict(set)
+    chunks = {}
+    for path in sorted(chunks_dir.rglob("*.js")):
+        relative = path.relative_to(chunks_dir).as_posix()
+        code = path.read_text()
+        source_map = load_source_map(path, code)
+        # The comment is not part of the published chunk (see strip_source_maps).
+        code = SOURCE_MAPPING_COMMENT_RE.sub("", code)
+        pieces = attribute(code, source_map) if source_map else {NO_SOURCE_MAP: [code]}
+        for source, texts in pieces.items():
+            key = (package_of(source), module_name(source))
+            modules[key].extend(texts)
+            module_chunks[key].add(chunk_key(relative))
+        chunks[chunk_key(relative)] = {
+            "file": relative,
+            "source_map": source_map is not None,
+            **sizes([code]),
+        }
+    packages = defaultdict(list)
+    for (package, _), texts in modules.items():
+        packages[package].extend(texts)
+    attributed = {}
+    for name, entry in components.items():
+        stems = {kebab(tag) for tag in entry["tags"]}
+        texts = []
+        for (package, module), module_texts in modules.items():
+            stem = module.rsplit("/", 1)[-1].split(".", 1)[0]
+            if package == entry["package"] and stem in stems:
+                texts.extend(module_texts)
+        attributed[name] = {
+            "package": entry["package"],
+            "tags": sorted(entry["tags"]),
+            "instances": entry["count"],
+            **sizes(texts),
+        }
+    return {
+        "export": str(export_dir),
+        "chunks": chunks,
+        "packages": {
+            name: sizes(texts)
+            for name, texts in sorted(packages.items(), key=lambda item: -len("".join(item[1])))
+        },
+        "components": dict(sorted(attributed.items(), key=lambda item: -item[1]["raw"])),
+        "modules": [
+            {
+                "package": package,
+                "module": module,
+                "chunks": sorted(module_chunks[(package, module)]),
+                "raw": len("".join(texts).encode()),
+            }
+            for (package, module), texts in sorted(modules.items())
+        ],
+    }
+
+
+def diff(old, new):
+    """Return the size change of every chunk, package and component between two reports."""
+    result = {}
+    for section in ("chunks", "packages", "components"):
+        changes = {}
+        for name in sorted(set(old[section]) | set(new[section])):
+            before = old[section].get(name, {})
+            after = new[section].get(name, {})
+            change = {
+                measure: after.get(measure, 0) - before.get(measure, 0)
+                for measure in ("raw", "gzip", "brotli")
+                if measure in before or measure in after
+            }
+            if any(change.values()):
+                changes[name] = {"before": before.get("raw", 0), "after": after.get("raw", 0), **change}
+        result[section] = dict(sorted(changes.items(), key=lambda item: -abs(item[1]["raw"])))
+    return result
+
+
+def squarify(items, x, y, width, height):
+    """Lay out (value, payload) items in a rectangle; returns (payload, x, y, w, h) tuples."""
+    items = sorted((item for item in items if item[0] > 0), key=lambda item: -item[0])
+    total = sum(value for value, _ in items)
+    if not total or width <= 0 or height <= 0:
+        return []
+    scale = width * height / total
+    rects = []
+
+    def worst(row, side):
+        area = sum(value for value, _ in row) * scale
+        return max(
+            max(side * side * value * scale / (area * area), area * area / (side * side * value * scale))
+            for value, _ in row
+        )
+
+    while items:
+        side = min(width, height)
+        row = [items[0]]
+        index = 1
+        while index < len(items) and worst(row + [items[index]], side) <= worst(row, side):
+            row.append(items[index])
+            index += 1
+        items = items[index:]
+        area = sum(value for value, _ in row) * scale
+        if width >= height:
+            column = area / height
+            top = y
+            for value, payload in row:
+                rects.append((payload, x, top, column, value * scale / column))
+                top += value * scale / column
+            x, width = x + column, width - column
+        else:
+            band = area / width
+            left = x
+            for value, payload in row:
+                rects.append((payload, left, y, value * scale / band, band))
+                left += value * scale / band
+            y, height = y + band, height - band
+    return rects
+
+
+def _color(package, lightness):
+    """Return a stable color for a package."""
+    hue = int(hashlib.sha1(package.encode()).hexdigest()[:4], 16) / 0xFFFF
+    red, green, blue = colorsys.hls_to_rgb(hue, lightness, 0.55)
+    return f"#{int(red * 255):02x}{int(green * 255):02x}{int(blue * 255):02x}"
+
+
+def _table(title, rows, columns):
+    """Return an HTML table."""
+    head = "".join(f"<th>{html.escape(column)}</th>" for column in columns)
+    body = "".join(
+        "<tr>" + "".join(f"<td>{html.escape(str(cell))}</td>" for cell in row) + "</tr>"
+        for row in rows
+    )
+    return f"<h2>{html.escape(title)}</h2><table><tr>{head}</tr>{body}</table>"
+
+
+def render_html(report):
+    """Return a static HTML page with a package/module treemap and the size tables."""
+    width, height = TREEMAP_SIZE
+    by_package = defaultdict(list)
+    for module in report["modules"]:
+        by_package[module["package"]].append((module["raw"], module))
+    boxes = []
+    package_rects = squarify(
+        [(sum(value for value, _ in items), name) for name, items in by_package.items()],
+        0, 0, width, height,
+    )
+    for package, x, y, w, h in package_rects:
+        title = f"{package}: {report['packages'][package]['raw']:,} bytes"
+        boxes.append(
+            f'<div class="package" style="left:{x:.1f}px;top:{y:.1f}px;width:{w:.1f}px;'
+            f'height:{h:.1f}px;background:{_color(package, 0.45)}" title="{html.escape(title)}">'
+            f"{html.escape(package)}</div>"
+        )
+        inner = squarify(by_package[package], x + 1, y + LABEL_HEIGHT, w - 2, h - LABEL_HEIGHT - 1)
+        for module, mx, my, mw, mh in inner:
+            title = f"{module['module']}: {module['raw']:,} bytes in {', '.join(module['chunks'])}"
+            label = html.escape(module["module"].rsplit("/", 1)[-1]) if mw > 60 and mh > 14 else ""
+            boxes.append(
+                f'<div class="module" style="left:{mx:.1f}px;top:{my:.1f}px;width:{mw:.1f}px;'
+                f'height:{mh:.1f}px;background:{_color(package, 0.72)}" title="{html.escape(title)}">'
+                f"{label}</div>"
+            )
+    measures = [
+        measure
+        for measure in ("raw", "gzip", "brotli")
+        if any(measure in entry for entry in report["packages"].values())
+    ]
+    sections = [
+        _table(
+            "Packages",
+            [[name, *(entry.get(m, "") for m in measures)] for name, entry in report["packages"].items()],
+            ["package", *measures],
+        ),
+        _table(
+            "Components",
+            [
+                [name, entry["package"] or "(html element)", ", ".join(entry["tags"]), entry["instances"], *(entry.get(m, "") for m in measures)]
+                for name, entry in report["components"].items()
+            ],
+            ["component", "package", "tags", "instances", *measures],
+        ),
+        _table(
+            "Chunks",
+            [[name, "yes" if entry["source_map"] else "no", *(entry.get(m, "") for m in measures)] for name, entry in report["chunks"].items()],
+            ["chunk", "source map", *measures],
+        ),
+    ]
+    for section, changes in report.get("diff", {}).items():
+        sections.append(
+            _table(
+                f"Change in {section}",
+                [[name, change["before"], change["after"], f"{change['raw']:+,}", *(f"{change[m]:+,}" for m in measures[1:] if m in change)] for name, change in changes.items()],
+                [section[:-1], "before", "after", "raw", *measures[1:]],
+            )
+        )
+    return f"""<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8"><title>Bundle report: {html.escape(report['export'])}</title>
+<style>
+body{{font:14px system-ui,sans-serif;margin:24px;color:#111827}}
+.treemap{{position:relative;width:{width}px;height:{height}px;border:1px solid #111827}}
+.package,.module{{position:absolute;box-sizing:border-box;overflow:hidden;white-space:nowrap;text-overflow:ellipsis}}
+.package{{border:1px solid #111827;color:#fff;font-weight:600;padding:1px 4px;font-size:12px}}
+.module{{border:1px solid rgba(0,0,0,.25);color:#111827;font-size:11px;padding:1px 3px}}
+table{{border-collapse:collapse;margin-bottom:16px}}td,th{{border:1px solid #D1D5DB;padding:2px 8px;text-align:right}}
+td:first-child,th:first-child{{text-align:left}}
+</style></head><body>
+<h1>Bundle report: {html.escape(report['export'])}</h1>
+<div class="treemap">{''.join(boxes)}</div>
+{''.join(sections)}
+</body></html>
+"""
+
+
+def _load(path):
+    """Return a report from a JSON file or by analyzing an export directory."""
+    path = Path(path)
+    return json.loads(path.read_text()) if path.is_file() else analyze(path)
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(
+        prog="python -m Guia_landing.bundle_report", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument("export_dir", nargs="?", default=".web/_static")
+    parser.add_argument("--json", type=Path, default=DEFAULT_JSON)
+    parser.add_argument("--html", type=Path, default=DEFAULT_HTML)
+    parser.add_argument("--compare", help="an earlier bundle-report.json or export directory")
+    parser.add_argument(
+        "--strip-maps",
+        action="store_true",
+        help="then delete the source maps and their comments from the export",
+    )
+    args = parser.parse_args(argv)
+    if not (Path(args.export_dir) / CHUNKS_DIR).is_dir():
+        parser.error(f"{args.export_dir} has no {CHUNKS_DIR.as_posix()}")
+    report = analyze(args.export_dir)
+    if args.compare:
+        report["diff"] = diff(_load(args.compare), report)
+    args.json.write_text(json.dumps(report, indent=2) + "\n")
+    args.html.write_text(render_html(report))
+    for name, entry in report["packages"].items():
+        print(f"{entry['raw']:>9,} {entry['gzip']:>8,} gz  {name}")
+    for name, change in report.get("diff", {}).get("packages", {}).items():
+        print(f"{change['raw']:>+9,} {change['gzip']:>+8,} gz  {name} (change)")
+    print(f"Wrote {args.json} and {args.html}")
+    if args.strip_maps:
+        print(f"Removed {strip_source_maps(args.export_dir)} source maps from {args.export_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
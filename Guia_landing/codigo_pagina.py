@@ -1,5 +1,60 @@
 import reflex as rx
+from reflex.vars.base import Var
 
+from Guia_landing import flags
+from Guia_landing.i18n import SOURCE_LOCALE, _, use_locale
+from Guia_landing.sites import load_site
+from Guia_landing.templates import template
+
+# Responsive max-width shared by every centered content container.
+CONTAINER_BREAKPOINTS = rx.breakpoints(
+    {
+        "640px": {"max-width": "640px"},
+        "768px": {"max-width": "768px"},
+        "1024px": {"max-width": "1024px"},
+        "1280px": {"max-width": "1280px"},
+        "1536px": {"max-width": "1536px"},
+    }
+)
+
+
+BELOW_FOLD_ATTRIBUTE = "data-below-fold"
+
+
+# Below-the-fold sections skip layout and paint until they near the viewport.
+# The heights are estimates for the one-column and the wide layout; once
+# rendered the browser remembers the real size ("auto"). The markup stays in
+# the page, so anchor links such as #process still find their targets. The
+# marker attribute tells postbuild.py to leave them out of the critical CSS.
+def deferred_rendering(mobile_height, desktop_height):
+    """Return the style props that defer rendering a section."""
+    return {
+        "content_visibility": "auto",
+        "contain_intrinsic_size": rx.breakpoints(
+            {"0px": f"auto {mobile_height}", "768px": f"auto {desktop_height}"}
+        ),
+        "custom_attrs": {BELOW_FOLD_ATTRIBUTE: "true"},
+    }
+
+
+# Lead endpoint answered by `python -m Guia_landing.serve` (see leads.py).
+CONTACT_ENDPOINT = "/api/contact"
+
+# GUIA_CONTACT_FORM=1 adds the lead form to #contact. A plain static host cannot
+# answer its POST, so the site must then be served by `Guia_landing.serve --leads-db`.
+CONTACT_FORM = flags.enabled("contact_form")
+
+
+class NativeForm(rx.Component):
+    """A plain HTML <form> that posts to its action, without Reflex event handlers."""
+
+    tag = "form"
+
+    action: Var[str]
+
+    method: Var[str]
+
+@template("link_url", "link_content")
 def create_hover_link(hover_styles, link_url, link_content):
     """Create a hyperlink with hover effects."""
     return rx.el.a(
@@ -27,6 +82,8 @@ def create_styled_button(
     return rx.el.a(
         button_content,
         href="#contact",
+        # Counted as a CTA click by the analytics beacon.
+        custom_attrs={"data-track": "cta"},
         background_color=bg_color,
         transition_duration="300ms",
         _hover=hover_styles,
@@ -84,6 +141,7 @@ def create_text(text_content):
     return rx.text(text_content)
 
 
+@template("icon_alt", "feature_title", "feature_description")
 def create_feature_box(
     icon_alt, icon_name, feature_title, feature_description
 ):
@@ -121,6 +179,7 @@ def create_process_step_circle(step_number):
     )
 
 
+@template("step_number", "step_title", "step_description")
 def create_process_step_box(
     step_number, step_title, step_description
 ):
@@ -161,6 +220,7 @@ def create_text_span(span_content):
     return rx.text.span(span_content)
 
 
+@template("icon_alt", "text_content")
 def create_icon_text(icon_alt, icon_name, text_content):
     """Create a flex container with an icon and text."""
     return rx.text(
@@ -185,17 +245,19 @@ def create_medium_icon(alt_text, icon_name):
     )
 
 
-def create_social_link(hover_styles, icon_alt, icon_name):
+@template("icon_alt", "link_url")
+def create_social_link(hover_styles, icon_alt, icon_name, link_url="#"):
     """Create a social media link with an icon and hover effect."""
     return rx.el.a(
         create_medium_icon(
             alt_text=icon_alt, icon_name=icon_name
         ),
-        href="#",
+        href=link_url,
         _hover=hover_styles,
     )
 
 
+@template("link_url", "link_text")
 def create_nav_item(link_url, link_text):
     """Create a navigation item with a hover effect."""
     return rx.el.li(
@@ -207,11 +269,11 @@ def create_nav_item(link_url, link_text):
     )
 
 
-def create_header():
+def create_header(site):
     """Create the main header with logo and navigation items."""
     return rx.flex(
         rx.el.a(
-            "ServicePro",
+            site["brand"],
             href="#",
             font_weight="700",
             font_size="1.5rem",
@@ -222,22 +284,22 @@ def create_header():
             create_hover_link(
                 hover_styles={"color": "#059669"},
                 link_url="#welcome",
-                link_content="Inicio",
+                link_content=_("Inicio"),
             ),
             create_hover_link(
                 hover_styles={"color": "#059669"},
                 link_url="#services",
-                link_content="Servicios",
+                link_content=_("Servicios"),
             ),
             create_hover_link(
                 hover_styles={"color": "#059669"},
                 link_url="#process",
-                link_content="Proceso",
+                link_content=_("Proceso"),
             ),
             create_hover_link(
                 hover_styles={"color": "#059669"},
                 link_url="#contact",
-                link_content="Contacto",
+                link_content=_("Contacto"),
             ),
             display=rx.breakpoints(
                 {"0px": "none", "768px": "flex"}
@@ -250,21 +312,13 @@ def create_header():
     )
 
 
-def create_sticky_header():
+def create_sticky_header(site):
     """Create a sticky header with responsive styling."""
     return rx.box(
         rx.box(
-            create_header(),
+            create_header(site),
             width="100%",
-            style=rx.breakpoints(
-                {
-                    "640px": {"max-width": "640px"},
-                    "768px": {"max-width": "768px"},
-                    "1024px": {"max-width": "1024px"},
-                    "1280px": {"max-width": "1280px"},
-                    "1536px": {"max-width": "1536px"},
-                }
-            ),
+            style=CONTAINER_BREAKPOINTS,
             margin_left="auto",
             margin_right="auto",
             padding_left="1.5rem",
@@ -280,11 +334,11 @@ def create_sticky_header():
     )
 
 
-def create_hero_content():
+def create_hero_content(site):
     """Create the hero section content with title, subtitle, and CTA button."""
     return rx.box(
         rx.heading(
-            "Bienvenido a ServicePro",
+            _(site["hero"]["title"]),
             font_weight="700",
             margin_bottom="1rem",
             font_size="3rem",
@@ -293,7 +347,7 @@ def create_hero_content():
             as_="h1",
         ),
         rx.text(
-            "Soluciones innovadoras para las necesidades de tu negocio",
+            _(site["tagline"]),
             margin_bottom="2rem",
             color="#ffffff",
             font_size="1.25rem",
@@ -303,7 +357,7 @@ def create_hero_content():
             hover_styles={"background-color": "#047857"},
             bg_color="#059669",
             text_color="#ffffff",
-            button_content="Empezar",
+            button_content=_("Empezar"),
         ),
         position="relative",
         text_align="center",
@@ -311,14 +365,14 @@ def create_hero_content():
     )
 
 
-def create_hero_section():
+def create_hero_section(site):
     """Create the full hero section with background image and overlay."""
     return rx.flex(
         create_overlay(),
-        create_hero_content(),
+        create_hero_content(site),
         class_name="h-[50vh]",
         id="welcome",
-        background_image="url('https://images.pexels.com/photos/130621/pexels-photo-130621.jpeg')",
+        background_image=f"url('{site['hero']['image']}')",
         background_position="center",
         background_size="cover",
         display="flex",
@@ -328,32 +382,23 @@ def create_hero_section():
     )
 
 
-def create_services_section():
+def create_services_section(site):
     """Create the services section with title and feature boxes."""
     return rx.box(
         create_section_heading(
             bottom_margin="2rem",
-            heading_text="Nuestros Servicios",
+            heading_text=_("Nuestros Servicios"),
         ),
         rx.box(
-            create_feature_box(
-                icon_alt="Icono de Analítica",
-                icon_name="bar-chart",
-                feature_title="Analítica de Datos",
-                feature_description="Desbloquea insights de tus datos para impulsar el crecimiento del negocio.",
-            ),
-            create_feature_box(
-                icon_alt="Icono de Desarrollo",
-                icon_name="code",
-                feature_title="Desarrollo Web",
-                feature_description="Crea sitios web impresionantes y responsivos adaptados a tus necesidades.",
-            ),
-            create_feature_box(
-                icon_alt="Icono de Marketing",
-                icon_name="target",
-                feature_title="Marketing Digital",
-                feature_description="Aumenta tu presencia en línea y alcanza a tu audiencia objetivo.",
-            ),
+            *[
+                create_feature_box(
+                    icon_alt=_(service["icon_alt"]),
+                    icon_name=service["icon"],
+                    feature_title=_(service["title"]),
+                    feature_description=_(service["description"]),
+                )
+                for service in site["services"]
+            ],
             gap="2rem",
             display="grid",
             grid_template_columns=rx.breakpoints(
@@ -364,15 +409,7 @@ def create_services_section():
             ),
         ),
         width="100%",
-        style=rx.breakpoints(
-            {
-                "640px": {"max-width": "640px"},
-                "768px": {"max-width": "768px"},
-                "1024px": {"max-width": "1024px"},
-                "1280px": {"max-width": "1280px"},
-                "1536px": {"max-width": "1536px"},
-            }
-        ),
+        style=CONTAINER_BREAKPOINTS,
         margin_left="auto",
         margin_right="auto",
         padding_left="1.5rem",
@@ -380,29 +417,22 @@ def create_services_section():
     )
 
 
-def create_process_section():
+def create_process_section(site):
     """Create the process section with title and step boxes."""
     return rx.box(
         create_section_heading(
             bottom_margin="3rem",
-            heading_text="Cómo lo Hacemos",
+            heading_text=_("Cómo lo Hacemos"),
         ),
         rx.flex(
-            create_process_step_box(
-                step_number="1",
-                step_title="Consulta",
-                step_description="Discutimos tus necesidades y objetivos para entender tu visión.",
-            ),
-            create_process_step_box(
-                step_number="2",
-                step_title="Ejecución",
-                step_description="Implementamos la solución con precisión y cuidado.",
-            ),
-            create_process_step_box(
-                step_number="3",
-                step_title="Revisión",
-                step_description="Analizamos y optimizamos los resultados para una mejora continua.",
-            ),
+            *[
+                create_process_step_box(
+                    step_number=str(number),
+                    step_title=_(step["title"]),
+                    step_description=_(step["description"]),
+                )
+                for number, step in enumerate(site["process"], start=1)
+            ],
             display="flex",
             flex_direction=rx.breakpoints(
                 {"0px": "column", "768px": "row"}
@@ -415,15 +445,7 @@ def create_process_section():
             column_gap=rx.breakpoints({"768px": "2rem"}),
         ),
         width="100%",
-        style=rx.breakpoints(
-            {
-                "640px": {"max-width": "640px"},
-                "768px": {"max-width": "768px"},
-                "1024px": {"max-width": "1024px"},
-                "1280px": {"max-width": "1280px"},
-                "1536px": {"max-width": "1536px"},
-            }
-        ),
+        style=CONTAINER_BREAKPOINTS,
         margin_left="auto",
         margin_right="auto",
         padding_left="1.5rem",
@@ -431,36 +453,25 @@ def create_process_section():
     )
 
 
-def create_social_links():
+def create_social_links(site):
     """Create a section with social media links."""
     return rx.box(
         create_custom_heading(
             heading_level="h4",
             font_size="1.125rem",
             bottom_margin="0.5rem",
-            heading_text="Síguenos",
+            heading_text=_("Síguenos"),
         ),
         rx.flex(
-            create_social_link(
-                hover_styles={"color": "#059669"},
-                icon_alt="Facebook",
-                icon_name="facebook",
-            ),
-            create_social_link(
-                hover_styles={"color": "#059669"},
-                icon_alt="Twitter",
-                icon_name="twitter",
-            ),
-            create_social_link(
-                hover_styles={"color": "#059669"},
-                icon_alt="Instagram",
-                icon_name="instagram",
-            ),
-            create_social_link(
-                hover_styles={"color": "#059669"},
-                icon_alt="LinkedIn",
-                icon_name="linkedin",
-            ),
+            *[
+                create_social_link(
+                    hover_styles={"color": "#059669"},
+                    icon_alt=_(link["name"]),
+                    icon_name=link["icon"],
+                    link_url=link["url"],
+                )
+                for link in site["social"]
+            ],
             display="flex",
             justify_content="center",
             column_gap="1rem",
@@ -469,7 +480,7 @@ def create_social_links():
     )
 
 
-def create_contact_info():
+def create_contact_info(site):
     """Create a contact information section with email, phone, and website."""
     return rx.flex(
         rx.box(
@@ -477,24 +488,24 @@ def create_contact_info():
                 heading_level="h3",
                 font_size="1.25rem",
                 bottom_margin="1rem",
-                heading_text="Ponte en Contacto",
+                heading_text=_("Ponte en Contacto"),
             ),
             create_icon_text(
-                icon_alt="Email",
+                icon_alt=_("Email"),
                 icon_name="mail",
-                text_content="info@servicepro.com",
+                text_content=site["contact"]["email"],
             ),
             create_icon_text(
-                icon_alt="Teléfono",
+                icon_alt=_("Teléfono"),
                 icon_name="phone",
-                text_content="+1 (123) 456-7890",
+                text_content=site["contact"]["phone"],
             ),
             create_icon_text(
-                icon_alt="Sitio Web",
+                icon_alt=_("Sitio Web"),
                 icon_name="globe",
-                text_content="www.servicepro.com",
+                text_content=site["contact"]["website"],
             ),
-            create_social_links(),
+            create_social_links(site),
             text_align="center",
         ),
         display="flex",
@@ -503,25 +514,99 @@ def create_contact_info():
     )
 
 
-def create_contact_section():
+def create_form_field(field_label, field_name, field_type, max_length):
+    """Create a labelled input, or a textarea for the "textarea" type."""
+    field_style = {
+        "width": "100%",
+        "padding": "0.75rem",
+        "border": "1px solid #D1D5DB",
+        "border_radius": "0.375rem",
+        "font": "inherit",
+    }
+    if field_type == "textarea":
+        field = rx.el.textarea(
+            id=f"lead-{field_name}",
+            name=field_name,
+            required=True,
+            max_length=max_length,
+            rows=5,
+            **field_style,
+        )
+    else:
+        field = rx.el.input(
+            id=f"lead-{field_name}",
+            name=field_name,
+            type=field_type,
+            required=True,
+            max_length=max_length,
+            **field_style,
+        )
+    return rx.box(
+        rx.el.label(
+            field_label,
+            html_for=f"lead-{field_name}",
+            display="block",
+            margin_bottom="0.25rem",
+            font_weight="600",
+        ),
+        field,
+        margin_bottom="1rem",
+    )
+
+
+def create_contact_form():
+    """Create the lead form, posted as a regular HTML form."""
+    return NativeForm.create(
+        create_form_field(_("Nombre"), "name", "text", 100),
+        create_form_field(_("Email"), "email", "email", 254),
+        create_form_field(_("Mensaje"), "message", "textarea", 2000),
+        # Honeypot: hidden from people, filled in by form-filling bots.
+        rx.el.input(
+            name="website",
+            type="text",
+            tab_index=-1,
+            auto_complete="off",
+            custom_attrs={"aria-hidden": "true"},
+            position="absolute",
+            left="-9999px",
+        ),
+        rx.el.button(
+            _("Enviar Mensaje"),
+            type="submit",
+            background_color="#059669",
+            color="#ffffff",
+            padding_left="2rem",
+            padding_right="2rem",
+            padding_top="0.75rem",
+            padding_bottom="0.75rem",
+            border_radius="0.375rem",
+            font_weight="600",
+            cursor="pointer",
+            _hover={"background-color": "#047857"},
+        ),
+        action=CONTACT_ENDPOINT,
+        method="post",
+        width="100%",
+        max_width="32rem",
+        margin_top="3rem",
+        margin_left="auto",
+        margin_right="auto",
+        position="relative",
+    )
+
+
+def create_contact_section(site):
     """Create the full contact section with title and contact information."""
     return rx.box(
         rx.box(
             create_section_heading(
                 bottom_margin="3rem",
-                heading_text="Contáctanos",
+                heading_text=_("Contáctanos"),
             ),
-            create_contact_info(),
+            create_contact_info(site),
+            *([create_contact_form()] if CONTACT_FORM else []),
             width="100%",
-            style=rx.breakpoints(
-                {
-                    "640px": {"max-width": "640px"},
-                    "768px": {"max-width": "768px"},
-                    "1024px": {"max-width": "1024px"},
-                    "1280px": {"max-width": "1280px"},
-                    "1536px": {"max-width": "1536px"},
-                }
-            ),
+            style=CONTAINER_BREAKPOINTS,
             margin_left="auto",
             margin_right="auto",
             padding_left="1.5rem",
@@ -531,6 +616,11 @@ def create_contact_section():
         background_color="#ffffff",
         padding_top="5rem",
         padding_bottom="5rem",
+        **(
+            deferred_rendering("900px", "900px")
+            if CONTACT_FORM
+            else deferred_rendering("470px", "470px")
+        ),
     )
 
 
@@ -538,7 +628,7 @@ def create_cta_section():
     """Create a call-to-action section with title, subtitle, and button."""
     return rx.box(
         rx.heading(
-            "¿Listo para empezar?",
+            _("¿Listo para empezar?"),
             font_weight="700",
             margin_bottom="1rem",
             font_size="1.875rem",
@@ -546,25 +636,17 @@ def create_cta_section():
             as_="h2",
         ),
         rx.text(
-            "Transformemos tu negocio juntos",
+            _("Transformemos tu negocio juntos"),
             margin_bottom="2rem",
         ),
         create_styled_button(
             hover_styles={"background-color": "#F3F4F6"},
             bg_color="#ffffff",
             text_color="#059669",
-            button_content="Contáctanos Ahora",
+            button_content=_("Contáctanos Ahora"),
         ),
         width="100%",
-        style=rx.breakpoints(
-            {
-                "640px": {"max-width": "640px"},
-                "768px": {"max-width": "768px"},
-                "1024px": {"max-width": "1024px"},
-                "1280px": {"max-width": "1280px"},
-                "1536px": {"max-width": "1536px"},
-            }
-        ),
+        style=CONTAINER_BREAKPOINTS,
         margin_left="auto",
         margin_right="auto",
         padding_left="1.5rem",
@@ -575,53 +657,54 @@ def create_cta_section():
     )
 
 
-def create_main_content():
+def create_main_content(site):
     """Create the main content of the page, including all sections."""
     return rx.box(
-        create_hero_section(),
+        create_hero_section(site),
         rx.box(
-            create_services_section(),
+            create_services_section(site),
             id="services",
             background_color="#ffffff",
             padding_top="5rem",
             padding_bottom="5rem",
+            **deferred_rendering("960px", "430px"),
         ),
         rx.box(
-            create_process_section(),
+            create_process_section(site),
             id="process",
             background_color="#F3F4F6",
             padding_top="5rem",
             padding_bottom="5rem",
+            **deferred_rendering("1040px", "490px"),
         ),
-        create_contact_section(),
+        create_contact_section(site),
         rx.box(
             create_overlay(),
             create_cta_section(),
-            background_image="url('https://images.pexels.com/photos/130621/pexels-photo-130621.jpeg')",
+            background_image=f"url('{site['hero']['image']}')",
             background_position="center",
             background_size="cover",
             padding_top="5rem",
             padding_bottom="5rem",
             position="relative",
             color="#ffffff",
+            **deferred_rendering("340px", "320px"),
         ),
     )
 
 
-def create_footer_branding():
+def create_footer_branding(site):
     """Create the branding section for the footer."""
     return rx.box(
         rx.heading(
-            "ServicePro",
+            site["brand"],
             font_weight="700",
             margin_bottom="0.5rem",
             font_size="1.5rem",
             line_height="2rem",
             as_="h3",
         ),
-        create_text(
-            text_content="Soluciones innovadoras para las necesidades de tu negocio"
-        ),
+        create_text(text_content=_(site["tagline"])),
         margin_bottom=rx.breakpoints(
             {"0px": "1.5rem", "768px": "0"}
         ),
@@ -631,31 +714,31 @@ def create_footer_branding():
     )
 
 
-def create_footer_content():
+def create_footer_content(site):
     """Create the main content of the footer, including branding, quick links, and social links."""
     return rx.flex(
-        create_footer_branding(),
+        create_footer_branding(site),
         rx.box(
             create_custom_heading(
                 heading_level="h4",
                 font_size="1.125rem",
                 bottom_margin="1rem",
-                heading_text="Enlaces Rápidos",
+                heading_text=_("Enlaces Rápidos"),
             ),
             rx.list(
                 create_nav_item(
-                    link_url="#welcome", link_text="Inicio"
+                    link_url="#welcome", link_text=_("Inicio")
                 ),
                 create_nav_item(
                     link_url="#services",
-                    link_text="Servicios",
+                    link_text=_("Servicios"),
                 ),
                 create_nav_item(
-                    link_url="#process", link_text="Proceso"
+                    link_url="#process", link_text=_("Proceso")
                 ),
                 create_nav_item(
                     link_url="#contact",
-                    link_text="Contacto",
+                    link_text=_("Contacto"),
                 ),
             ),
             margin_bottom=rx.breakpoints(
@@ -670,29 +753,18 @@ def create_footer_content():
                 heading_level="h4",
                 font_size="1.125rem",
                 bottom_margin="1rem",
-                heading_text="Síguenos",
+                heading_text=_("Síguenos"),
             ),
             rx.flex(
-                create_social_link(
-                    hover_styles={"color": "#34D399"},
-                    icon_alt="Facebook",
-                    icon_name="facebook",
-                ),
-                create_social_link(
-                    hover_styles={"color": "#34D399"},
-                    icon_alt="Twitter",
-                    icon_name="twitter",
-                ),
-                create_social_link(
-                    hover_styles={"color": "#34D399"},
-                    icon_alt="Instagram",
-                    icon_name="instagram",
-                ),
-                create_social_link(
-                    hover_styles={"color": "#34D399"},
-                    icon_alt="LinkedIn",
-                    icon_name="linkedin",
-                ),
+                *[
+                    create_social_link(
+                        hover_styles={"color": "#34D399"},
+                        icon_alt=_(link["name"]),
+                        icon_name=link["icon"],
+                        link_url=link["url"],
+                    )
+                    for link in site["social"]
+                ],
                 display="flex",
                 column_gap="1rem",
             ),
@@ -707,13 +779,15 @@ def create_footer_content():
     )
 
 
-def create_footer():
+def create_footer(site):
     """Create the full footer section with content and copyright notice."""
     return rx.box(
-        create_footer_content(),
+        create_footer_content(site),
         rx.box(
             create_text(
-                text_content="© 2023 ServicePro. Todos los derechos reservados."
+                text_content=_(
+                    "© {year} {brand}. Todos los derechos reservados."
+                ).format(year=site["copyright_year"], brand=site["brand"])
             ),
             border_color="#374151",
             border_top_width="1px",
@@ -722,15 +796,7 @@ def create_footer():
             text_align="center",
         ),
         width="100%",
-        style=rx.breakpoints(
-            {
-                "640px": {"max-width": "640px"},
-                "768px": {"max-width": "768px"},
-                "1024px": {"max-width": "1024px"},
-                "1280px": {"max-width": "1280px"},
-                "1536px": {"max-width": "1536px"},
-            }
-        ),
+        style=CONTAINER_BREAKPOINTS,
         margin_left="auto",
         margin_right="auto",
         padding_left="1.5rem",
@@ -738,17 +804,18 @@ def create_footer():
     )
 
 
-def create_page_layout():
+def create_page_layout(site):
     """Create the overall page layout, including header, main content, and footer."""
     return rx.box(
-        create_sticky_header(),
-        create_main_content(),
+        create_sticky_header(site),
+        create_main_content(site),
         rx.box(
-            create_footer(),
+            create_footer(site),
             background_color="#1F2937",
             padding_top="2rem",
             padding_bottom="2rem",
             color="#ffffff",
+            **deferred_rendering("450px", "270px"),
         ),
         background_color="#ffffff",
         font_family='system-ui, -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, "Noto Sans", sans-serif, "Apple Color Emoji", "Segoe UI Emoji", "Segoe UI Symbol", "Noto Color Emoji"',
@@ -756,8 +823,15 @@ def create_page_layout():
     )
 
 
-def create_page():
-    """Create the complete page with necessary styles and layout."""
+def create_page(site=None, locale=SOURCE_LOCALE):
+    """Create the complete page of a site (the default site when none is given) in a locale."""
+    site = load_site() if site is None else site
+    with use_locale(locale):
+        return create_page_content(site)
+
+
+def create_page_content(site):
+    """Create the page content with necessary styles and layout."""
     return rx.fragment(
         rx.el.link(
             href="https://cdn.jsdelivr.net/npm/tailwindcss@2.2.19/dist/tailwind.min.css",
@@ -767,9 +841,9 @@ def create_page():
             """
         @font-face {
             font-family: 'LucideIcons';
-            src: url(https://unpkg.com/lucide-static@latest/font/Lucide.ttf) format('truetype');
+            src: url(https://unpkg.com/lucide-static@0.359.0/font/Lucide.ttf) format('truetype');
         }
     """
         ),
-        create_page_layout(),
+        create_page_layout(site),
     )
\ No newline at end of file
@@ -0,0 +1,63 @@
+"""Small helpers for walking minified stylesheets, without any dependencies."""
+
+import re
+
+
+def strip_comments(css):
+    """Remove /* ... */ comments from a stylesheet."""
+    return re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+
+
+def blocks(css):
+    """Yield the top-level (prelude, body) blocks of a stylesheet.
+
+    Statements without a block, such as @charset or @import, are yielded with
+    a body of None.
+    """
+    depth = 0
+    start = 0
+    opened = 0
+    quote = None
+    for index, char in enumerate(css):
+        if quote:
+            if char == quote and css[index - 1] != "\\":
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char == "{":
+            if depth == 0:
+                opened = index
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                yield css[start:opened].strip(), css[opened + 1 : index]
+                start = index + 1
+        elif char == ";" and depth == 0:
+            statement = css[start:index].strip()
+            if statement:
+                yield statement, None
+            start = index + 1
+
+
+def split_top_level(text, separator):
+    """Split on a separator that is outside parentheses, brackets and strings."""
+    parts = []
+    depth = 0
+    quote = None
+    start = 0
+    for index, char in enumerate(text):
+        if quote:
+            if char == quote and text[index - 1] != "\\":
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char == separator and depth == 0:
+            parts.append(text[start:index])
+            start = index + 1
+    parts.append(text[start:])
+    return parts
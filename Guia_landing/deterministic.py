@@ -0,0 +1,188 @@
+"""Make a static export byte-identical for identical inputs.
+
+Next.js gives every build a random build ID and Reflex stamps the sitemap
+with the export time. This stage rewrites a fresh export before it is synced
+into public/::
+
+    python -m Guia_landing.deterministic .web/_static
+
+The build ID becomes a digest of the export inputs, hashed chunk and CSS
+file names are re-derived from their content (source maps are renamed with
+their chunk), sitemap timestamps are pinned
+to SOURCE_DATE_EPOCH (or the last commit touching the inputs) and sitemap entries are sorted.
+
+The webpack runtime builds the names of lazily loaded chunks and stylesheets
+from a {chunk id: "hash"} map, so a renamed file's quoted hash is replaced in
+the scripts as well as its full name everywhere.
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+from Guia_landing.build_cache import INPUTS, input_digest
+
+STATIC_DIR = Path("_next") / "static"
+
+TEXT_EXTENSIONS = {".css", ".html", ".js", ".json", ".map", ".txt", ".xml"}
+
+# A chunk's source map is named after it and renamed along with it.
+SOURCE_MAP_SUFFIX = ".map"
+
+BUILD_ID_RE = re.compile(r'"buildId":"([^"]+)"')
+
+# name-hash.js for entry chunks, id.hash.js for lazy ones, hash.css for stylesheets.
+HASHED_NAME_RE = re.compile(
+    r"^(?P<stem>.+[-.])?(?P<hash>[0-9a-f]{16,20})\.(?P<ext>js|css)$"
+)
+
+LASTMOD_RE = re.compile(r"<lastmod>[^<]*</lastmod>")
+
+URL_ENTRY_RE = re.compile(r"<url>.*?</url>", re.S)
+
+BUILD_ID_LENGTH = 21
+
+# Renaming a file changes the content of the files that reference it.
+MAX_RENAME_ROUNDS = 10
+
+
+def _text_files(export_dir, extensions=TEXT_EXTENSIONS):
+    """Yield the text files of an export."""
+    for path in sorted(Path(export_dir).rglob("*")):
+        if path.is_file() and path.suffix in extensions:
+            yield path
+
+
+def _replace_everywhere(export_dir, replacements, extensions=TEXT_EXTENSIONS):
+    """Apply literal string replacements to the text files of an export."""
+    if not replacements:
+        return
+    pattern = re.compile("|".join(re.escape(old) for old in replacements))
+    for path in _text_files(export_dir, extensions):
+        text = path.read_text()
+        updated = pattern.sub(lambda match: replacements[match[0]], text)
+        if updated != text:
+            path.write_text(updated)
+
+
+def find_build_id(export_dir):
+    """Return the build ID of an export, read from its index.html."""
+    index = Path(export_dir) / "index.html"
+    match = BUILD_ID_RE.search(index.read_text()) if index.exists() else None
+    return match[1] if match else None
+
+
+def stabilize_build_id(export_dir, digest):
+    """Replace the random build ID by one derived from the input digest."""
+    old = find_build_id(export_dir)
+    new = digest[:BUILD_ID_LENGTH]
+    if old is None or old == new:
+        return new
+    static = Path(export_dir) / STATIC_DIR
+    if (static / old).is_dir():
+        (static / old).rename(static / new)
+    # Only pages and manifests carry the build ID; chunks are left alone.
+    _replace_everywhere(export_dir, {old: new}, {".html", ".json"})
+    _replace_everywhere(static / new, {old: new})
+    return new
+
+
+def content_digest(path):
+    """Hash a file with the references to its own name left out.
+
+    A chunk that names itself (a sourceMappingURL comment, for instance)
+    would otherwise change its digest every time it is renamed.
+    """
+    return hashlib.sha256(path.read_bytes().replace(path.name.encode(), b"")).hexdigest()
+
+
+def stabilize_chunk_names(export_dir):
+    """Rename hashed chunks and stylesheets, and their source maps, after their own content."""
+    static = Path(export_dir) / STATIC_DIR
+    renamed = 0
+    for _ in range(MAX_RENAME_ROUNDS):
+        replacements = {}
+        hashes = {}
+        for path in sorted(static.rglob("*")):
+            match = HASHED_NAME_RE.match(path.name)
+            if not path.is_file() or not match:
+                continue
+            digest = content_digest(path)
+            stem = match["stem"] or ""
+            name = f"{stem}{digest[: len(match['hash'])]}.{match['ext']}"
+            if name != path.name:
+                path.rename(path.with_name(name))
+                source_map = path.with_name(path.name + SOURCE_MAP_SUFFIX)
+                if source_map.is_file():
+                    source_map.rename(path.with_name(name + SOURCE_MAP_SUFFIX))
+                # The map's name contains the chunk's, so this also updates its references.
+                replacements[path.name] = name
+                hashes[f'"{match["hash"]}"'] = f'"{digest[: len(match["hash"])]}"'
+        if not replacements:
+            return renamed
+        renamed += len(replacements)
+        _replace_everywhere(export_dir, replacements)
+        # The runtime's chunk id -> hash maps, which never hold the full names.
+        _replace_everywhere(static, hashes, {".js"})
+    raise RuntimeError("Chunk names did not settle; chunks reference each other.")
+
+
+def source_date():
+    """Return the reproducible build time: SOURCE_DATE_EPOCH or the last input commit."""
+    epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    if epoch is None:
+        try:
+            epoch = subprocess.run(
+                ["git", "log", "-1", "--format=%ct", "--", *INPUTS],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            epoch = ""
+    return datetime.fromtimestamp(int(epoch or 0), tz=timezone.utc)
+
+
+def normalize_sitemaps(export_dir, when):
+    """Pin sitemap timestamps and sort their entries."""
+    lastmod = f"<lastmod>{when.strftime('%Y-%m-%dT%H:%M:%S.000Z')}</lastmod>"
+    for path in sorted(Path(export_dir).glob("sitemap*.xml")):
+        xml = LASTMOD_RE.sub(lastmod, path.read_text())
+        entries = URL_ENTRY_RE.findall(xml)
+        if entries:
+            start = xml.index(entries[0])
+            end = xml.rindex(entries[-1]) + len(entries[-1])
+            xml = xml[:start] + "\n".join(sorted(entries)) + xml[end:]
+        path.write_text(xml)
+
+
+def normalize(export_dir, digest=None):
+    """Run every normalization over an export and return its build ID."""
+    digest = digest or input_digest()
+    build_id = stabilize_build_id(export_dir, digest)
+    stabilize_chunk_names(export_dir)
+    normalize_sitemaps(export_dir, source_date())
+    return build_id
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(
+        prog="python -m Guia_landing.deterministic",
+        description=__doc__.splitlines()[0],
+    )
+    parser.add_argument("export_dir", nargs="?", default=".web/_static")
+    args = parser.parse_args(argv)
+    if not Path(args.export_dir).is_dir():
+        parser.error(f"{args.export_dir} is not a directory")
+    print(f"Build ID {normalize(args.export_dir)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
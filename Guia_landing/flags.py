@@ -0,0 +1,18 @@
+"""Export-time switches read from the environment."""
+
+import os
+
+
+def enabled(name):
+    """Return whether the GUIA_<name> switch is turned on."""
+    return os.environ.get(f"GUIA_{name.upper()}", "").lower() in (
+        "1",
+        "true",
+        "yes",
+        "on",
+    )
+
+
+def value(name, default=None):
+    """Return the raw GUIA_<name> setting, or default when it is unset or empty."""
+    return os.environ.get(f"GUIA_{name.upper()}") or default
@@ -0,0 +1,168 @@
+"""Remove wrapper elements that do not change how the page looks.
+
+Three merges are made, each only when it cannot change layout or paint:
+
+* a box without props, as the page root or among block siblings of a
+  block parent, is replaced by its children;
+* a box whose only child is another box hands its id, vertical padding,
+  deferred rendering (with its below-the-fold marker) and a background
+  equal to the inherited one down to that child and disappears;
+* a plain span inside a text element, holding only text, is replaced by
+  that text.
+"""
+
+import reflex as rx
+from reflex.components.base.bare import Bare
+from reflex.components.base.fragment import Fragment
+from reflex.components.el.elements.metadata import Link, StyleEl
+from reflex.components.radix.themes.layout.box import Box
+from reflex.components.radix.themes.layout.flex import Flex
+from reflex.components.radix.themes.layout.grid import Grid
+from reflex.components.radix.themes.layout.list import BaseList
+from reflex.components.radix.themes.typography.heading import Heading
+from reflex.components.radix.themes.typography.text import Span, Text
+from reflex.style import Style
+from reflex.utils import console
+
+# Props a wrapper box may hand down to its only child box.
+FOLDABLE = {"paddingTop", "paddingBottom", "contentVisibility", "containIntrinsicSize"}
+
+# Child props that would interact with the folded vertical padding.
+BLOCKING = {"marginTop", "marginBottom", "display", "position"}
+
+# Components rendered as blocks, or not rendered at all, matched by exact class:
+# the <link> element is metadata, but the Radix Link (an inline <a>) is not.
+BLOCK_TYPES = (Box, Flex, Grid, Heading, Text, BaseList, Fragment, Link, StyleEl)
+
+LAYOUT_DISPLAYS = {"flex", "grid", "inline-flex", "inline-grid"}
+
+
+def _literal(value):
+    """Return the Python value of a literal style Var."""
+    return getattr(value, "_var_value", value)
+
+
+def _has_props(component):
+    """Return whether a component carries anything besides children and style."""
+    return bool(
+        component.id is not None
+        or component.class_name
+        or component.custom_attrs
+        or component.event_triggers
+        or component.special_props
+        or component.key is not None
+    )
+
+
+def _is_bare_box(component):
+    """Return whether a component is a box without style or props."""
+    return type(component) is Box and not component.style and not _has_props(component)
+
+
+def _lays_out_children(component):
+    """Return whether a component is a flex or grid container."""
+    if type(component) in (Flex, Grid):
+        return True
+    display = component.style.get("display")
+    return isinstance(_literal(display), str) and _literal(display) in LAYOUT_DISPLAYS
+
+
+def _is_block(child):
+    """Return whether a child renders as a block (or renders nothing)."""
+    return type(child) in BLOCK_TYPES
+
+
+def _fold_into_child(wrapper, background):
+    """Merge a wrapper box into its only child box when that is invisible; returns the child or None."""
+    if type(wrapper) is not Box or len(wrapper.children) != 1:
+        return None
+    child = wrapper.children[0]
+    if type(child) is not Box:
+        return None
+    if wrapper.class_name or wrapper.event_triggers:
+        return None
+    if set(wrapper.custom_attrs) & set(child.custom_attrs):
+        return None
+    if wrapper.special_props or wrapper.key is not None:
+        return None
+    if wrapper.id is not None and child.id is not None:
+        return None
+    style = dict(wrapper.style)
+    if "backgroundColor" in style:
+        if _literal(style.pop("backgroundColor")) != background:
+            return None
+    if not set(style) <= FOLDABLE or set(style) & set(child.style):
+        return None
+    if set(child.style) & BLOCKING:
+        return None
+    child.style = Style({**child.style, **style})
+    child.custom_attrs = {**child.custom_attrs, **wrapper.custom_attrs}
+    if wrapper.id is not None:
+        child.id = wrapper.id
+    return child
+
+
+def _unwrap_span(child, parent):
+    """Return the text of a plain span inside a text element, or None."""
+    if type(child) is not Span or not isinstance(parent, Text):
+        return None
+    if child.style or _has_props(child):
+        return None
+    if len(child.children) == 1 and isinstance(child.children[0], Bare):
+        return child.children[0]
+    return None
+
+
+def _flatten(component, background, counter):
+    """Flatten the children of a component in place."""
+    value = _literal(component.style.get("backgroundColor"))
+    if isinstance(value, str):
+        background = value
+    block_parent = not _lays_out_children(component) and not isinstance(component, Text)
+    children = []
+    for child in component.children:
+        if not isinstance(child, rx.Component) or isinstance(child, Bare):
+            children.append(child)
+            continue
+        while block_parent:
+            folded = _fold_into_child(child, background)
+            if folded is None:
+                break
+            counter[0] += 1
+            child = folded
+        text = _unwrap_span(child, component)
+        if text is not None:
+            counter[0] += 1
+            children.append(text)
+            continue
+        _flatten(child, background, counter)
+        if (
+            block_parent
+            and _is_bare_box(child)
+            and child.children
+            and all(_is_block(grandchild) for grandchild in child.children)
+        ):
+            counter[0] += 1
+            children.extend(child.children)
+            continue
+        children.append(child)
+    component.children = children
+
+
+def flatten(component):
+    """Flatten a page tree; returns (root, number of nodes removed)."""
+    counter = [0]
+    while _is_bare_box(component) and len(component.children) == 1 and isinstance(
+        component.children[0], rx.Component
+    ):
+        component = component.children[0]
+        counter[0] += 1
+    _flatten(component, None, counter)
+    return component, counter[0]
+
+
+def flatten_dom(component):
+    """Flatten a page tree and report how many nodes were removed."""
+    component, removed = flatten(component)
+    console.info(f"Flattened the page: {removed} wrapper nodes removed.")
+    return component
@@ -0,0 +1,221 @@
+"""Cache-Control and preload headers of the export, for any static host.
+
+    python -m Guia_landing.headers public [--out-dir deploy]
+
+Writes the same rules three ways: public/_headers (Netlify, Cloudflare Pages),
+<out-dir>/headers.nginx.conf and <out-dir>/headers.json. The out-dir is
+committed with the build, like public/, but not served. The nginx form maps
+each URI to its header values in the http block, so that the server block
+sends them with one add_header per header: an add_header inside a location
+would drop every add_header the server block sets (HSTS, CSP...). The caching policy is the one serve.py applies:
+content-hashed files under _next/static/ and vendor/ are immutable for a
+year; pages, sitemaps, robots.txt, sw.js and precache-manifest.json are
+revalidated on every request; other files are cached for an hour.
+
+Each page also gets a Link header that preloads its render-blocking
+stylesheets, its hero image and its first-load chunks, ready for hosts that
+send 103 Early Hints. Run it last, once the pages and sw.js are final.
+"""
+
+import argparse
+import json
+import sys
+from html.parser import HTMLParser
+from pathlib import Path
+
+from Guia_landing.serve import CACHE_CONTROL, IMMUTABLE_PREFIXES, cache_control, content_type
+
+HEADERS_FILE = "_headers"
+
+NGINX_FILE = "headers.nginx.conf"
+
+JSON_FILE = "headers.json"
+
+DEFAULT_OUT_DIR = Path("deploy")
+
+# nginx variable holding each header's value, set by the maps of headers.nginx.conf.
+NGINX_VARIABLES = {"Cache-Control": "$guia_cache_control", "Link": "$guia_link"}
+
+# Precompressed siblings are served under the URL of their original file.
+COMPRESSED_SUFFIXES = {".br", ".gz"}
+
+# Preload order: what blocks rendering first, then the hero image, then scripts.
+PRELOAD_ORDER = {"style": 0, "font": 1, "image": 2, "script": 3}
+
+# Link parameters copied from a <link rel="preload">, with their HTML names.
+PRELOAD_PARAMS = (
+    ("type", "type"),
+    ("media", "media"),
+    ("crossorigin", "crossorigin"),
+    ("imagesrcset", "imagesrcset"),
+    ("imagesizes", "imagesizes"),
+    ("fetchpriority", "fetchpriority"),
+)
+
+
+class PreloadScan(HTMLParser):
+    """Collects the same-origin resources a page needs for its first render."""
+
+    def __init__(self):
+        super().__init__()
+        self.preloads = {}
+        self._in_noscript = False
+
+    def _add(self, href, kind, params=()):
+        """Record a resource once, keeping the first hint given for it."""
+        if href and href.startswith("/") and not href.startswith("//"):
+            self.preloads.setdefault(href, (kind, tuple(params)))
+
+    def handle_starttag(self, tag, attrs):
+        attrs = {name.lower(): value for name, value in attrs}
+        if tag == "noscript":
+            self._in_noscript = True
+        elif self._in_noscript:
+            return
+        elif tag == "link":
+            rel = (attrs.get("rel") or "").split()
+            if "preload" in rel and attrs.get("as"):
+                params = [(name, attrs[attr]) for name, attr in PRELOAD_PARAMS if attr in attrs]
+                href = attrs.get("href") or (attrs.get("imagesrcset") or "").split(" ")[0]
+                self._add(href, attrs["as"], params)
+            elif "stylesheet" in rel and "onload" not in attrs:
+                # Stylesheets deferred by postbuild.py load after the first render.
+                if attrs.get("media", "all") in ("all", "screen"):
+                    self._add(attrs.get("href"), "style")
+        elif tag == "script" and attrs.get("src") and "nomodule" not in attrs:
+            self._add(attrs["src"], "script")
+        elif tag == "img" and attrs.get("fetchpriority") == "high":
+            self._add(attrs.get("src"), "image", [("fetchpriority", "high")])
+
+    def handle_endtag(self, tag):
+        if tag == "noscript":
+            self._in_noscript = False
+
+
+def preload_links(html):
+    """Return the Link header value that preloads a page's critical resources."""
+    scan = PreloadScan()
+    scan.feed(html)
+    entries = sorted(
+        scan.preloads.items(), key=lambda item: PRELOAD_ORDER.get(item[1][0], len(PRELOAD_ORDER))
+    )
+    links = []
+    for href, (kind, params) in entries:
+        link = f"<{href}>; rel=preload; as={kind}"
+        for name, value in params:
+            link += f"; {name}" if value is None else f'; {name}="{value}"'
+        links.append(link)
+    return ", ".join(links)
+
+
+def url_of(public_dir, path):
+    """Return the URL path a file of the export is served at."""
+    return "/" + path.relative_to(public_dir).as_posix()
+
+
+def build_rules(public_dir):
+    """Return [(path pattern, {header: value})] for an export, most specific last."""
+    public_dir = Path(public_dir)
+    rules = [
+        (prefix + "*", {"Cache-Control": CACHE_CONTROL["immutable"]}) for prefix in IMMUTABLE_PREFIXES
+    ]
+    for path in sorted(public_dir.rglob("*")):
+        url = url_of(public_dir, path)
+        if (
+            not path.is_file()
+            or path.suffix in COMPRESSED_SUFFIXES
+            or path.name == HEADERS_FILE
+            or url.startswith(IMMUTABLE_PREFIXES)
+        ):
+            continue
+        headers = {"Cache-Control": cache_control(url, content_type(path))}
+        if path.suffix == ".html":
+            links = preload_links(path.read_text())
+            if links:
+                headers["Link"] = links
+        if path.name == "index.html":
+            rules.append((url.removesuffix("index.html"), headers))
+        rules.append((url, headers))
+    return rules
+
+
+def format_headers_file(rules):
+    """Return the rules in the _headers format of Netlify and Cloudflare Pages."""
+    blocks = []
+    for pattern, headers in rules:
+        lines = [pattern] + [f"  {name}: {value}" for name, value in headers.items()]
+        blocks.append("\n".join(lines))
+    return "\n\n".join(blocks) + "\n"
+
+
+def _nginx_string(value):
+    """Quote a value for an nginx configuration file."""
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _nginx_pattern(pattern):
+    """Return the map key matching a rule's path pattern."""
+    if pattern.endswith("*"):
+        return _nginx_string("~^" + pattern.removesuffix("*").replace(".", "\\."))
+    return _nginx_string(pattern)
+
+
+def format_nginx(rules):
+    """Return the rules as nginx maps from $uri to each header's value."""
+    lines = [
+        "# Written by python -m Guia_landing.headers; include it in the http block and add",
+        "# these to the server block, next to its other add_header directives:",
+    ]
+    lines += [f"#     add_header {name} {variable} always;" for name, variable in NGINX_VARIABLES.items()]
+    lines += [
+        "# Do not move them into a location: a location with its own add_header drops every",
+        "# add_header of the server block. Empty values send no header.",
+    ]
+    for name, variable in NGINX_VARIABLES.items():
+        lines += ["", f"map $uri {variable} {{", '    default "";']
+        lines += [
+            f"    {_nginx_pattern(pattern)} {_nginx_string(headers[name])};"
+            for pattern, headers in rules
+            if name in headers
+        ]
+        lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def format_json(rules):
+    """Return the rules as JSON, for hosts configured some other way."""
+    entries = [{"path": pattern, "headers": headers} for pattern, headers in rules]
+    return json.dumps({"rules": entries}, indent=2) + "\n"
+
+
+def generate(public_dir, out_dir=DEFAULT_OUT_DIR):
+    """Write the three forms of the headers of an export; returns the rules."""
+    rules = build_rules(public_dir)
+    (Path(public_dir) / HEADERS_FILE).write_text(format_headers_file(rules))
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    (out_dir / NGINX_FILE).write_text(format_nginx(rules))
+    (out_dir / JSON_FILE).write_text(format_json(rules))
+    return rules
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(
+        prog="python -m Guia_landing.headers", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument("public_dir", nargs="?", default="public")
+    parser.add_argument(
+        "--out-dir", default=DEFAULT_OUT_DIR, help="where to write the nginx and JSON forms"
+    )
+    args = parser.parse_args(argv)
+    if not Path(args.public_dir).is_dir():
+        parser.error(f"{args.public_dir} is not a directory")
+    rules = generate(args.public_dir, args.out_dir)
+    preloads = sum(1 for _, headers in rules if "Link" in headers)
+    print(f"{HEADERS_FILE}: {len(rules)} rules, {preloads} with preload links")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
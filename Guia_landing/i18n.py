@@ -0,0 +1,69 @@
+"""Message catalogs for the user-facing strings of the page.
+
+The Spanish text in the code and in the site files is the message id. Every
+other locale has a flat JSON catalog in locales/<lang>.json mapping those ids
+to translations; catalogs are loaded once into dicts, and missing entries
+fall back to the Spanish text.
+"""
+
+import contextlib
+import contextvars
+import functools
+import json
+from pathlib import Path
+
+LOCALES_DIR = Path("locales")
+
+SOURCE_LOCALE = "es"
+
+_locale = contextvars.ContextVar("locale", default=SOURCE_LOCALE)
+
+
+class CatalogError(ValueError):
+    """Raised when a locale has no catalog or its catalog is malformed."""
+
+
+@functools.lru_cache(maxsize=None)
+def load_catalog(locale, locales_dir=LOCALES_DIR):
+    """Return the lookup table of a locale; the source locale has an empty one."""
+    if locale == SOURCE_LOCALE:
+        return {}
+    path = Path(locales_dir) / f"{locale}.json"
+    try:
+        catalog = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as error:
+        raise CatalogError(f"{path}: {error}") from error
+    if not isinstance(catalog, dict) or not all(
+        isinstance(key, str) and isinstance(value, str)
+        for key, value in catalog.items()
+    ):
+        raise CatalogError(f"{path}: expected an object of strings")
+    return catalog
+
+
+def available_locales(locales_dir=LOCALES_DIR):
+    """Return the source locale followed by every locale with a catalog."""
+    return [SOURCE_LOCALE] + sorted(
+        path.stem
+        for path in Path(locales_dir).glob("*.json")
+        if path.stem != SOURCE_LOCALE
+    )
+
+
+def gettext(message):
+    """Translate a message into the active locale."""
+    return load_catalog(_locale.get()).get(message, message)
+
+
+_ = gettext
+
+
+@contextlib.contextmanager
+def use_locale(locale):
+    """Make a locale active while building a page."""
+    load_catalog(locale)
+    token = _locale.set(locale)
+    try:
+        yield
+    finally:
+        _locale.reset(token)
@@ -0,0 +1,112 @@
+"""Export-time compilation of rx.icon usages into one inline SVG sprite."""
+
+import re
+from pathlib import Path
+
+import reflex as rx
+from reflex.components.lucide.icon import Icon
+from reflex.vars.base import Var
+
+# Checked-in lucide-static icons, one <tag>.svg per icon (same version as lucide-react).
+VENDORED_ICONS = Path("vendor") / "lucide"
+
+SYMBOL_PREFIX = "icon-"
+
+# Presentation attributes shared by every Lucide icon, set once per symbol.
+SYMBOL_ATTRIBUTES = (
+    'viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" '
+    'stroke-linecap="round" stroke-linejoin="round"'
+)
+
+
+class SvgUse(rx.Component):
+    """The SVG <use> element, pointing at a symbol of the sprite."""
+
+    tag = "use"
+
+    href: Var[str]
+
+
+def icon_name(icon):
+    """Return the lucide-static file name of an rx.icon component."""
+    name = icon.tag.removesuffix("Icon")
+    return re.sub(r"(?<!^)(?=[A-Z])", "-", name).lower()
+
+
+def load_symbol(name, icons_dir=VENDORED_ICONS):
+    """Read a vendored icon and return it as a <symbol> element."""
+    path = Path(icons_dir) / f"{name}.svg"
+    if not path.exists():
+        raise FileNotFoundError(f"The icon {name} is not vendored in {icons_dir}.")
+    svg = re.sub(r"<!--.*?-->", "", path.read_text(), flags=re.S)
+    body = svg[svg.index(">", svg.index("<svg")) + 1 : svg.rindex("</svg>")]
+    body = re.sub(r">\s+<", "><", " ".join(body.split()))
+    return f'<symbol id="{SYMBOL_PREFIX}{name}" {SYMBOL_ATTRIBUTES}>{body}</symbol>'
+
+
+def create_sprite(names, icons_dir=VENDORED_ICONS):
+    """Create the hidden inline sprite holding one symbol per icon name."""
+    symbols = "".join(load_symbol(name, icons_dir) for name in sorted(names))
+    return rx.html(
+        '<svg xmlns="http://www.w3.org/2000/svg" width="0" height="0" '
+        f'style="position:absolute" aria-hidden="true">{symbols}</svg>'
+    )
+
+
+def icon_alt(icon):
+    """Return the alt text of an rx.icon, which Reflex passes on as a style prop."""
+    alt = icon.style.get("alt")
+    alt = getattr(alt, "_var_value", alt)
+    return alt if isinstance(alt, str) and alt.strip() else None
+
+
+def create_icon_instance(icon, name):
+    """Create the <svg><use/></svg> reference that replaces an rx.icon.
+
+    An icon with alt text is labelled as an image; one without is decorative
+    and hidden from assistive technology.
+    """
+    alt = icon_alt(icon)
+    accessibility = {"role": "img", "aria-label": alt} if alt else {"aria-hidden": "true"}
+    instance = rx.el.svg(
+        SvgUse.create(href=f"#{SYMBOL_PREFIX}{name}"),
+        width="24",
+        height="24",
+        class_name=icon.class_name,
+        custom_attrs=accessibility,
+    )
+    instance.style = rx.Style({key: value for key, value in icon.style.items() if key != "alt"})
+    return instance
+
+
+def _replace_icons(component, names):
+    """Replace every rx.icon below a component, collecting the icon names."""
+    for index, child in enumerate(component.children):
+        if isinstance(child, Icon):
+            name = icon_name(child)
+            names.add(name)
+            component.children[index] = create_icon_instance(child, name)
+        elif isinstance(child, rx.Component):
+            _replace_icons(child, names)
+
+
+def _remove_icon_font(component):
+    """Drop the <style> that loads the Lucide icon font."""
+    component.children = [
+        child
+        for child in component.children
+        if not (child.tag == "style" and "LucideIcons" in str(child.render()))
+    ]
+    for child in component.children:
+        if isinstance(child, rx.Component):
+            _remove_icon_font(child)
+
+
+def compile_icons(component, icons_dir=VENDORED_ICONS):
+    """Swap lucide-react icons and the icon font for a single inline SVG sprite."""
+    names = set()
+    _replace_icons(component, names)
+    _remove_icon_font(component)
+    if names:
+        component.children.insert(0, create_sprite(names, icons_dir))
+    return component
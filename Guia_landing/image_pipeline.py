@@ -0,0 +1,220 @@
+"""Export-time responsive variants for the hero and CTA background image."""
+
+import base64
+import hashlib
+import io
+import json
+from pathlib import Path
+
+import reflex as rx
+from reflex.style import Style
+from reflex.utils import console
+
+# Local copy of the photo both the hero and the CTA section use as background.
+SOURCE = Path("assets") / "hero.jpg"
+
+# Generated variants are written here, below the assets directory.
+OUTPUT_DIR = "img"
+
+MANIFEST = "manifest.json"
+
+# Variant width for each breakpoint the background switches at.
+BREAKPOINT_WIDTHS = {"0px": 640, "768px": 1280, "1280px": 1920}
+
+# Encodings in order of preference, with their image-set() type and encoder options.
+FORMATS = (
+    ("avif", "image/avif", {"quality": 50}),
+    ("webp", "image/webp", {"quality": 75, "method": 6}),
+    ("jpg", "image/jpeg", {"quality": 80, "optimize": True, "progressive": True}),
+)
+
+PIL_FORMATS = {"avif": "AVIF", "webp": "WEBP", "jpg": "JPEG"}
+
+LQIP_WIDTH = 16
+
+# The placeholder data URI is defined once, as this custom property on :root.
+PLACEHOLDER_PROPERTY = "--hero-lqip"
+
+IMAGE_SET_SUPPORTS = "@supports (background-image: image-set(url('a.jpg') type('image/jpeg')))"
+
+
+class ResponsiveImage:
+    """The generated variants and placeholder of one source image."""
+
+    def __init__(self, variants, placeholder):
+        # {width: [(format, mime type, url), ...]} in FORMATS order.
+        self.variants = variants
+        self.placeholder = placeholder
+
+    def image_set(self, width):
+        """Return the image-set() of every format generated at a width."""
+        candidates = ", ".join(
+            f"url('{url}') type('{mime}')" for _, mime, url in self.variants[width]
+        )
+        return f"image-set({candidates})"
+
+    def fallback(self, width):
+        """Return the URL of the last, most widely supported format at a width."""
+        return self.variants[width][-1][2]
+
+    def _breakpoints(self, layer):
+        """Return one background_image value per breakpoint, placeholder underneath."""
+        return rx.breakpoints(
+            {
+                breakpoint: f"{layer(width)}, var({PLACEHOLDER_PROPERTY})"
+                for breakpoint, width in BREAKPOINT_WIDTHS.items()
+                if width in self.variants
+            }
+        )
+
+    def background(self):
+        """Return the responsive background style of a section.
+
+        Browsers without image-set() type() support would drop the whole
+        declaration, so they get the plain fallback format and only the
+        others read the image-set() inside @supports.
+        """
+        return {
+            "backgroundImage": self._breakpoints(lambda width: f"url('{self.fallback(width)}')"),
+            IMAGE_SET_SUPPORTS: {"backgroundImage": self._breakpoints(self.image_set)},
+        }
+
+    def placeholder_style(self):
+        """Create the <style> defining the placeholder once for every section."""
+        return rx.el.style(f":root{{{PLACEHOLDER_PROPERTY}:url('{self.placeholder}')}}")
+
+    def preload_links(self):
+        """Create one preload hint per breakpoint for the preferred format.
+
+        Each hint carries the format's type, so browsers that cannot decode
+        it skip the preload instead of fetching the image twice.
+        """
+        breakpoints = [bp for bp, w in BREAKPOINT_WIDTHS.items() if w in self.variants]
+        links = []
+        for index, breakpoint in enumerate(breakpoints):
+            _, mime, url = self.variants[BREAKPOINT_WIDTHS[breakpoint]][0]
+            media = [f"(min-width: {breakpoint})"]
+            if index + 1 < len(breakpoints):
+                media.append(f"(max-width: {_below(breakpoints[index + 1])})")
+            links.append(
+                rx.el.link(
+                    rel="preload",
+                    href=url,
+                    type=mime,
+                    media=" and ".join(media),
+                    custom_attrs={"as": "image", "fetchPriority": "high"},
+                )
+            )
+        return links
+
+
+def _below(breakpoint):
+    """Return the width just below a pixel breakpoint."""
+    return f"{int(breakpoint.removesuffix('px')) - 0.02:g}px"
+
+
+def _encode(image, extension, options):
+    """Encode an image into the given format and return the bytes."""
+    buffer = io.BytesIO()
+    image.save(buffer, PIL_FORMATS[extension], **options)
+    return buffer.getvalue()
+
+
+def _placeholder(image):
+    """Return a tiny blurred JPEG of the image as a data URI."""
+    from PIL import ImageFilter
+
+    height = max(1, round(image.height * LQIP_WIDTH / image.width))
+    tiny = image.resize((LQIP_WIDTH, height)).filter(ImageFilter.GaussianBlur(1))
+    data = _encode(tiny, "jpg", {"quality": 40})
+    return "data:image/jpeg;base64," + base64.b64encode(data).decode()
+
+
+def _generate(data, stem, output_dir):
+    """Encode every width and format of a source image into the output directory."""
+    from PIL import Image, features
+
+    image = Image.open(io.BytesIO(data)).convert("RGB")
+    variants = {}
+    for width in sorted(set(BREAKPOINT_WIDTHS.values())):
+        if width > image.width and variants:
+            continue
+        target = min(width, image.width)
+        resized = image.resize(
+            (target, round(image.height * target / image.width)), Image.LANCZOS
+        )
+        variants[width] = []
+        for extension, mime, options in FORMATS:
+            if extension == "avif" and not features.check("avif"):
+                continue
+            data = _encode(resized, extension, options)
+            digest = hashlib.sha256(data).hexdigest()[:10]
+            name = f"{stem}-{target}-{digest}.{extension}"
+            path = output_dir / name
+            if not path.exists():
+                path.write_bytes(data)
+            variants[width].append((extension, mime, f"/{OUTPUT_DIR}/{name}"))
+    return {"variants": variants, "placeholder": _placeholder(image)}
+
+
+def _read_source(source, url):
+    """Return the bytes of the local source, or of the asset cache's copy of the URL."""
+    if source.exists():
+        return source.read_bytes()
+    if url is None:
+        return None
+    from Guia_landing.vendor_assets import AssetCache
+
+    return AssetCache().get(url)
+
+
+def build_responsive_image(source=SOURCE, assets_dir="assets", url=None):
+    """Generate (or reuse) the variants of a source image, or None if it is missing.
+
+    Without a local source, the copy of url in the vendored asset cache is
+    used, and a missing copy fails the build.
+    """
+    source = Path(source)
+    data = _read_source(source, url)
+    if data is None and url is not None:
+        from Guia_landing.vendor_assets import MISSING_HINT, VendorError
+
+        raise VendorError(f"Neither {source} nor a cached copy of {url} found. {MISSING_HINT}")
+    if data is None:
+        console.warn(f"{source} not found, keeping the original background image.")
+        return None
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        console.warn("Pillow is not installed, keeping the original background image.")
+        return None
+    output_dir = Path(assets_dir) / OUTPUT_DIR
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = output_dir / MANIFEST
+    manifest = json.loads(manifest_path.read_text()) if manifest_path.exists() else {}
+    key = f"{source.name}:{hashlib.sha256(data).hexdigest()}"
+    entry = manifest.get(key)
+    if entry is None or not all(
+        (Path(assets_dir) / url.lstrip("/")).exists()
+        for formats in entry["variants"].values()
+        for _, _, url in formats
+    ):
+        entry = _generate(data, source.stem, output_dir)
+        manifest = {key: entry}
+        manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    variants = {
+        int(width): [tuple(item) for item in formats]
+        for width, formats in entry["variants"].items()
+    }
+    return ResponsiveImage(variants, entry["placeholder"])
+
+
+def apply_background(component, original, image):
+    """Point every background_image equal to the original URL at the responsive image."""
+    value = component.style.get("backgroundImage")
+    if value is not None and original in str(value):
+        component.style = Style({**component.style, **image.background()})
+    for child in component.children:
+        if isinstance(child, rx.Component):
+            apply_background(child, original, image)
+    return component
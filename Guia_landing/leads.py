@@ -0,0 +1,220 @@
+"""Lead capture for the #contact form, served by Guia_landing.serve.
+
+Submissions are validated and rate limited per client IP with a token
+bucket, then queued in a bounded in-memory buffer. A background task writes
+the buffer to SQLite in one transaction per batch, when it reaches
+BATCH_SIZE or every FLUSH_INTERVAL seconds, on a single writer thread so the
+event loop never waits for the disk. A full buffer answers 503 instead of
+growing.
+"""
+
+import asyncio
+import json
+import re
+import sqlite3
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import parse_qsl
+
+DEFAULT_DATABASE = Path("leads.sqlite3")
+
+MAX_BODY_BYTES = 16 * 1024
+
+BUFFER_SIZE = 10_000
+
+BATCH_SIZE = 200
+
+FLUSH_INTERVAL = 2.0
+
+# Token bucket per client IP: a burst of BUCKET_CAPACITY, then one per REFILL_SECONDS.
+BUCKET_CAPACITY = 5
+REFILL_SECONDS = 60.0
+MAX_BUCKETS = 100_000
+
+# Field name -> maximum length; every field is required.
+FIELDS = {"name": 100, "email": 254, "message": 2000}
+
+# Hidden field that people never fill in and form-filling bots do.
+HONEYPOT = "website"
+
+EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+CONTROL_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS leads (
+    id INTEGER PRIMARY KEY,
+    received_at TEXT NOT NULL,
+    ip TEXT NOT NULL,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    message TEXT NOT NULL
+)
+"""
+
+
+class ValidationError(ValueError):
+    """Raised for a submission with missing or malformed fields."""
+
+
+def parse_submission(body, content_type):
+    """Decode a urlencoded or JSON request body into a dict of strings."""
+    text = body.decode("utf-8", errors="replace")
+    if content_type.split(";")[0].strip() == "application/json":
+        try:
+            data = json.loads(text)
+        except ValueError:
+            raise ValidationError("body is not valid JSON") from None
+        if not isinstance(data, dict):
+            raise ValidationError("body must be a JSON object")
+        return {key: str(value) for key, value in data.items()}
+    return dict(parse_qsl(text, keep_blank_values=True))
+
+
+def validate(data):
+    """Return the cleaned fields of a submission, raising ValidationError."""
+    cleaned = {}
+    for field, limit in FIELDS.items():
+        value = CONTROL_RE.sub("", data.get(field, "")).strip()
+        if not value:
+            raise ValidationError(f"{field} is required")
+        if len(value) > limit:
+            raise ValidationError(f"{field} is longer than {limit} characters")
+        cleaned[field] = value
+    if not EMAIL_RE.match(cleaned["email"]):
+        raise ValidationError("email is not a valid address")
+    return cleaned
+
+
+class RateLimiter:
+    """Token buckets per client, keeping at most max_buckets of them."""
+
+    def __init__(self, capacity=BUCKET_CAPACITY, refill_seconds=REFILL_SECONDS, max_buckets=MAX_BUCKETS):
+        self.capacity = capacity
+        self.refill_seconds = refill_seconds
+        self.max_buckets = max_buckets
+        self.buckets = OrderedDict()
+
+    def allow(self, client, now=None):
+        """Take a token for a client; returns whether the request may proceed."""
+        now = time.monotonic() if now is None else now
+        tokens, updated = self.buckets.pop(client, (self.capacity, now))
+        tokens = min(self.capacity, tokens + (now - updated) / self.refill_seconds)
+        allowed = tokens >= 1
+        self.buckets[client] = (tokens - 1 if allowed else tokens, now)
+        if len(self.buckets) > self.max_buckets:
+            # The oldest bucket has been idle the longest and is nearly full again.
+            self.buckets.popitem(last=False)
+        return allowed
+
+
+class LeadStore:
+    """SQLite table of leads, written only from its own thread."""
+
+    def __init__(self, path=DEFAULT_DATABASE):
+        self.path = Path(path)
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="leads")
+        self.connection = None
+
+    def _connect(self):
+        """Open the database on the writer thread."""
+        if self.connection is None:
+            self.connection = sqlite3.connect(self.path)
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+            self.connection.execute(SCHEMA)
+        return self.connection
+
+    def _write(self, batch):
+        """Insert a batch in a single transaction."""
+        connection = self._connect()
+        with connection:
+            connection.executemany(
+                "INSERT INTO leads (received_at, ip, name, email, message) "
+                "VALUES (:received_at, :ip, :name, :email, :message)",
+                batch,
+            )
+        return len(batch)
+
+    async def write(self, batch):
+        """Insert a batch without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self._write, batch)
+
+    def close(self):
+        """Close the database and stop the writer thread."""
+        if self.connection is not None:
+            self.executor.submit(self.connection.close).result()
+        self.executor.shutdown()
+
+
+class LeadCollector:
+    """Validates, rate limits and buffers submissions, flushing them in batches."""
+
+    def __init__(self, store, limiter=None, buffer_size=BUFFER_SIZE, batch_size=BATCH_SIZE, flush_interval=FLUSH_INTERVAL):
+        self.store = store
+        self.limiter = limiter or RateLimiter()
+        self.buffer_size = buffer_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.buffer = []
+        self.wake = asyncio.Event()
+        self.task = None
+
+    def submit(self, client, body, content_type):
+        """Queue one submission; returns an HTTP status code and a message."""
+        if not self.limiter.allow(client):
+            return 429, "too many submissions, try again later"
+        try:
+            data = parse_submission(body, content_type)
+            if data.get(HONEYPOT):
+                # Accept silently so bots do not learn about the trap.
+                return 201, "received"
+            lead = validate(data)
+        except ValidationError as error:
+            return 422, str(error)
+        if len(self.buffer) >= self.buffer_size:
+            return 503, "busy, try again later"
+        lead["ip"] = client
+        lead["received_at"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        self.buffer.append(lead)
+        if len(self.buffer) >= self.batch_size:
+            self.wake.set()
+        return 201, "received"
+
+    async def flush(self):
+        """Write everything buffered so far; returns the number of leads written."""
+        written = 0
+        while self.buffer:
+            batch = self.buffer[: self.batch_size]
+            del self.buffer[: self.batch_size]
+            try:
+                written += await self.store.write(batch)
+            except sqlite3.Error as error:
+                # Keep the batch for the next flush; the buffer bound still applies.
+                self.buffer[:0] = batch
+                print(f"Could not store {len(batch)} leads: {error}", file=sys.stderr, flush=True)
+                break
+        return written
+
+    async def run(self):
+        """Flush on the size threshold or the timer until cancelled."""
+        try:
+            while True:
+                try:
+                    await asyncio.wait_for(self.wake.wait(), self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self.wake.clear()
+                await self.flush()
+        finally:
+            await self.flush()
+
+    def start(self):
+        """Start the background flush task."""
+        self.task = asyncio.get_running_loop().create_task(self.run())
+        return self.task
@@ -0,0 +1,146 @@
+"""Export the page in every locale of locales/ into public/<lang>/.
+
+    python -m Guia_landing.locale_export --locales es en --base-url https://example.com
+
+All locales are routes of one Reflex app (see GUIA_LOCALES in
+Guia_landing.py): a single `reflex export` builds them with shared hashed
+assets, so a locale only adds its own HTML and page chunk. Each locale's
+pages then get their <html lang> and hreflang alternate links, and are
+optimized in a process pool.
+"""
+
+import argparse
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from reflex.config import get_config
+
+from Guia_landing.build_cache import sync_tree
+from Guia_landing.deterministic import normalize
+from Guia_landing.i18n import SOURCE_LOCALE, CatalogError, available_locales, load_catalog
+from Guia_landing.multisite import EXPORT_DIR, export, validate_sites
+from Guia_landing.postbuild import optimize_page
+
+HTML_LANG_RE = re.compile(r'<html lang="[^"]*"')
+
+HREFLANG_MARKER = 'rel="alternate" hreflang='
+
+
+def locale_prefix(locale):
+    """Return the path prefix of a locale; the source locale lives at the root."""
+    return "" if locale == SOURCE_LOCALE else f"{locale}/"
+
+
+def hreflang_links(base_url, locales, page):
+    """Return the alternate links of one page (a slug, or "" for the index)."""
+    suffix = f"{page}/" if page else ""
+    links = [
+        f'<link {HREFLANG_MARKER}"{locale}" '
+        f'href="{base_url}/{locale_prefix(locale)}{suffix}"/>'
+        for locale in locales
+    ]
+    links.append(
+        f'<link {HREFLANG_MARKER}"x-default" '
+        f'href="{base_url}/{locale_prefix(SOURCE_LOCALE)}{suffix}"/>'
+    )
+    return "".join(links)
+
+
+def localize_html(html, locale, links):
+    """Set the document language and add the hreflang links once."""
+    html = HTML_LANG_RE.sub(f'<html lang="{locale}"', html, count=1)
+    if HREFLANG_MARKER not in html:
+        html = html.replace("</head>", f"{links}</head>", 1)
+    return html
+
+
+def finish_locale(output_dir, locale, locales, pages, base_url):
+    """Localize and optimize every page of one locale; runs in a worker process."""
+    results = []
+    for page in pages:
+        path = Path(output_dir) / locale_prefix(locale) / page / "index.html"
+        if not path.exists():
+            continue
+        links = hreflang_links(base_url, locales, page)
+        path.write_text(localize_html(path.read_text(), locale, links))
+        results.append((path, *optimize_page(path, output_dir)))
+    return locale, results
+
+
+def run(locales, output_dir="public", base_url=None, sites_dir=None, jobs=None, skip_export=False):
+    """Export every locale and stream one line per finished locale; returns the failures."""
+    jobs = jobs or os.cpu_count() or 1
+    base_url = (base_url or get_config().deploy_url or "").rstrip("/")
+    try:
+        for locale in locales:
+            load_catalog(locale)
+    except CatalogError as error:
+        print(f"invalid: {error}")
+        return [str(error)]
+    pages = [""]
+    if sites_dir is not None:
+        slugs, errors = validate_sites(sites_dir)
+        for error in errors:
+            print(f"invalid: {error}")
+        if errors:
+            return errors
+        pages.extend(slugs)
+    if not skip_export:
+        switches = {"locales": ",".join(locales)}
+        if sites_dir is not None:
+            switches["sites"] = sites_dir
+        export(jobs, **switches)
+        normalize(EXPORT_DIR)
+    written, removed = sync_tree(EXPORT_DIR, output_dir)
+    print(f"{output_dir}: {written} files written, {removed} removed")
+    failures = []
+    with ProcessPoolExecutor(max_workers=min(jobs, len(locales))) as executor:
+        futures = {
+            executor.submit(finish_locale, output_dir, locale, locales, pages, base_url): locale
+            for locale in locales
+        }
+        for future in as_completed(futures):
+            try:
+                locale, results = future.result()
+            except Exception as error:
+                failures.append(f"{futures[future]}: {error}")
+                print(f"failed: {futures[future]}: {error}", flush=True)
+                continue
+            after = sum(result[2] for result in results)
+            print(f"{locale}: {len(results)} pages, {after} bytes of HTML", flush=True)
+    return failures
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(
+        prog="python -m Guia_landing.locale_export",
+        description=__doc__.splitlines()[0],
+    )
+    parser.add_argument(
+        "--locales", nargs="*", help="locales to export (default: every catalog)"
+    )
+    parser.add_argument("--output", default="public")
+    parser.add_argument("--base-url", help="absolute site URL for the hreflang links")
+    parser.add_argument("--sites", help="also export every site file of this directory")
+    parser.add_argument("--jobs", type=int, help="worker processes (default: all cores)")
+    parser.add_argument(
+        "--skip-export",
+        action="store_true",
+        help="reuse the last export in .web/_static",
+    )
+    args = parser.parse_args(argv)
+    locales = args.locales or available_locales()
+    if SOURCE_LOCALE not in locales:
+        locales = [SOURCE_LOCALE, *locales]
+    failures = run(
+        locales, args.output, args.base_url, args.sites, args.jobs, args.skip_export
+    )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
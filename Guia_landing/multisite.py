@@ -0,0 +1,117 @@
+"""Export many landing pages from the site files of a directory in one build.
+
+    python -m Guia_landing.multisite sites --output public --jobs 8
+
+Every site becomes a route of a single Reflex app (see GUIA_SITES in
+Guia_landing.py), so one `reflex export` compiles the pages in a forking
+process pool and Next.js emits the framework chunks once for all of them.
+The export is then synced into the output directory and each site's page is
+optimized in a process pool, printing a line per site as it finishes.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from Guia_landing.build_cache import sync_tree
+from Guia_landing.deterministic import normalize
+from Guia_landing.postbuild import optimize_page
+from Guia_landing.sites import SITES_DIR, SiteError, load_site, site_files, site_slug
+
+EXPORT_DIR = Path(".web") / "_static"
+
+
+def validate_sites(sites_dir):
+    """Load every site file, returning (slugs, errors)."""
+    slugs = []
+    errors = []
+    for path in site_files(sites_dir):
+        try:
+            load_site(path)
+            slugs.append(site_slug(path))
+        except SiteError as error:
+            errors.append(str(error))
+    return slugs, errors
+
+
+def export(jobs, **switches):
+    """Run one frontend export with extra GUIA_<NAME> switches set, e.g. sites=dir."""
+    env = {
+        **os.environ,
+        **{f"GUIA_{name.upper()}": str(value) for name, value in switches.items()},
+        "REFLEX_COMPILE_PROCESSES": str(jobs),
+    }
+    subprocess.run(
+        ["reflex", "export", "--frontend-only", "--no-zip", "--loglevel", "warning"],
+        check=True,
+        env=env,
+    )
+
+
+def site_page_path(output_dir, slug):
+    """Return the exported HTML file of a site."""
+    nested = Path(output_dir) / slug / "index.html"
+    return nested if nested.exists() else Path(output_dir) / f"{slug}.html"
+
+
+def finish_site(output_dir, slug):
+    """Optimize the exported page of one site; runs in a worker process."""
+    path = site_page_path(output_dir, slug)
+    before, after = optimize_page(path, output_dir)
+    return slug, path, before, after
+
+
+def run(sites_dir=SITES_DIR, output_dir="public", jobs=None, skip_export=False):
+    """Export every site and stream one line per finished site; returns the failures."""
+    jobs = jobs or os.cpu_count() or 1
+    slugs, errors = validate_sites(sites_dir)
+    for error in errors:
+        print(f"invalid: {error}")
+    if errors:
+        return errors
+    if not skip_export:
+        export(jobs, sites=sites_dir)
+        normalize(EXPORT_DIR)
+    written, removed = sync_tree(EXPORT_DIR, output_dir)
+    print(f"{output_dir}: {written} files written, {removed} removed")
+    failures = []
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            executor.submit(finish_site, output_dir, slug): slug for slug in slugs
+        }
+        for future in as_completed(futures):
+            try:
+                slug, path, before, after = future.result()
+            except Exception as error:
+                failures.append(f"{futures[future]}: {error}")
+                print(f"failed: {futures[future]}: {error}", flush=True)
+                continue
+            print(f"{slug}: {path} {before} -> {after} bytes", flush=True)
+    return failures
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(
+        prog="python -m Guia_landing.multisite", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument("sites_dir", nargs="?", default=str(SITES_DIR))
+    parser.add_argument("--output", default="public")
+    parser.add_argument("--jobs", type=int, help="worker processes (default: all cores)")
+    parser.add_argument(
+        "--skip-export",
+        action="store_true",
+        help="reuse the last export in .web/_static",
+    )
+    args = parser.parse_args(argv)
+    if not Path(args.sites_dir).is_dir():
+        parser.error(f"{args.sites_dir} is not a directory")
+    failures = run(args.sites_dir, args.output, args.jobs, args.skip_export)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
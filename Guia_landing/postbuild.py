@@ -0,0 +1,393 @@
+"""Post-export optimization of the static site written to public/.
+
+Run it after `reflex export` has been unzipped::
+
+    python -m Guia_landing.postbuild public
+
+It minifies the HTML head, inlines the critical CSS of each page and loads
+the full stylesheet without blocking, and writes maximum-level .br and .gz
+siblings for the text assets under _next/static. The critical CSS covers the
+page above the fold: elements marked data-below-fold (the deferred sections
+of codigo_pagina.py) and their subtrees are left out. Running it again over
+its own output changes nothing.
+"""
+
+import argparse
+import gzip
+import re
+import sys
+from html.parser import HTMLParser
+from pathlib import Path
+
+from Guia_landing.css import blocks, split_top_level, strip_comments
+
+DEFAULT_PAGES = ("index.html", "404.html")
+
+STATIC_DIR = Path("_next") / "static"
+
+TEXT_EXTENSIONS = {".css", ".html", ".js", ".json", ".map", ".svg", ".txt", ".xml"}
+
+# Classes the theme script puts on <html> before the first paint.
+RUNTIME_CLASSES = {"light", "dark", "light-theme", "dark-theme"}
+
+FUNCTIONAL_PSEUDO_RE = re.compile(
+    r":(is|where|not|has|matches|-webkit-any)\(((?:[^()]|\([^()]*\))*)\)"
+)
+
+ATTRIBUTE_SELECTOR_RE = re.compile(
+    r"(?<!\\)\[\s*([\w-]+)\s*(?:([~|^$*]?=)\s*(?:\"([^\"]*)\"|'([^']*)'|([^\]\s]*)))?[^\]]*\]"
+)
+
+VAR_RE = re.compile(r"var\(\s*(--[\w-]+)")
+
+LINK_RE = re.compile(r"<link\b[^>]*>")
+
+ATTRIBUTE_RE = re.compile(r'([\w-]+)(?:="([^"]*)")?')
+
+CRITICAL_MARKER = "data-critical"
+
+# Set by codigo_pagina.deferred_rendering on the sections below the fold.
+BELOW_FOLD_MARKER = "data-below-fold"
+
+VOID_ELEMENTS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"
+}
+
+
+class DocumentTokens(HTMLParser):
+    """Collects the tag names, classes and ids of an HTML document above the fold."""
+
+    def __init__(self):
+        super().__init__()
+        self.tags = set()
+        self.classes = set(RUNTIME_CLASSES)
+        self.ids = set()
+        self.attributes = set()
+        self.inline_styles = []
+        # Depth inside the below-the-fold element being skipped, 0 outside of one.
+        self._skipped = 0
+
+    def handle_startendtag(self, tag, attrs):
+        if not self._skipped:
+            self._collect(tag, attrs)
+
+    def handle_starttag(self, tag, attrs):
+        if tag in VOID_ELEMENTS:
+            self.handle_startendtag(tag, attrs)
+        elif self._skipped:
+            self._skipped += 1
+        elif any(name == BELOW_FOLD_MARKER for name, _ in attrs):
+            self._skipped = 1
+        else:
+            self._collect(tag, attrs)
+
+    def handle_endtag(self, tag):
+        if self._skipped and tag not in VOID_ELEMENTS:
+            self._skipped -= 1
+
+    def _collect(self, tag, attrs):
+        """Record the tokens of one element."""
+        self.tags.add(tag)
+        for name, value in attrs:
+            self.attributes.add((name, None))
+            self.attributes.add((name, value))
+            if name == "style" and value:
+                self.inline_styles.append(value)
+            elif name == "class" and value:
+                self.classes.update(value.split())
+            elif name == "id" and value:
+                self.ids.add(value)
+
+
+def _unescape(token):
+    """Undo CSS escapes such as h-\\[50vh\\]."""
+    return re.sub(r"\\(.)", r"\1", token)
+
+
+def selector_used(selector, tokens):
+    """Return whether every class and id a selector needs is in the document."""
+    alternatives_found = True
+
+    def strip_functional(match):
+        nonlocal alternatives_found
+        if match[1] != "not" and match[1] != "has":
+            alternatives = split_top_level(match[2], ",")
+            if not any(selector_used(alt, tokens) for alt in alternatives):
+                alternatives_found = False
+        return ""
+
+    selector = FUNCTIONAL_PSEUDO_RE.sub(strip_functional, selector)
+    if not alternatives_found:
+        return False
+    for name, operator, *values in ATTRIBUTE_SELECTOR_RE.findall(selector):
+        value = operator == "=" and "".join(values) or None
+        if (name, value) not in tokens.attributes:
+            return False
+    selector = ATTRIBUTE_SELECTOR_RE.sub("", selector)
+    classes = re.findall(r"\.((?:\\.|[\w-])+)", selector)
+    ids = re.findall(r"#((?:\\.|[\w-])+)", selector)
+    return all(_unescape(name) in tokens.classes for name in classes) and all(
+        _unescape(name) in tokens.ids for name in ids
+    )
+
+
+def _critical_rules(css, tokens):
+    """Keep the rules of a stylesheet that can match the document."""
+    kept = []
+    deferred = []
+    for prelude, body in blocks(css):
+        if body is None:
+            if prelude.startswith("@charset"):
+                kept.append(f"{prelude};")
+        elif prelude.startswith(("@media", "@supports")):
+            inner = _critical_rules(body, tokens)
+            if inner:
+                kept.append(f"{prelude}{{{inner}}}")
+        elif prelude.startswith(("@font-face", "@keyframes", "@-webkit-keyframes")):
+            deferred.append((prelude, body))
+        elif not prelude.startswith("@"):
+            selectors = [
+                selector
+                for selector in split_top_level(prelude, ",")
+                if selector_used(selector, tokens)
+            ]
+            if selectors:
+                kept.append(f"{','.join(selectors)}{{{body}}}")
+    critical = "".join(kept)
+    for prelude, body in deferred:
+        # Only keep fonts and animations the critical rules refer to.
+        if prelude.startswith("@font-face"):
+            family = re.search(r"font-family:\s*['\"]?([^;'\"}]+)", body)
+            if family and family[1].strip() in critical:
+                critical += f"{prelude}{{{body}}}"
+        elif prelude.split()[-1] in critical:
+            critical += f"{prelude}{{{body}}}"
+    return critical
+
+
+def _declarations(body):
+    """Split a declaration block into its non-empty declarations."""
+    return [d.strip() for d in split_top_level(body, ";") if d.strip()]
+
+
+def _custom_properties(css, defined, read):
+    """Collect the custom property definitions of a stylesheet and the ones read directly."""
+    for prelude, body in blocks(css):
+        if body is None:
+            continue
+        if prelude.startswith("@"):
+            _custom_properties(body, defined, read)
+            continue
+        for declaration in _declarations(body):
+            name, _, value = declaration.partition(":")
+            if name.startswith("--"):
+                defined.setdefault(name.strip(), []).append(value)
+            else:
+                read.update(VAR_RE.findall(value))
+
+
+def _drop_custom_properties(css, unused):
+    """Remove the declarations of unused custom properties, and emptied rules."""
+    kept = []
+    for prelude, body in blocks(css):
+        if body is None:
+            kept.append(f"{prelude};")
+        elif prelude.startswith(("@media", "@supports")):
+            inner = _drop_custom_properties(body, unused)
+            if inner:
+                kept.append(f"{prelude}{{{inner}}}")
+        elif prelude.startswith("@"):
+            kept.append(f"{prelude}{{{body}}}")
+        else:
+            declarations = [
+                declaration
+                for declaration in _declarations(body)
+                if declaration.partition(":")[0].strip() not in unused
+            ]
+            if declarations:
+                kept.append(f"{prelude}{{{';'.join(declarations)}}}")
+    return "".join(kept)
+
+
+def prune_custom_properties(css, extra_sources=()):
+    """Drop custom properties that nothing in the CSS or the page ever reads."""
+    defined = {}
+    pending = set()
+    _custom_properties(css, defined, pending)
+    for source in extra_sources:
+        pending.update(VAR_RE.findall(source))
+    used = set()
+    while pending:
+        name = pending.pop()
+        if name in used:
+            continue
+        used.add(name)
+        for value in defined.get(name, ()):
+            pending.update(VAR_RE.findall(value))
+    return _drop_custom_properties(css, set(defined) - used)
+
+
+def extract_critical_css(html, css):
+    """Return the subset of a stylesheet that applies to an HTML document."""
+    tokens = DocumentTokens()
+    tokens.feed(html)
+    critical = _critical_rules(strip_comments(css), tokens)
+    inline_css = re.findall(r"<style\b[^>]*>(.*?)</style>", html, flags=re.S)
+    return prune_custom_properties(critical, [*inline_css, *tokens.inline_styles])
+
+
+def _attributes(tag):
+    """Parse the attributes of a single start tag into a dict."""
+    return {
+        name: value or ""
+        for name, value in ATTRIBUTE_RE.findall(tag[len("<link") :].rstrip("/>"))
+    }
+
+
+def inline_critical_css(html, public_dir):
+    """Inline the critical CSS of a page and load its stylesheets without blocking."""
+    if CRITICAL_MARKER in html:
+        return html
+    critical = []
+
+    def defer(match):
+        attributes = _attributes(match[0])
+        href = attributes.get("href", "")
+        if attributes.get("rel") != "stylesheet" or not href.startswith("/"):
+            return match[0]
+        path = Path(public_dir) / href.lstrip("/")
+        if not path.exists():
+            return match[0]
+        critical.append(extract_critical_css(html, path.read_text()))
+        return (
+            f"{match[0].rstrip('>').rstrip('/')} media=\"print\" "
+            "onload=\"this.media='all'\"/>"
+            f'<noscript><link rel="stylesheet" href="{href}"/></noscript>'
+        )
+
+    head_end = html.find("</head>")
+    head = LINK_RE.sub(defer, html[:head_end])
+    if not critical:
+        return html
+    style = f'<style {CRITICAL_MARKER}="">{"".join(critical)}</style>'
+    first_link = head.find("<link")
+    while first_link != -1 and 'rel="stylesheet"' not in head[
+        first_link : head.find(">", first_link)
+    ]:
+        first_link = head.find("<link", first_link + 1)
+    head = head[:first_link] + style + head[first_link:]
+    return head + html[head_end:]
+
+
+def _minify_style(match):
+    """Collapse the whitespace of an inline <style> block."""
+    css = strip_comments(match[2])
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,])\s*", r"\1", css)
+    # Before ":" whitespace is only dropped in declarations; in a selector it
+    # is a descendant combinator.
+    css = re.sub(r"(?<=[{;])([\w-]+)\s+:(?=[^{}]*[;}])", r"\1:", css)
+    css = re.sub(r":\s+", ":", css).strip()
+    return f"{match[1]}{css}</style>"
+
+
+def minify_html(html):
+    """Minify the document head.
+
+    The body is React's server-rendered markup: its text nodes and <!-- -->
+    markers are compared during hydration, so it is left untouched.
+    """
+    head_end = html.find("</head>")
+    if head_end == -1:
+        return html
+    head = re.sub(r"<!--(?!\[if).*?-->", "", html[:head_end], flags=re.S)
+    head = re.sub(r"(<style\b[^>]*>)(.*?)</style>", _minify_style, head, flags=re.S)
+    head = re.sub(r">\s+<", "><", head)
+    return head.strip() + html[head_end:]
+
+
+def precompress(path):
+    """Write maximum-level .gz and .br siblings of a file when they save bytes.
+
+    Returns the number of siblings written; up-to-date siblings are kept.
+    """
+    written = 0
+    data = None
+    encoders = [("gz", lambda raw: gzip.compress(raw, compresslevel=9, mtime=0))]
+    try:
+        import brotli
+
+        encoders.append(
+            ("br", lambda raw: brotli.compress(raw, mode=brotli.MODE_TEXT, quality=11))
+        )
+    except ImportError:
+        pass
+    for extension, compress in encoders:
+        sibling = path.with_name(f"{path.name}.{extension}")
+        if sibling.exists() and sibling.stat().st_mtime >= path.stat().st_mtime:
+            continue
+        data = path.read_bytes() if data is None else data
+        compressed = compress(data)
+        if len(compressed) < len(data):
+            sibling.write_bytes(compressed)
+            written += 1
+        elif sibling.exists():
+            sibling.unlink()
+    return written
+
+
+def precompress_tree(root):
+    """Precompress every text asset below a directory."""
+    written = 0
+    for path in sorted(Path(root).rglob("*")):
+        if path.is_file() and path.suffix in TEXT_EXTENSIONS:
+            written += precompress(path)
+    return written
+
+
+def optimize_page(path, public_dir, minify=True, critical=True):
+    """Minify a page and inline its critical CSS in place."""
+    html = path.read_text()
+    original = len(html.encode())
+    if critical:
+        html = inline_critical_css(html, public_dir)
+    if minify:
+        html = minify_html(html)
+    path.write_text(html)
+    return original, len(html.encode())
+
+
+def run(public_dir, pages=DEFAULT_PAGES, minify=True, critical=True, compress=True):
+    """Run every post-export step over an exported site."""
+    public_dir = Path(public_dir)
+    for page in pages:
+        path = public_dir / page
+        if not path.exists():
+            print(f"{page}: not found, skipped")
+            continue
+        before, after = optimize_page(path, public_dir, minify, critical)
+        print(f"{page}: {before} -> {after} bytes")
+    if compress:
+        written = precompress_tree(public_dir / STATIC_DIR)
+        print(f"{STATIC_DIR}: {written} precompressed files written")
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(
+        prog="python -m Guia_landing.postbuild", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument("public_dir", nargs="?", default="public")
+    parser.add_argument("--pages", nargs="*", default=list(DEFAULT_PAGES))
+    parser.add_argument("--no-minify", dest="minify", action="store_false")
+    parser.add_argument("--no-critical", dest="critical", action="store_false")
+    parser.add_argument("--no-compress", dest="compress", action="store_false")
+    args = parser.parse_args(argv)
+    if not Path(args.public_dir).is_dir():
+        parser.error(f"{args.public_dir} is not a directory")
+    run(args.public_dir, args.pages, args.minify, args.critical, args.compress)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
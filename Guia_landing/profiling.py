@@ -0,0 +1,152 @@
+"""Opt-in profiling of the page builders and of Reflex's compile phases.
+
+GUIA_PROFILE=1 wraps every create_* builder of codigo_pagina.py and the
+compile phases of the app. For each one it records the call count, total
+and self time, the bytes allocated while it ran (tracemalloc) and the size
+and depth of the component subtree it returned. When the process exits it
+writes, to GUIA_PROFILE_DIR (default: profile/):
+
+    builders.json        one summary entry per builder or phase
+    stacks.collapsed     self time in microseconds per call stack, the input
+                         format of flamegraph.pl and speedscope
+
+Pages compiled in forked worker processes (REFLEX_COMPILE_PROCESSES) are
+not recorded; the default thread pool is.
+"""
+
+import atexit
+import functools
+import json
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from pathlib import Path
+
+from reflex.components.component import Component
+
+DEFAULT_OUTPUT_DIR = Path("profile")
+
+BUILDER_PREFIX = "create_"
+
+# Reflex functions that make up the compile of an app, by owner and attribute.
+COMPILE_PHASES = (
+    ("reflex.app", "App", "_compile"),
+    ("reflex.compiler.compiler", "ExecutorSafeFunctions", "compile_page"),
+    ("reflex.compiler.compiler", "ExecutorSafeFunctions", "compile_app"),
+    ("reflex.compiler.compiler", None, "compile_stateful_components"),
+    ("reflex.compiler.compiler", None, "compile_document_root"),
+)
+
+
+class Profile:
+    """Call statistics and collapsed stacks gathered by the wrapped functions."""
+
+    def __init__(self):
+        self.stats = defaultdict(
+            lambda: {
+                "calls": 0,
+                "total_s": 0.0,
+                "self_s": 0.0,
+                "allocated_bytes": 0,
+                "nodes": 0,
+                "max_depth": 0,
+            }
+        )
+        self.stacks = defaultdict(int)
+        self.lock = threading.Lock()
+        self.local = threading.local()
+
+    def _frames(self):
+        """Return the call stack of the current thread."""
+        if not hasattr(self.local, "frames"):
+            self.local.frames = []
+        return self.local.frames
+
+    def wrap(self, name, function):
+        """Return function recording its calls under name."""
+
+        @functools.wraps(function)
+        def profiled(*args, **kwargs):
+            frames = self._frames()
+            frame = {"name": name, "children_s": 0.0}
+            frames.append(frame)
+            memory = tracemalloc.get_traced_memory()[0]
+            start = time.perf_counter()
+            try:
+                result = function(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                allocated = tracemalloc.get_traced_memory()[0] - memory
+                stack = ";".join(f["name"] for f in frames)
+                frames.pop()
+                if frames:
+                    frames[-1]["children_s"] += elapsed
+                self_s = elapsed - frame["children_s"]
+                with self.lock:
+                    entry = self.stats[name]
+                    entry["calls"] += 1
+                    entry["total_s"] += elapsed
+                    entry["self_s"] += self_s
+                    entry["allocated_bytes"] += max(allocated, 0)
+                    self.stacks[stack] += round(self_s * 1e6)
+            if isinstance(result, Component):
+                nodes, depth = tree_shape(result)
+                with self.lock:
+                    entry["nodes"] += nodes
+                    entry["max_depth"] = max(entry["max_depth"], depth)
+            return result
+
+        return profiled
+
+    def write(self, output_dir):
+        """Write the JSON summary and the collapsed stacks."""
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        summary = dict(
+            sorted(self.stats.items(), key=lambda item: item[1]["total_s"], reverse=True)
+        )
+        (output_dir / "builders.json").write_text(json.dumps(summary, indent=2) + "\n")
+        with open(output_dir / "stacks.collapsed", "w") as collapsed:
+            for stack, micros in sorted(self.stacks.items()):
+                if micros > 0:
+                    collapsed.write(f"{stack} {micros}\n")
+
+
+def tree_shape(component):
+    """Return the node count and depth of a component tree."""
+    nodes, depth = 1, 0
+    for child in component.children:
+        if isinstance(child, Component):
+            child_nodes, child_depth = tree_shape(child)
+            nodes += child_nodes
+            depth = max(depth, child_depth)
+    return nodes, depth + 1
+
+
+def _wrap_attribute(profile, owner, attribute, name):
+    """Replace a function or classmethod attribute by its profiled version."""
+    raw = vars(owner).get(attribute) if isinstance(owner, type) else None
+    if isinstance(raw, classmethod):
+        setattr(owner, attribute, classmethod(profile.wrap(name, raw.__func__)))
+    else:
+        setattr(owner, attribute, profile.wrap(name, getattr(owner, attribute)))
+
+
+def install(builders_module, output_dir=DEFAULT_OUTPUT_DIR):
+    """Profile the builders of a module and the compile phases; returns the Profile."""
+    import importlib
+
+    profile = Profile()
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+    for name, value in list(vars(builders_module).items()):
+        if name.startswith(BUILDER_PREFIX) and callable(value):
+            _wrap_attribute(profile, builders_module, name, name)
+    for module_name, owner_name, attribute in COMPILE_PHASES:
+        owner = importlib.import_module(module_name)
+        if owner_name is not None:
+            owner = getattr(owner, owner_name)
+        _wrap_attribute(profile, owner, attribute, attribute.lstrip("_"))
+    atexit.register(profile.write, output_dir)
+    return profile
@@ -0,0 +1,576 @@
+"""Static HTTP/1.1 server for the exported public/ directory.
+
+    python -m Guia_landing.serve public --port 8000
+
+Built on asyncio streams: one thread serves every keep-alive connection.
+Files are sent with os.sendfile through loop.sendfile (in blocks where the
+loop has no sendfile, as on uvloop), precompressed .br and
+.gz siblings are chosen from Accept-Encoding, responses carry strong ETags
+and answer If-None-Match with 304, single byte ranges are supported, and
+small hot files are kept in a byte-capped LRU. Runs on uvloop when installed.
+
+With --leads-db the server also accepts the #contact form at POST
+/api/contact and stores the leads in SQLite (see leads.py); with
+--analytics-dir it counts the beacon's events at POST /api/beacon (see
+analytics.py).
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import mimetypes
+import os
+import posixpath
+import re
+import signal
+import sys
+from collections import OrderedDict
+from email.utils import formatdate
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+from Guia_landing import analytics, leads
+
+# Preferred first: the smallest encoding a client accepts wins.
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+# Content-hashed file names: Next.js chunks and the vendored third-party assets.
+IMMUTABLE_PREFIXES = ("/_next/static/", "/vendor/")
+
+CACHE_CONTROL = {
+    "immutable": "public, max-age=31536000, immutable",
+    "revalidate": "no-cache",
+    "default": "public, max-age=3600",
+}
+
+REVALIDATED_TYPES = {"text/html", "application/xml", "text/plain"}
+
+# The service worker must be checked for updates on every navigation.
+REVALIDATED_FILES = {"/sw.js", "/precache-manifest.json"}
+
+MAX_HEADER_BYTES = 16 * 1024
+
+KEEP_ALIVE_TIMEOUT = 15
+
+DEFAULT_CACHE_BYTES = 32 * 1024 * 1024
+
+DEFAULT_CACHE_ENTRY_BYTES = 64 * 1024
+
+# ETags remembered at most, one per path (about 200 bytes each).
+DEFAULT_CACHE_ETAGS = 16 * 1024
+
+# Read size when the event loop cannot sendfile.
+SEND_BLOCK_BYTES = 256 * 1024
+
+LEADS_PATH = "/api/contact"
+
+BODY_TIMEOUT = 10
+
+# Statuses whose responses never carry a body (RFC 9110, sections 15.3.5 and 15.4.5).
+BODYLESS_STATUSES = {204, 304}
+
+# C0 controls and DEL, rejected in decoded request paths (a NUL makes paths unusable).
+CONTROL_CHARACTERS_RE = re.compile(r"[\x00-\x1f\x7f]")
+
+REASONS = {
+    200: "OK",
+    201: "Created",
+    204: "No Content",
+    206: "Partial Content",
+    303: "See Other",
+    304: "Not Modified",
+    308: "Permanent Redirect",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    411: "Length Required",
+    413: "Content Too Large",
+    416: "Range Not Satisfiable",
+    422: "Unprocessable Content",
+    429: "Too Many Requests",
+    503: "Service Unavailable",
+}
+
+
+async def send_blocks(writer, file, start, length):
+    """Write length bytes of a file from start, one block at a time."""
+    file.seek(start)
+    while length > 0:
+        block = file.read(min(SEND_BLOCK_BYTES, length))
+        if not block:
+            raise ConnectionError("file shrank while it was sent")
+        writer.write(block)
+        await writer.drain()
+        length -= len(block)
+
+
+class FileCache:
+    """Byte-capped LRU of small file bodies, and a count-capped LRU of file ETags."""
+
+    def __init__(
+        self,
+        max_bytes=DEFAULT_CACHE_BYTES,
+        max_entry_bytes=DEFAULT_CACHE_ENTRY_BYTES,
+        max_etags=DEFAULT_CACHE_ETAGS,
+    ):
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self.bodies = OrderedDict()
+        self.size = 0
+        self.max_etags = max_etags
+        self.etags = OrderedDict()
+
+    def etag(self, path, stat):
+        """Return the strong ETag of a file, hashing it once per version."""
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = self.etags.get(path)
+        if cached is not None and cached[0] == version:
+            self.etags.move_to_end(path)
+            return cached[1]
+        digest = hashlib.sha1()
+        with open(path, "rb") as file:
+            for block in iter(lambda: file.read(1 << 20), b""):
+                digest.update(block)
+        etag = f'"{digest.hexdigest()[:20]}"'
+        # Keyed by path, so a new version replaces the old one.
+        self.etags[path] = (version, etag)
+        self.etags.move_to_end(path)
+        while len(self.etags) > self.max_etags:
+            self.etags.popitem(last=False)
+        return etag
+
+    def get(self, path, stat):
+        """Return the cached body of a file, or None."""
+        key = (path, stat.st_mtime_ns, stat.st_size)
+        body = self.bodies.get(key)
+        if body is not None:
+            self.bodies.move_to_end(key)
+        return body
+
+    def put(self, path, stat, body):
+        """Cache the body of a small file, evicting the least recently used ones."""
+        if len(body) > self.max_entry_bytes or len(body) > self.max_bytes:
+            return
+        self.bodies[(path, stat.st_mtime_ns, stat.st_size)] = body
+        self.size += len(body)
+        while self.size > self.max_bytes:
+            _, evicted = self.bodies.popitem(last=False)
+            self.size -= len(evicted)
+
+
+def accepted_encodings(header):
+    """Return the content codings a client accepts (q > 0)."""
+    accepted = set()
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if name and quality > 0:
+            accepted.add(name.strip().lower())
+    return accepted
+
+
+def parse_range(header, size):
+    """Parse a single byte range into (start, end) inclusive.
+
+    Returns None for a missing or multi-range header (served in full) and
+    raises ValueError when the range cannot be satisfied.
+    """
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None
+    first, _, last = header[len("bytes=") :].strip().partition("-")
+    if not first:
+        length = int(last)
+        if length <= 0:
+            raise ValueError(header)
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = int(last) if last else size - 1
+    if start >= size or end < start:
+        raise ValueError(header)
+    return start, min(end, size - 1)
+
+
+def cache_control(url_path, content_type):
+    """Return the Cache-Control policy of a response."""
+    if url_path.startswith(IMMUTABLE_PREFIXES):
+        return CACHE_CONTROL["immutable"]
+    if url_path in REVALIDATED_FILES or content_type.split(";")[0] in REVALIDATED_TYPES:
+        return CACHE_CONTROL["revalidate"]
+    return CACHE_CONTROL["default"]
+
+
+def content_type(path):
+    """Return the Content-Type of a file."""
+    kind = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+    if kind.startswith("text/") or kind in ("application/javascript", "application/json"):
+        kind += "; charset=utf-8"
+    return kind
+
+
+class StaticServer:
+    """Serves the files of one directory, and the lead form when given a collector."""
+
+    def __init__(self, root, cache, collector=None, trust_forwarded=False, beacons=None):
+        self.root = Path(root).resolve()
+        self.cache = cache
+        self.collector = collector
+        self.trust_forwarded = trust_forwarded
+        self.beacons = beacons
+
+    def resolve(self, url_path):
+        """Map a URL path to (file, redirect); both None when nothing matches.
+
+        Raises ValueError for a path with control characters once decoded.
+        """
+        decoded = unquote(url_path)
+        if CONTROL_CHARACTERS_RE.search(decoded):
+            raise ValueError(url_path)
+        relative = posixpath.normpath(decoded).lstrip("/")
+        try:
+            path = (self.root / relative).resolve()
+            if path != self.root and self.root not in path.parents:
+                return None, None
+            if path.is_dir():
+                if not url_path.endswith("/"):
+                    # Leading slashes are collapsed: "//host/" would be protocol-relative.
+                    return None, "/" + url_path.lstrip("/") + "/"
+                path = path / "index.html"
+            return (path, None) if path.is_file() else (None, None)
+        except OSError:
+            # For instance a name longer than the file system allows.
+            return None, None
+
+    async def handle(self, reader, writer):
+        """Serve requests on one connection until it closes or idles out."""
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(
+                        reader.readuntil(b"\r\n\r\n"), KEEP_ALIVE_TIMEOUT
+                    )
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError):
+                    break
+                except asyncio.LimitOverrunError:
+                    await self.respond(writer, "GET", 400, {}, b"", keep_alive=False)
+                    break
+                keep_alive = await self.serve_request(head, reader, writer)
+                if not keep_alive:
+                    break
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve_request(self, head, reader, writer):
+        """Answer one request; returns whether the connection stays open."""
+        try:
+            lines = head.decode("latin-1").split("\r\n")
+            method, target, version = lines[0].split(" ")
+            headers = {}
+            for line in lines[1:]:
+                if line:
+                    name, _, value = line.partition(":")
+                    headers[name.strip().lower()] = value.strip()
+        except ValueError:
+            await self.respond(writer, "GET", 400, {}, b"", keep_alive=False)
+            return False
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" and (
+            version == "HTTP/1.1" or connection == "keep-alive"
+        )
+        # The request target is origin-form: "//host/x" is a path, not an authority.
+        url_path, _, query = target.partition("?")
+        url_path = url_path or "/"
+        if url_path == LEADS_PATH and self.collector is not None:
+            if method != "POST":
+                await self.respond(writer, method, 405, {"Allow": "POST"}, b"", keep_alive)
+                return keep_alive
+            return await self.accept_lead(headers, reader, writer, keep_alive)
+        if url_path == analytics.BEACON_PATH and self.beacons is not None:
+            if method != "POST":
+                await self.respond(writer, method, 405, {"Allow": "POST"}, b"", keep_alive)
+                return keep_alive
+            body = await self.read_body(headers, reader, writer, analytics.MAX_BODY_BYTES)
+            if body is None:
+                return False
+            self.beacons.record(body)
+            await self.respond(writer, method, 204, {"Cache-Control": "no-store"}, None, keep_alive)
+            return keep_alive
+        if method not in ("GET", "HEAD"):
+            # The request body is never read, so the connection cannot be reused.
+            await self.respond(writer, method, 405, {"Allow": "GET, HEAD"}, b"", False)
+            return False
+        try:
+            path, redirect = self.resolve(url_path)
+        except ValueError:
+            await self.respond(writer, method, 400, {}, b"", keep_alive=False)
+            return False
+        if redirect is not None:
+            location = f"{redirect}?{query}" if query else redirect
+            await self.respond(writer, method, 308, {"Location": location}, b"", keep_alive)
+            return keep_alive
+        status = 200
+        if path is None:
+            status = 404
+            path = self.root / "404.html"
+            if not path.is_file():
+                await self.respond(writer, method, 404, {}, b"", keep_alive)
+                return keep_alive
+        await self.send_file(writer, method, status, url_path, path, headers, keep_alive)
+        return keep_alive
+
+    async def send_file(self, writer, method, status, url_path, path, headers, keep_alive):
+        """Send a file, or its precompressed sibling, honoring validators and ranges."""
+        kind = content_type(path)
+        response = {
+            "Content-Type": kind,
+            "Cache-Control": cache_control(url_path, kind),
+        }
+        # Ranges always address the identity representation.
+        accepted = set() if "range" in headers else accepted_encodings(
+            headers.get("accept-encoding", "")
+        )
+        chosen = path
+        has_variants = False
+        for encoding, suffix in ENCODINGS:
+            sibling = path.with_name(path.name + suffix)
+            if sibling.is_file():
+                has_variants = True
+                if encoding in accepted and chosen is path:
+                    chosen = sibling
+                    response["Content-Encoding"] = encoding
+        if has_variants:
+            response["Vary"] = "Accept-Encoding"
+        stat = chosen.stat()
+        etag = self.cache.etag(chosen, stat)
+        response["ETag"] = etag
+        response["Last-Modified"] = formatdate(stat.st_mtime, usegmt=True)
+        response["Accept-Ranges"] = "bytes"
+        if status == 200:
+            match = headers.get("if-none-match")
+            if match and (match.strip() == "*" or etag in [m.strip() for m in match.split(",")]):
+                await self.respond(writer, method, 304, response, None, keep_alive)
+                return
+        start, end = 0, stat.st_size - 1
+        if status == 200 and "Content-Encoding" not in response:
+            if_range = headers.get("if-range")
+            try:
+                byte_range = None if if_range not in (None, etag) else parse_range(
+                    headers.get("range"), stat.st_size
+                )
+            except ValueError:
+                response["Content-Range"] = f"bytes */{stat.st_size}"
+                await self.respond(writer, method, 416, response, b"", keep_alive)
+                return
+            if byte_range is not None:
+                status = 206
+                start, end = byte_range
+                response["Content-Range"] = f"bytes {start}-{end}/{stat.st_size}"
+        length = end - start + 1
+        body = self.cache.get(chosen, stat)
+        if body is None and stat.st_size <= self.cache.max_entry_bytes:
+            body = chosen.read_bytes()
+            self.cache.put(chosen, stat, body)
+        if body is not None:
+            await self.respond(
+                writer, method, status, response, body[start : end + 1], keep_alive
+            )
+            return
+        response["Content-Length"] = str(length)
+        await self.respond(writer, method, status, response, None, keep_alive)
+        if method == "HEAD":
+            return
+        with open(chosen, "rb") as file:
+            try:
+                await asyncio.get_running_loop().sendfile(
+                    writer.transport, file, start, length
+                )
+            except NotImplementedError:
+                # uvloop has no loop.sendfile; nothing was sent yet.
+                await send_blocks(writer, file, start, length)
+
+    async def read_body(self, headers, reader, writer, limit):
+        """Read a request body of at most limit bytes; None when the connection must close."""
+        try:
+            length = int(headers["content-length"])
+        except (KeyError, ValueError):
+            await self.respond(writer, "POST", 411, {}, b"", keep_alive=False)
+            return None
+        if length < 0 or length > limit:
+            await self.respond(writer, "POST", 413, {}, b"", keep_alive=False)
+            return None
+        try:
+            return await asyncio.wait_for(reader.readexactly(length), BODY_TIMEOUT)
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError):
+            return None
+
+    async def accept_lead(self, headers, reader, writer, keep_alive):
+        """Read a contact form submission and hand it to the lead collector."""
+        body = await self.read_body(headers, reader, writer, leads.MAX_BODY_BYTES)
+        if body is None:
+            return False
+        client = writer.get_extra_info("peername")[0]
+        if self.trust_forwarded and "x-forwarded-for" in headers:
+            client = headers["x-forwarded-for"].split(",")[0].strip()
+        content_type = headers.get("content-type", "")
+        status, message = self.collector.submit(client, body, content_type)
+        response = {}
+        if status == 429:
+            response["Retry-After"] = str(math.ceil(self.collector.limiter.refill_seconds))
+        elif status == 503:
+            response["Retry-After"] = str(math.ceil(self.collector.flush_interval))
+        wants_json = "application/json" in headers.get("accept", "") or content_type.startswith(
+            "application/json"
+        )
+        if wants_json:
+            response["Content-Type"] = "application/json"
+            body = json.dumps({"status": status, "message": message}).encode()
+        elif status == 201:
+            # A plain form post goes back to the page it came from.
+            referer = urlsplit(headers.get("referer", "")).path
+            response["Location"] = "/" + referer.lstrip("/") + "#contact"
+            status, body = 303, b""
+        else:
+            response["Content-Type"] = "text/plain; charset=utf-8"
+            body = message.encode() + b"\n"
+        response["Cache-Control"] = "no-store"
+        await self.respond(writer, "POST", status, response, body, keep_alive)
+        return keep_alive
+
+    async def respond(self, writer, method, status, headers, body, keep_alive):
+        """Write a status line, headers and an optional in-memory body.
+
+        A HEAD response announces the length of the body it leaves out; 204
+        and 304 responses have no body and no Content-Length.
+        """
+        lines = [f"HTTP/1.1 {status} {REASONS[status]}"]
+        headers = {
+            "Date": formatdate(usegmt=True),
+            "Connection": "keep-alive" if keep_alive else "close",
+            **headers,
+        }
+        if status in BODYLESS_STATUSES:
+            headers.pop("Content-Length", None)
+            body = None
+        elif body is not None:
+            headers["Content-Length"] = str(len(body))
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        if body and method != "HEAD":
+            writer.write(body)
+        await writer.drain()
+
+
+async def _stop(task):
+    """Cancel a background flush task and wait for its final flush."""
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+async def serve(root, host, port, cache, leads_db=None, trust_forwarded=False, analytics_dir=None):
+    """Run the server until cancelled or terminated."""
+    # SIGTERM cancels the server like Ctrl-C, so buffered leads and counts are flushed.
+    asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+    collector = None
+    if leads_db is not None:
+        collector = leads.LeadCollector(leads.LeadStore(leads_db))
+        collector.start()
+    beacons = None
+    if analytics_dir is not None:
+        beacons = analytics.BeaconCollector(analytics_dir)
+        beacons.start()
+    server = StaticServer(root, cache, collector, trust_forwarded, beacons)
+    listener = await asyncio.start_server(
+        server.handle, host, port, limit=MAX_HEADER_BYTES, backlog=4096
+    )
+    addresses = ", ".join(str(sock.getsockname()) for sock in listener.sockets)
+    print(f"Serving {server.root} on {addresses}", flush=True)
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        # Cancelling a flusher writes whatever is still buffered.
+        if collector is not None:
+            await _stop(collector.task)
+            collector.store.close()
+        if beacons is not None:
+            await _stop(beacons.task)
+            beacons.close()
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(
+        prog="python -m Guia_landing.serve", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument("root", nargs="?", default="public")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--cache-bytes",
+        type=int,
+        default=DEFAULT_CACHE_BYTES,
+        help="memory for cached file bodies",
+    )
+    parser.add_argument(
+        "--cache-entry-bytes",
+        type=int,
+        default=DEFAULT_CACHE_ENTRY_BYTES,
+        help="largest file kept in memory; larger ones are sent with sendfile",
+    )
+    parser.add_argument(
+        "--leads-db",
+        type=Path,
+        help="SQLite database for the contact form; without it POST /api/contact is a 405",
+    )
+    parser.add_argument(
+        "--trust-forwarded",
+        action="store_true",
+        help="rate limit by X-Forwarded-For (only behind a proxy that sets it)",
+    )
+    parser.add_argument(
+        "--analytics-dir",
+        type=Path,
+        help="directory of the daily beacon rollups; without it POST /api/beacon is a 405",
+    )
+    args = parser.parse_args(argv)
+    if not Path(args.root).is_dir():
+        parser.error(f"{args.root} is not a directory")
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+    cache = FileCache(args.cache_bytes, args.cache_entry_bytes)
+    try:
+        asyncio.run(
+            serve(
+                args.root,
+                args.host,
+                args.port,
+                cache,
+                args.leads_db,
+                args.trust_forwarded,
+                args.analytics_dir,
+            )
+        )
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
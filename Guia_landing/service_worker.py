@@ -0,0 +1,236 @@
+"""Service worker and precache manifest for the exported site.
+
+    python -m Guia_landing.service_worker public
+
+Writes public/precache-manifest.json and public/sw.js, and adds the worker's
+registration to every exported page. The worker precaches the pages and the
+files under _next/static that they reference (with the fonts and images
+their stylesheets load), so run it after zero_js.py: a page without
+JavaScript adds no chunks. Content-hashed files are served cache-first, and
+chunks loaded later are cached when first fetched; pages are served
+stale-while-revalidate. Both caches are named after the build ID, so the
+worker of a new build precaches its files and deletes the caches of the
+previous build.
+"""
+
+import argparse
+import json
+import re
+import sys
+from html.parser import HTMLParser
+from pathlib import Path
+from urllib.parse import urljoin, urlsplit
+
+from Guia_landing.deterministic import find_build_id
+
+STATIC_DIR = Path("_next") / "static"
+
+WORKER_FILE = "sw.js"
+
+MANIFEST_FILE = "precache-manifest.json"
+
+CSS_URL_RE = re.compile(r"""url\(\s*['"]?([^'")\s]+)""")
+
+REGISTER_MARKER = "data-sw-register"
+
+REGISTER_SCRIPT = (
+    f"<script {REGISTER_MARKER}>"
+    "if('serviceWorker'in navigator)addEventListener('load',function(){"
+    f"navigator.serviceWorker.register('/{WORKER_FILE}')}})"
+    "</script>"
+)
+
+WORKER_TEMPLATE = """\
+const BUILD_ID = %(build_id)s;
+const PRECACHE = "precache-" + BUILD_ID;
+const PAGES = "pages-" + BUILD_ID;
+const MANIFEST = %(manifest)s;
+
+self.addEventListener("install", (event) => {
+  event.waitUntil(
+    Promise.all([
+      caches.open(PRECACHE).then((cache) =>
+        cache.addAll(MANIFEST.filter((entry) => !entry.page).map((entry) => entry.url))
+      ),
+      caches.open(PAGES).then((cache) =>
+        cache.addAll(MANIFEST.filter((entry) => entry.page).map((entry) => entry.url))
+      ),
+    ]).then(() => self.skipWaiting())
+  );
+});
+
+self.addEventListener("activate", (event) => {
+  event.waitUntil(
+    caches
+      .keys()
+      .then((names) =>
+        Promise.all(
+          names
+            .filter((name) => name !== PRECACHE && name !== PAGES)
+            .map((name) => caches.delete(name))
+        )
+      )
+      .then(() => self.clients.claim())
+  );
+});
+
+function cacheFirst(request) {
+  return caches.match(request).then(
+    (cached) =>
+      cached ||
+      fetch(request).then((response) => {
+        if (response.ok) {
+          const copy = response.clone();
+          caches.open(PRECACHE).then((cache) => cache.put(request, copy));
+        }
+        return response;
+      })
+  );
+}
+
+function staleWhileRevalidate(event) {
+  const request = event.request;
+  const network = fetch(request).then((response) => {
+    if (response.ok) {
+      const copy = response.clone();
+      caches.open(PAGES).then((cache) => cache.put(request, copy));
+    }
+    return response;
+  });
+  event.waitUntil(network.catch(() => undefined));
+  return caches
+    .open(PAGES)
+    .then((cache) => cache.match(request, { ignoreSearch: true }))
+    .then((cached) => cached || network);
+}
+
+self.addEventListener("fetch", (event) => {
+  const request = event.request;
+  const url = new URL(request.url);
+  if (request.method !== "GET" || url.origin !== self.location.origin) {
+    return;
+  }
+  if (url.pathname.startsWith("/_next/static/")) {
+    event.respondWith(cacheFirst(request));
+  } else if (request.mode === "navigate" || url.pathname.endsWith(".html")) {
+    event.respondWith(staleWhileRevalidate(event));
+  }
+});
+"""
+
+
+def page_urls(public_dir):
+    """Return (url, file) for every exported page except the 404 page."""
+    public_dir = Path(public_dir)
+    pages = []
+    for path in sorted(public_dir.rglob("index.html")):
+        relative = path.parent.relative_to(public_dir).as_posix()
+        if relative.split("/")[0] == "404" or relative.startswith("_next"):
+            continue
+        pages.append(("/" if relative == "." else f"/{relative}/", path))
+    return pages
+
+
+class PageAssets(HTMLParser):
+    """Collects the URLs of the scripts, stylesheets and preloads a page loads."""
+
+    def __init__(self):
+        super().__init__()
+        self.urls = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "script" and attrs.get("src") and "nomodule" not in attrs:
+            self.urls.append(attrs["src"])
+        elif tag == "link" and attrs.get("href"):
+            rel = (attrs.get("rel") or "").split()
+            if {"stylesheet", "preload", "modulepreload"} & set(rel):
+                self.urls.append(attrs["href"])
+
+
+def _static_file(public_dir, url):
+    """Return the file under _next/static a URL points at, or None."""
+    path = urlsplit(url).path
+    if not path.startswith(f"/{STATIC_DIR.as_posix()}/"):
+        return None
+    file = public_dir / path.lstrip("/")
+    return file if file.is_file() else None
+
+
+def referenced_assets(public_dir, pages):
+    """Return the URLs of the _next/static files the pages load, in first-use order."""
+    public_dir = Path(public_dir)
+    found = {}
+    pending = []
+    for _, path in pages:
+        scan = PageAssets()
+        scan.feed(path.read_text())
+        pending.extend(scan.urls)
+    while pending:
+        url = pending.pop(0)
+        file = _static_file(public_dir, url)
+        if file is None or urlsplit(url).path in found:
+            continue
+        found[urlsplit(url).path] = file
+        if file.suffix == ".css":
+            pending.extend(
+                urljoin(urlsplit(url).path, target)
+                for target in CSS_URL_RE.findall(file.read_text())
+                if not target.startswith("data:")
+            )
+    return list(found)
+
+
+def build_manifest(public_dir):
+    """Return the precache entries of an export: the pages and the assets they load."""
+    pages = page_urls(public_dir)
+    entries = [{"url": url} for url in referenced_assets(public_dir, pages)]
+    entries += [{"url": url, "page": True} for url, _ in pages]
+    return entries
+
+
+def add_registration(path):
+    """Register the service worker from a page; returns whether the page changed."""
+    html = path.read_text()
+    if REGISTER_MARKER in html or "</head>" not in html:
+        return False
+    path.write_text(html.replace("</head>", f"{REGISTER_SCRIPT}</head>", 1))
+    return True
+
+
+def generate(public_dir):
+    """Write the manifest and worker of an export; returns the manifest."""
+    public_dir = Path(public_dir)
+    build_id = find_build_id(public_dir)
+    if build_id is None:
+        raise RuntimeError(f"{public_dir}/index.html has no build ID.")
+    for _, path in page_urls(public_dir):
+        add_registration(path)
+    manifest = build_manifest(public_dir)
+    (public_dir / MANIFEST_FILE).write_text(json.dumps(manifest, indent=2) + "\n")
+    worker = WORKER_TEMPLATE % {
+        "build_id": json.dumps(build_id),
+        "manifest": json.dumps(manifest, separators=(",", ":")),
+    }
+    (public_dir / WORKER_FILE).write_text(worker)
+    return manifest
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(
+        prog="python -m Guia_landing.service_worker",
+        description=__doc__.splitlines()[0],
+    )
+    parser.add_argument("public_dir", nargs="?", default="public")
+    args = parser.parse_args(argv)
+    if not Path(args.public_dir).is_dir():
+        parser.error(f"{args.public_dir} is not a directory")
+    manifest = generate(args.public_dir)
+    pages = sum(1 for entry in manifest if entry.get("page"))
+    print(f"{WORKER_FILE}: {len(manifest) - pages} assets and {pages} pages precached")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,185 @@
+"""Incremental sitemap of the exported pages.
+
+    python -m Guia_landing.sitemap public --base-url https://example.com
+
+Every route registered with app.add_page is looked up in public/, its HTML is
+hashed without the build's scripts and asset links, and <lastmod> only moves
+(to the reproducible build date) for pages whose hash changed since the last
+run. Hashes are kept in .sitemap-manifest.json. URLs are streamed into
+sitemap-N.xml shards of at most 50,000 entries, listed by sitemap.xml.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+MANIFEST_FILE = Path(".sitemap-manifest.json")
+
+# Limits of a single sitemap file from the sitemaps.org protocol.
+MAX_URLS = 50_000
+MAX_BYTES = 50 * 1024 * 1024
+
+XMLNS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+
+SHARD_RE = re.compile(r"^sitemap-\d+\.xml$")
+
+# Build output that changes on every export without changing the page.
+VOLATILE_RE = re.compile(
+    r"<script\b[^>]*>.*?</script>|<link\b[^>]*/_next/static/[^>]*>|<noscript\b[^>]*>.*?</noscript>",
+    re.S,
+)
+
+URLSET_HEAD = f'<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="{XMLNS}">\n'
+URLSET_TAIL = "</urlset>\n"
+
+
+def registered_routes():
+    """Return the routes of the pages added to the Reflex app."""
+    from Guia_landing.Guia_landing import app
+
+    return sorted(app.pages)
+
+
+def page_file(public_dir, route):
+    """Return the exported HTML file of a route."""
+    if route == "index":
+        return Path(public_dir) / "index.html"
+    return Path(public_dir) / route / "index.html"
+
+
+def page_url(base_url, route):
+    """Return the public URL of a route (the export uses trailing slashes)."""
+    return f"{base_url}/" if route == "index" else f"{base_url}/{route}/"
+
+
+def content_hash(html):
+    """Hash a page without the parts every build changes."""
+    return hashlib.sha256(VOLATILE_RE.sub("", html).encode()).hexdigest()
+
+
+def load_manifest(path=MANIFEST_FILE):
+    """Return the page hashes and lastmod dates of the previous run."""
+    path = Path(path)
+    return json.loads(path.read_text()) if path.exists() else {}
+
+
+def update_entries(public_dir, routes, base_url, manifest, when):
+    """Yield (url, lastmod) per exported route, updating the manifest in place."""
+    seen = set()
+    for route in routes:
+        path = page_file(public_dir, route)
+        if not path.exists():
+            continue
+        url = page_url(base_url, route)
+        seen.add(url)
+        digest = content_hash(path.read_text())
+        entry = manifest.get(url)
+        if entry is None or entry["hash"] != digest:
+            entry = manifest[url] = {"hash": digest, "lastmod": when}
+        yield url, entry["lastmod"]
+    for url in set(manifest) - seen:
+        del manifest[url]
+
+
+def _replace_if_changed(temporary, target):
+    """Move a freshly written file over its target unless they are identical."""
+    if target.exists() and target.read_bytes() == temporary.read_bytes():
+        temporary.unlink()
+        return False
+    os.replace(temporary, target)
+    return True
+
+
+def write_shards(public_dir, entries, max_urls=MAX_URLS, max_bytes=MAX_BYTES):
+    """Stream (url, lastmod) entries into sitemap-N.xml files; returns their names."""
+    public_dir = Path(public_dir)
+    names = []
+    shard = None
+    count = size = 0
+
+    def close():
+        shard.write(URLSET_TAIL)
+        shard.close()
+        _replace_if_changed(Path(shard.name), public_dir / names[-1])
+
+    for url, lastmod in entries:
+        line = f"<url><loc>{escape(url)}</loc><lastmod>{lastmod}</lastmod></url>\n"
+        # The limit is on the UTF-8 file, and URLs may hold non-ASCII characters.
+        line_bytes = len(line.encode())
+        if shard is None or count >= max_urls or size + line_bytes + len(URLSET_TAIL) > max_bytes:
+            if shard is not None:
+                close()
+            names.append(f"sitemap-{len(names)}.xml")
+            shard = open(public_dir / f"{names[-1]}.tmp", "w", encoding="utf-8")
+            shard.write(URLSET_HEAD)
+            count, size = 0, len(URLSET_HEAD)
+        shard.write(line)
+        count += 1
+        size += line_bytes
+    if shard is not None:
+        close()
+    for stale in public_dir.iterdir():
+        if SHARD_RE.match(stale.name) and stale.name not in names:
+            stale.unlink()
+    return names
+
+
+def write_index(public_dir, base_url, names):
+    """Write sitemap.xml listing the shards."""
+    public_dir = Path(public_dir)
+    temporary = public_dir / "sitemap.xml.tmp"
+    with open(temporary, "w", encoding="utf-8") as index:
+        index.write(f'<?xml version="1.0" encoding="UTF-8"?>\n<sitemapindex xmlns="{XMLNS}">\n')
+        for name in names:
+            index.write(f"<sitemap><loc>{escape(base_url)}/{name}</loc></sitemap>\n")
+        index.write("</sitemapindex>\n")
+    _replace_if_changed(temporary, public_dir / "sitemap.xml")
+
+
+def generate(public_dir, base_url, routes=None, manifest_path=MANIFEST_FILE):
+    """Regenerate the sitemap of an export; returns (urls, changed urls, shards)."""
+    from Guia_landing.deterministic import source_date
+
+    routes = registered_routes() if routes is None else routes
+    manifest = load_manifest(manifest_path)
+    before = {url: entry["hash"] for url, entry in manifest.items()}
+    when = source_date().strftime("%Y-%m-%dT%H:%M:%SZ")
+    names = write_shards(
+        public_dir, update_entries(public_dir, routes, base_url, manifest, when)
+    )
+    write_index(public_dir, base_url, names)
+    Path(manifest_path).write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+    changed = sum(1 for url, entry in manifest.items() if before.get(url) != entry["hash"])
+    return len(manifest), changed, names
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(
+        prog="python -m Guia_landing.sitemap", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument("public_dir", nargs="?", default="public")
+    parser.add_argument("--base-url", help="absolute site URL (default: deploy_url)")
+    parser.add_argument("--manifest", default=str(MANIFEST_FILE))
+    args = parser.parse_args(argv)
+    if not Path(args.public_dir).is_dir():
+        parser.error(f"{args.public_dir} is not a directory")
+    base_url = args.base_url
+    if base_url is None:
+        from reflex.config import get_config
+
+        base_url = get_config().deploy_url or ""
+    urls, changed, names = generate(
+        args.public_dir, base_url.rstrip("/"), manifest_path=args.manifest
+    )
+    print(f"sitemap: {urls} URLs in {len(names)} files, {changed} changed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
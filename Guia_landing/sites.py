@@ -0,0 +1,112 @@
+"""Per-site content of the landing page template.
+
+Every site is one JSON (or YAML, when PyYAML is installed) file in sites/;
+its file name is the site's slug. Files are validated against SCHEMA when
+loaded and cached until they change on disk.
+"""
+
+import functools
+import json
+import re
+from pathlib import Path
+
+SITES_DIR = Path("sites")
+
+DEFAULT_SITE = SITES_DIR / "servicepro.json"
+
+SUFFIXES = (".json", ".yaml", ".yml")
+
+SLUG_RE = re.compile(r"^[a-z0-9][a-z0-9-]*$")
+
+# A dict is an object with exactly these keys, a one-item list is a non-empty
+# list of that item, and a type is a leaf value of that type.
+SCHEMA = {
+    "brand": str,
+    "tagline": str,
+    "hero": {"title": str, "image": str},
+    "services": [{"icon": str, "icon_alt": str, "title": str, "description": str}],
+    "process": [{"title": str, "description": str}],
+    "contact": {"email": str, "phone": str, "website": str},
+    "social": [{"name": str, "icon": str, "url": str}],
+    "copyright_year": int,
+}
+
+
+class SiteError(ValueError):
+    """Raised when a site file is missing, unreadable or does not match SCHEMA."""
+
+
+def validate(value, schema=SCHEMA, where="site"):
+    """Check a parsed site file against a schema, raising SiteError on mismatch."""
+    if isinstance(schema, dict):
+        if not isinstance(value, dict):
+            raise SiteError(f"{where}: expected an object")
+        missing = schema.keys() - value.keys()
+        unknown = value.keys() - schema.keys()
+        if missing:
+            raise SiteError(f"{where}: missing {', '.join(sorted(missing))}")
+        if unknown:
+            raise SiteError(f"{where}: unknown {', '.join(sorted(unknown))}")
+        for key, item_schema in schema.items():
+            validate(value[key], item_schema, f"{where}.{key}")
+    elif isinstance(schema, list):
+        if not isinstance(value, list) or not value:
+            raise SiteError(f"{where}: expected a non-empty list")
+        for index, item in enumerate(value):
+            validate(item, schema[0], f"{where}[{index}]")
+    elif not isinstance(value, schema) or isinstance(value, bool):
+        raise SiteError(f"{where}: expected {schema.__name__}")
+    elif schema is str and not value.strip():
+        raise SiteError(f"{where}: must not be empty")
+    return value
+
+
+def _parse(path):
+    """Parse a site file according to its suffix."""
+    text = path.read_text(encoding="utf-8")
+    if path.suffix == ".json":
+        return json.loads(text)
+    try:
+        import yaml
+    except ImportError:
+        raise SiteError(f"{path}: reading YAML site files needs PyYAML") from None
+    return yaml.safe_load(text)
+
+
+@functools.lru_cache(maxsize=None)
+def _load(path, mtime_ns):
+    """Parse and validate a site file; cached per path and modification time."""
+    try:
+        return validate(_parse(path), where=path.name)
+    except (OSError, ValueError) as error:
+        if isinstance(error, SiteError):
+            raise
+        raise SiteError(f"{path}: {error}") from error
+
+
+def load_site(path=DEFAULT_SITE):
+    """Return the validated content of a site file.
+
+    The result is shared between callers and must not be modified.
+    """
+    path = Path(path)
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError as error:
+        raise SiteError(f"{path}: {error.strerror}") from None
+    return _load(path, mtime_ns)
+
+
+def site_slug(path):
+    """Return the slug (and route) of a site file."""
+    slug = Path(path).stem
+    if not SLUG_RE.match(slug):
+        raise SiteError(f"{path}: file name must be a lowercase slug")
+    return slug
+
+
+def site_files(sites_dir=SITES_DIR):
+    """Return the site files of a directory, sorted by slug."""
+    return sorted(
+        path for path in Path(sites_dir).iterdir() if path.suffix in SUFFIXES
+    )
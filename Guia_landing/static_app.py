@@ -0,0 +1,64 @@
+"""An rx.App that can be marked static: exported without any backend code.
+
+Set ``static_app=True`` in rxconfig.py for an app that is only ever
+exported with ``reflex export --frontend-only`` and hosted as files. After
+each compile, StaticApp writes static_state.js over .web/utils/state.js.
+That runtime has the same exports but no socket.io client, event queue,
+hydrate or on_load events and no frontend error reporting. The exported
+pages therefore never try to reach a backend. Frontend-only events
+(redirects, call_script, storage, focus) still work.
+
+A static app must not use rx.State: compiling one raises StaticAppError.
+With static_app off, the stock state.js of the installed Reflex is put back.
+"""
+
+import shutil
+from pathlib import Path
+
+import reflex as rx
+from reflex import constants
+from reflex.config import get_config
+from reflex.utils import console, prerequisites
+
+STATIC_RUNTIME = Path(__file__).with_name("static_state.js")
+
+STATE_MODULE = Path("utils") / "state.js"
+
+
+class StaticAppError(RuntimeError):
+    """Raised when an app marked static needs a backend."""
+
+
+def is_static():
+    """Return whether rxconfig.py marks the app as static."""
+    return bool(getattr(get_config(), "static_app", False))
+
+
+def install_runtime(static, web_dir=None):
+    """Put the static or the stock state.js in the web directory; returns whether it changed."""
+    web_dir = Path(web_dir or prerequisites.get_web_dir())
+    target = web_dir / STATE_MODULE
+    source = STATIC_RUNTIME if static else Path(constants.Templates.Dirs.WEB_TEMPLATE) / STATE_MODULE
+    if not target.parent.is_dir():
+        return False
+    if target.exists() and target.read_bytes() == source.read_bytes():
+        return False
+    shutil.copyfile(source, target)
+    return True
+
+
+class StaticApp(rx.App):
+    """An app whose frontend talks to a backend only when it is not marked static."""
+
+    def _compile(self, export=False):
+        static = is_static()
+        if static and self.state is not None:
+            raise StaticAppError(
+                "static_app=True in rxconfig.py, but the app uses rx.State or on_load "
+                "events; turn static_app off to export it with its backend."
+            )
+        super()._compile(export=export)
+        if install_runtime(static):
+            console.info(
+                "Installed the static runtime (no backend)." if static else "Restored the Reflex runtime."
+            )
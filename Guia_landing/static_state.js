@@ -0,0 +1,257 @@
+// Runtime of a static Reflex app: no backend, websocket, event queue or state hydration.
+// Written over .web/utils/state.js by Guia_landing.static_app; it keeps the exports of
+// Reflex 0.6's state.js so generated pages compile unchanged, and applies the
+// frontend-only events (redirects, scripts, storage, focus) directly.
+import Router from "next/router";
+import debounce from "/utils/helpers/debounce";
+import throttle from "/utils/helpers/throttle";
+
+// Dictionary holding component references.
+export const refs = {};
+
+/**
+ * Generate a UUID.
+ * @returns A UUID.
+ */
+export const generateUUID = () =>
+  typeof crypto !== "undefined" && crypto.randomUUID
+    ? crypto.randomUUID()
+    : "xxxxxxxx-xxxx-4xxx-yxxx-xxxxxxxxxxxx".replace(/[xy]/g, (c) => {
+        const r = (Math.random() * 16) | 0;
+        return (c == "x" ? r : (r & 0x3) | 0x8).toString(16);
+      });
+
+// There is no backend session in a static app.
+export const getToken = () => undefined;
+
+export const getBackendURL = (url_str) => new URL(url_str);
+
+export const isStateful = () => false;
+
+export const applyDelta = (state, delta) => ({ ...state, ...delta });
+
+export const evalReactComponent = async () => {
+  throw new Error("Dynamic components need the Reflex backend.");
+};
+
+export const queueEventIfSocketExists = async () => {};
+
+/**
+ * Apply a frontend event; events for backend handlers are dropped.
+ * @param event The event to apply.
+ * @returns False, since nothing is ever sent to a backend.
+ */
+export const applyEvent = async (event) => {
+  const payload = event.payload;
+  switch (event.name) {
+    case "_redirect":
+      if (payload.external) {
+        window.open(payload.path, "_blank");
+      } else if (payload.replace) {
+        Router.replace(payload.path);
+      } else {
+        Router.push(payload.path);
+      }
+      break;
+    case "_console":
+      console.log(payload.message);
+      break;
+    case "_remove_cookie":
+      document.cookie = `${payload.key}=; Max-Age=0; path=${payload.options?.path ?? "/"}`;
+      break;
+    case "_clear_local_storage":
+      localStorage.clear();
+      break;
+    case "_remove_local_storage":
+      localStorage.removeItem(payload.key);
+      break;
+    case "_clear_session_storage":
+      sessionStorage.clear();
+      break;
+    case "_remove_session_storage":
+      sessionStorage.removeItem(payload.key);
+      break;
+    case "_set_clipboard":
+      navigator.clipboard.writeText(payload.content);
+      break;
+    case "_download": {
+      const a = document.createElement("a");
+      a.hidden = true;
+      a.href = payload.url;
+      a.download = payload.filename;
+      a.click();
+      a.remove();
+      break;
+    }
+    case "_alert":
+      alert(payload.message);
+      break;
+    case "_set_focus": {
+      const ref = payload.ref in refs ? refs[payload.ref] : payload.ref;
+      ref.current.focus();
+      break;
+    }
+    case "_set_value": {
+      const ref = payload.ref in refs ? refs[payload.ref] : payload.ref;
+      if (ref.current) {
+        ref.current.value = payload.value;
+      }
+      break;
+    }
+    case "_call_script":
+      try {
+        const result = eval(payload.javascript_code);
+        if (payload.callback) {
+          eval(payload.callback)(
+            !!result && typeof result.then === "function" ? await result : result
+          );
+        }
+      } catch (e) {
+        console.log("_call_script", e);
+      }
+      break;
+  }
+  return false;
+};
+
+export const applyRestEvent = async () => false;
+
+/**
+ * Apply events in order; there is no queue to wait on.
+ * @param events Array of events to apply.
+ */
+export const queueEvents = async (events) => {
+  for (const event of events) {
+    await applyEvent(event);
+  }
+};
+
+export const processEvent = async () => {};
+
+export const connect = async () => {};
+
+export const uploadFiles = async () => {
+  throw new Error("File uploads need the Reflex backend.");
+};
+
+/**
+ * Create an event object.
+ * @param {string} name The name of the event.
+ * @param {Object.<string, Any>} payload The payload of the event.
+ * @param {Object.<string, (number|boolean)>} event_actions The actions to take on the event.
+ * @param {string} handler The client handler to process event.
+ * @returns The event object.
+ */
+export const Event = (name, payload = {}, event_actions = {}, handler = null) => {
+  return { name, payload, handler, event_actions };
+};
+
+export const hydrateClientStorage = () => ({});
+
+/**
+ * Handle the events of a page without a backend.
+ * @returns [addEvents, connectErrors] - connectErrors is always empty.
+ */
+export const useEventLoop = () => {
+  const addEvents = (events, args, event_actions) => {
+    if (!(args instanceof Array)) {
+      args = [args];
+    }
+
+    event_actions = events.reduce(
+      (acc, e) => ({ ...acc, ...e.event_actions }),
+      event_actions ?? {}
+    );
+
+    const _e = args.filter((o) => o?.preventDefault !== undefined)[0];
+
+    if (event_actions?.preventDefault && _e?.preventDefault) {
+      _e.preventDefault();
+    }
+    if (event_actions?.stopPropagation && _e?.stopPropagation) {
+      _e.stopPropagation();
+    }
+    const combined_name = events.map((e) => e.name).join("+++");
+    if (event_actions?.throttle) {
+      if (!throttle(combined_name, event_actions.throttle)) {
+        return;
+      }
+    }
+    if (event_actions?.debounce) {
+      debounce(combined_name, () => queueEvents(events), event_actions.debounce);
+    } else {
+      queueEvents(events);
+    }
+  };
+
+  return [addEvents, []];
+};
+
+/***
+ * Check if a value is truthy in python.
+ * @param val The value to check.
+ * @returns True if the value is truthy, false otherwise.
+ */
+export const isTrue = (val) => {
+  if (Array.isArray(val)) return val.length > 0;
+  if (val === Object(val)) return Object.keys(val).length > 0;
+  return Boolean(val);
+};
+
+/**
+ * Get the value from a ref.
+ * @param ref The ref to get the value from.
+ * @returns The value.
+ */
+export const getRefValue = (ref) => {
+  if (!ref || !ref.current) {
+    return;
+  }
+  if (ref.current.type == "checkbox") {
+    return ref.current.checked;
+  } else if (
+    ref.current.className?.includes("rt-CheckboxRoot") ||
+    ref.current.className?.includes("rt-SwitchRoot")
+  ) {
+    return ref.current.ariaChecked == "true";
+  } else if (ref.current.className?.includes("rt-SliderRoot")) {
+    return ref.current.querySelector(".rt-SliderThumb")?.ariaValueNow;
+  } else {
+    return (
+      ref.current.value ||
+      (ref.current.querySelector &&
+        ref.current.querySelector(":checked") &&
+        ref.current.querySelector(":checked")?.value)
+    );
+  }
+};
+
+/**
+ * Get the values from a ref array.
+ * @param refs The refs to get the values from.
+ * @returns The values array.
+ */
+export const getRefValues = (refs) => {
+  if (!refs) {
+    return;
+  }
+  return refs.map((ref) =>
+    ref.current ? ref.current.value || ref.current.getAttribute("aria-valuenow") : null
+  );
+};
+
+/**
+ * Spread two arrays or two objects.
+ * @param first The first array or object.
+ * @param second The second array or object.
+ * @returns The final merged array or object.
+ */
+export const spreadArraysOrObjects = (first, second) => {
+  if (Array.isArray(first) && Array.isArray(second)) {
+    return [...first, ...second];
+  } else if (typeof first === "object" && typeof second === "object") {
+    return { ...first, ...second };
+  } else {
+    throw new Error("Both parameters must be either arrays or objects.");
+  }
+};
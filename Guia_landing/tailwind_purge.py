@@ -0,0 +1,184 @@
+"""Build-time purge of Tailwind down to the class names used by the page.
+
+The class names come from the component tree Reflex renders, and the CSS is
+generated from them: arbitrary-value utilities such as h-[50vh] are built
+here, which covers every class the page uses today. No copy of the Tailwind
+stylesheet is checked in, so other utilities are only purged from a source
+stylesheet passed explicitly. Otherwise they are reported and left to the
+stylesheets Reflex emits, and the output never depends on files that may or
+may not exist at build time.
+"""
+
+import re
+from pathlib import Path
+
+import reflex as rx
+from reflex.utils import console
+
+from Guia_landing.css import blocks, split_top_level, strip_comments
+
+# Stylesheet the page used to load from the CDN.
+TAILWIND_CDN = "https://cdn.jsdelivr.net/npm/tailwindcss@2.2.19/dist/tailwind.min.css"
+
+# Responsive variants, using the same min-widths as the Tailwind defaults.
+SCREENS = {
+    "sm": "640px",
+    "md": "768px",
+    "lg": "1024px",
+    "xl": "1280px",
+    "2xl": "1536px",
+}
+
+PSEUDO_VARIANTS = {"hover", "focus", "active", "visited"}
+
+# Arbitrary value utilities (e.g. h-[50vh]) and the properties they set.
+ARBITRARY_UTILITIES = {
+    "h": ("height",),
+    "w": ("width",),
+    "min-h": ("min-height",),
+    "max-h": ("max-height",),
+    "min-w": ("min-width",),
+    "max-w": ("max-width",),
+    "p": ("padding",),
+    "px": ("padding-left", "padding-right"),
+    "py": ("padding-top", "padding-bottom"),
+    "pt": ("padding-top",),
+    "pr": ("padding-right",),
+    "pb": ("padding-bottom",),
+    "pl": ("padding-left",),
+    "m": ("margin",),
+    "mx": ("margin-left", "margin-right"),
+    "my": ("margin-top", "margin-bottom"),
+    "mt": ("margin-top",),
+    "mr": ("margin-right",),
+    "mb": ("margin-bottom",),
+    "ml": ("margin-left",),
+    "gap": ("gap",),
+    "inset": ("inset",),
+    "top": ("top",),
+    "right": ("right",),
+    "bottom": ("bottom",),
+    "left": ("left",),
+    "z": ("z-index",),
+    "opacity": ("opacity",),
+    "leading": ("line-height",),
+    "tracking": ("letter-spacing",),
+}
+
+ARBITRARY_RE = re.compile(r"^(?P<utility>[a-z-]+?)-\[(?P<value>[^\]]+)\]$")
+
+
+def collect_class_names(component, found=None):
+    """Return the set of literal class names used anywhere in a component tree."""
+    found = set() if found is None else found
+    if isinstance(component.class_name, str):
+        found.update(component.class_name.split())
+    for child in component.children:
+        if isinstance(child, rx.Component):
+            collect_class_names(child, found)
+    return found
+
+
+def escape_class(class_name):
+    """Escape a class name for use in a CSS selector."""
+    return re.sub(r"([^a-zA-Z0-9_-])", r"\\\1", class_name)
+
+
+def _split_variants(class_name):
+    """Split 'md:hover:h-[50vh]' into its variants and base utility."""
+    *variants, base = class_name.split(":")
+    return variants, base
+
+
+def _arbitrary_rule(class_name):
+    """Generate the rule for an arbitrary value utility, or None if unsupported."""
+    variants, base = _split_variants(class_name)
+    match = ARBITRARY_RE.match(base)
+    if not match or match["utility"] not in ARBITRARY_UTILITIES:
+        return None
+    media = [SCREENS[v] for v in variants if v in SCREENS]
+    pseudo = [v for v in variants if v in PSEUDO_VARIANTS]
+    if len(media) + len(pseudo) != len(variants) or len(media) > 1:
+        return None
+    value = match["value"].replace("_", " ")
+    declarations = ";".join(
+        f"{prop}:{value}" for prop in ARBITRARY_UTILITIES[match["utility"]]
+    )
+    selector = "." + escape_class(class_name) + "".join(f":{p}" for p in pseudo)
+    rule = f"{selector}{{{declarations}}}"
+    if media:
+        rule = f"@media (min-width:{media[0]}){{{rule}}}"
+    return rule
+
+
+def purge_css(css, class_names):
+    """Keep only the rules of a stylesheet whose selectors use the given classes."""
+    css = strip_comments(css)
+    patterns = [
+        re.compile(r"\." + re.escape(escape_class(name)) + r"(?![\w-])")
+        for name in class_names
+    ]
+    kept = []
+    for prelude, body in blocks(css):
+        if body is None:
+            continue
+        if prelude.startswith("@media"):
+            inner = purge_css(body, class_names)
+            if inner:
+                kept.append(f"{prelude}{{{inner}}}")
+        elif not prelude.startswith("@"):
+            selectors = [
+                selector
+                for selector in split_top_level(prelude, ",")
+                if any(pattern.search(selector) for pattern in patterns)
+            ]
+            if selectors:
+                kept.append(f"{','.join(selectors)}{{{body}}}")
+    return "".join(kept)
+
+
+def build_utilities(class_names, source=None):
+    """Build the CSS for the used class names and report the ones left unresolved.
+
+    Names that are not arbitrary-value utilities are purged from source, if given.
+    """
+    rules = []
+    unresolved = []
+    for class_name in sorted(class_names):
+        rule = _arbitrary_rule(class_name)
+        if rule is None:
+            unresolved.append(class_name)
+        else:
+            rules.append(rule)
+    if unresolved and source is not None:
+        purged = purge_css(Path(source).read_text(), unresolved)
+        rules.append(purged)
+        unresolved = [
+            name for name in unresolved if f".{escape_class(name)}" not in purged
+        ]
+    return "".join(rules), unresolved
+
+
+def _replace_cdn_link(component, replacement):
+    """Swap the Tailwind CDN <link> in a tree for the given component."""
+    for index, child in enumerate(component.children):
+        if not isinstance(child, rx.Component):
+            continue
+        href = getattr(child, "href", None)
+        if child.tag == "link" and TAILWIND_CDN in str(href):
+            component.children[index] = replacement
+            return True
+        if _replace_cdn_link(child, replacement):
+            return True
+    return False
+
+
+def inline_tailwind(component, source=None):
+    """Replace the Tailwind CDN stylesheet with inlined critical CSS for the used classes."""
+    css, unresolved = build_utilities(collect_class_names(component), source)
+    if unresolved:
+        console.warn(
+            "Tailwind classes left to the app stylesheet: " + ", ".join(unresolved)
+        )
+    _replace_cdn_link(component, rx.el.style(css))
+    return component
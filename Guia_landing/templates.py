@@ -0,0 +1,116 @@
+"""Build-once templates for the component helpers that are called repeatedly.
+
+Decorating a helper with @template("field", ...) builds its subtree once with
+placeholder strings in the listed text fields; every call then copies that
+subtree and substitutes the placeholders with the call's values. The other
+arguments (icon names, hover styles) change the structure of the subtree, so
+each distinct combination of them gets its own template. Copies share the
+template's Vars, which are immutable, and only duplicate components and
+containers.
+"""
+
+import functools
+import inspect
+import json
+
+from reflex.components.component import Component
+from reflex.vars.base import LiteralVar, Var
+
+PLACEHOLDER = "__template_{}__"
+
+
+def clone(value):
+    """Copy the components and containers of a tree, sharing its immutable Vars."""
+    if isinstance(value, Component):
+        copied = object.__new__(type(value))
+        object.__setattr__(
+            copied, "__dict__", {name: clone(item) for name, item in vars(value).items()}
+        )
+        object.__setattr__(copied, "__fields_set__", set(value.__fields_set__))
+        return copied
+    if isinstance(value, dict):
+        # Style is a dict subclass whose __init__ reprocesses values; skip it.
+        copied = dict.__new__(type(value))
+        dict.update(copied, {key: clone(item) for key, item in value.items()})
+        if hasattr(value, "__dict__"):
+            copied.__dict__.update(vars(value))
+        return copied
+    if isinstance(value, list):
+        return [clone(item) for item in value]
+    if isinstance(value, set):
+        return set(value)
+    return value
+
+
+def _substitute(value, values):
+    """Return value with every placeholder replaced; containers are updated in place."""
+    if isinstance(value, str):
+        for placeholder, replacement in values.items():
+            if placeholder in value:
+                value = value.replace(placeholder, replacement)
+        return value
+    if isinstance(value, Var):
+        literal = getattr(value, "_var_value", None)
+        if isinstance(literal, str):
+            replaced = _substitute(literal, values)
+            if replaced != literal:
+                return LiteralVar.create(replaced)
+        return value
+    if isinstance(value, Component):
+        return fill(value, values)
+    if isinstance(value, dict):
+        for key, item in value.items():
+            replaced = _substitute(item, values)
+            if replaced is not item:
+                dict.__setitem__(value, key, replaced)
+        return value
+    if isinstance(value, list):
+        value[:] = [_substitute(item, values) for item in value]
+        return value
+    return value
+
+
+def fill(component, values):
+    """Replace the placeholders of a cloned template tree in place."""
+    attributes = vars(component)
+    for name, value in attributes.items():
+        replaced = _substitute(value, values)
+        if replaced is not value:
+            attributes[name] = replaced
+    return component
+
+
+def _key(arguments):
+    """Return a hashable key for the structural arguments of a call."""
+    return json.dumps(arguments, sort_keys=True, default=repr)
+
+
+def template(*fields):
+    """Build a helper once per structure and fill its text fields per call."""
+
+    def decorator(helper):
+        signature = inspect.signature(helper)
+        built = {}
+
+        @functools.wraps(helper)
+        def instantiate(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            values = {}
+            for field in fields:
+                value = arguments.pop(field)
+                if not isinstance(value, str):
+                    # Vars and components are not text; build them directly.
+                    return helper(*args, **kwargs)
+                values[PLACEHOLDER.format(field)] = value
+            key = _key(arguments)
+            if key not in built:
+                placeholders = {field: PLACEHOLDER.format(field) for field in fields}
+                built[key] = helper(**arguments, **placeholders)
+            return fill(clone(built[key]), values)
+
+        instantiate.templates = built
+        return instantiate
+
+    return decorator
@@ -0,0 +1,277 @@
+"""Same-origin, content-hashed copies of the third-party files the page uses.
+
+    python -m Guia_landing.vendor_assets fetch [--sites sites] [--update]
+
+downloads every external stylesheet, script, font and image the pages
+reference into the cache vendor/assets/ and records each URL with the
+SHA-384 of its content in vendor/assets.lock.json. Commit both: the cache
+is a build input, and the build never fetches. Run fetch by hand when a
+page references a new URL, or with --update to pick up new content for an
+unpinned URL. Without --update, fetch also restores cached files missing
+from the checkout, checked against the lock.
+
+With GUIA_VENDOR_ASSETS=1 the build resolves those URLs against the cache
+only, never the network. Each file is written to assets/vendor/ under a
+content-hashed name and served as /vendor/<name>. Its references are
+rewritten, <link> and <script> get an integrity attribute, and URLs inside
+vendored stylesheets are vendored the same way. A reference without a
+cache entry matching the lock file fails the build.
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import re
+import sys
+import urllib.request
+from pathlib import Path, PurePosixPath
+from urllib.parse import urljoin, urlsplit
+
+import reflex as rx
+from reflex.components.component import Component
+from reflex.utils import console
+from reflex.vars.base import LiteralVar, Var
+
+CACHE_DIR = Path("vendor") / "assets"
+
+LOCK_FILE = Path("vendor") / "assets.lock.json"
+
+# Below the assets directory, so the export serves it as /vendor/.
+OUTPUT_DIR = "vendor"
+
+EXTERNAL_RE = re.compile(r"^https?://", re.I)
+
+# url(...) and @import "..." references inside CSS text.
+CSS_URL_RE = re.compile(r"""url\(\s*(['"]?)([^'")\s]+)\1\s*\)|@import\s+(['"])([^'"]+)\3""")
+
+# Element props that load a resource, by tag.
+ASSET_PROPS = {"link": "href", "script": "src", "img": "src", "source": "src"}
+
+# Elements that accept Subresource Integrity.
+INTEGRITY_TAGS = {"link", "script"}
+
+FETCH_TIMEOUT = 30
+
+
+class VendorError(ValueError):
+    """Raised when external references have no verified copy in the cache."""
+
+
+MISSING_HINT = (
+    "Run `python -m Guia_landing.vendor_assets fetch` and commit vendor/assets/ "
+    "and vendor/assets.lock.json."
+)
+
+
+def integrity(data):
+    """Return the SHA-384 Subresource Integrity value of some content."""
+    return "sha384-" + base64.b64encode(hashlib.sha384(data).digest()).decode()
+
+
+def cache_name(url):
+    """Return the path of a URL inside the cache directory."""
+    parts = urlsplit(url)
+    path = parts.path.lstrip("/") or "index"
+    if path.endswith("/"):
+        path += "index"
+    if parts.query:
+        path += "-" + hashlib.sha1(parts.query.encode()).hexdigest()[:8]
+    return f"{parts.netloc}/{path}"
+
+
+class AssetCache:
+    """The checked-in copies of external files and their lock file."""
+
+    def __init__(self, cache_dir=CACHE_DIR, lock_file=LOCK_FILE, fetch=False, update=False):
+        self.cache_dir = Path(cache_dir)
+        self.lock_file = Path(lock_file)
+        self.fetch = fetch
+        self.update = update
+        self.lock = json.loads(self.lock_file.read_text()) if self.lock_file.exists() else {}
+        self.fetched = set()
+
+    def _download(self, url, expected=None):
+        """Download a URL into the cache and lock it; returns its content.
+
+        With an expected integrity, content that differs from it is refused.
+        """
+        request = urllib.request.Request(url, headers={"User-Agent": "Guia_landing.vendor_assets"})
+        with urllib.request.urlopen(request, timeout=FETCH_TIMEOUT) as response:
+            data = response.read()
+        if expected is not None and integrity(data) != expected:
+            raise VendorError(
+                f"{url} changed since it was locked in {self.lock_file}; "
+                "run `python -m Guia_landing.vendor_assets fetch --update` to accept it."
+            )
+        name = cache_name(url)
+        path = self.cache_dir / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        self.lock[url] = {"file": name, "integrity": integrity(data)}
+        self.fetched.add(url)
+        return data
+
+    def get(self, url):
+        """Return the verified cached content of a URL, or None."""
+        entry = self.lock.get(url)
+        if self.fetch and url not in self.fetched:
+            if entry is None or self.update:
+                return self._download(url)
+            if not (self.cache_dir / entry["file"]).is_file():
+                return self._download(url, expected=entry["integrity"])
+        if entry is None:
+            return None
+        path = self.cache_dir / entry["file"]
+        if not path.is_file():
+            return None
+        data = path.read_bytes()
+        if integrity(data) != entry["integrity"]:
+            raise VendorError(f"{path} does not match its entry in {self.lock_file}.")
+        return data
+
+    def save(self):
+        """Write the lock file, sorted so that it diffs cleanly."""
+        self.lock_file.parent.mkdir(parents=True, exist_ok=True)
+        self.lock_file.write_text(json.dumps(self.lock, indent=2, sort_keys=True) + "\n")
+
+
+class AssetVendor:
+    """Rewrites external references to hashed same-origin copies."""
+
+    def __init__(self, cache=None, assets_dir="assets"):
+        self.cache = cache or AssetCache()
+        self.output_dir = Path(assets_dir) / OUTPUT_DIR
+        # URL -> (same-origin URL, integrity), or None when unresolved.
+        self.resolved = {}
+        self.missing = set()
+
+    def vendor(self, url):
+        """Copy the cached file of a URL to the output; returns (local URL, integrity) or None."""
+        if url in self.resolved:
+            return self.resolved[url]
+        self.resolved[url] = None
+        data = self.cache.get(url)
+        if data is None:
+            self.missing.add(url)
+            return None
+        suffix = PurePosixPath(urlsplit(url).path).suffix
+        if suffix == ".css":
+            data = self.rewrite_css(data.decode(), url).encode()
+        stem = PurePosixPath(urlsplit(url).path).stem or "index"
+        name = f"{stem}.{hashlib.sha256(data).hexdigest()[:12]}{suffix}"
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        path = self.output_dir / name
+        if not path.exists() or path.read_bytes() != data:
+            path.write_bytes(data)
+        self.resolved[url] = (f"/{OUTPUT_DIR}/{name}", integrity(data))
+        return self.resolved[url]
+
+    def rewrite_css(self, text, base=None):
+        """Point the external url() and @import references of CSS at local copies."""
+
+        def replace(match):
+            target = match.group(2) or match.group(4)
+            if target.startswith(("data:", "#")):
+                return match.group(0)
+            url = urljoin(base, target) if base else target
+            if not EXTERNAL_RE.match(url):
+                return match.group(0)
+            local = self.vendor(url)
+            if local is None:
+                return match.group(0)
+            return match.group(0).replace(target, local[0])
+
+        return CSS_URL_RE.sub(replace, text)
+
+    def _rewrite(self, value):
+        """Return a value with the CSS references of its strings rewritten."""
+        if isinstance(value, str):
+            return self.rewrite_css(value) if "url(" in value or "@import" in value else value
+        if isinstance(value, Var):
+            literal = getattr(value, "_var_value", None)
+            if isinstance(literal, str):
+                replaced = self._rewrite(literal)
+                if replaced != literal:
+                    return LiteralVar.create(replaced)
+            return value
+        if isinstance(value, Component):
+            self.rewrite(value)
+            return value
+        if isinstance(value, dict):
+            for key, item in value.items():
+                replaced = self._rewrite(item)
+                if replaced is not item:
+                    dict.__setitem__(value, key, replaced)
+            return value
+        if isinstance(value, list):
+            value[:] = [self._rewrite(item) for item in value]
+            return value
+        return value
+
+    def rewrite(self, component):
+        """Rewrite the external references of a component tree in place."""
+        attributes = vars(component)
+        prop = ASSET_PROPS.get(component.tag)
+        url = getattr(attributes.get(prop), "_var_value", None) if prop else None
+        if isinstance(url, str) and EXTERNAL_RE.match(url):
+            local = self.vendor(url)
+            if local is not None:
+                attributes[prop] = LiteralVar.create(local[0])
+                if component.tag in INTEGRITY_TAGS:
+                    attributes["integrity"] = LiteralVar.create(local[1])
+        for name, value in attributes.items():
+            if name != prop:
+                replaced = self._rewrite(value)
+                if replaced is not value:
+                    attributes[name] = replaced
+        return component
+
+
+def vendor_assets(component, vendor=None):
+    """Serve every external asset of a page from a hashed same-origin copy."""
+    vendor = vendor or AssetVendor()
+    vendor.rewrite(component)
+    if vendor.missing:
+        raise VendorError(
+            "No verified copy in the asset cache for: "
+            + ", ".join(sorted(vendor.missing))
+            + ". "
+            + MISSING_HINT
+        )
+    console.info(f"Vendored {len(vendor.resolved)} external assets.")
+    return component
+
+
+def main(argv=None):
+    """Command line entry point."""
+    from Guia_landing import codigo_pagina
+    from Guia_landing.sites import load_site, site_files
+
+    parser = argparse.ArgumentParser(
+        prog="python -m Guia_landing.vendor_assets", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument("command", choices=["fetch"])
+    parser.add_argument("--sites", help="also fetch the assets of every site file of a directory")
+    parser.add_argument(
+        "--update", action="store_true", help="download every URL again, not just new ones"
+    )
+    args = parser.parse_args(argv)
+    cache = AssetCache(fetch=True, update=args.update)
+    vendor = AssetVendor(cache)
+    sites = [load_site()]
+    if args.sites:
+        sites += [load_site(path) for path in site_files(args.sites)]
+    try:
+        for site in sites:
+            vendor.rewrite(rx.box(codigo_pagina.create_page(site)))
+    finally:
+        cache.save()
+    for url in sorted(cache.fetched):
+        print(f"fetched {url}")
+    print(f"{len(cache.lock)} assets in {cache.lock_file}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""Zero-JavaScript export of the pages that have no state.
+
+With GUIA_ZERO_JS=1 every page that needs no client code is marked with a
+<meta name="guia-zero-js"> tag. A page needs client code when it has
+on_load events, event triggers, Vars bound to a state or hooks of its own.
+After the export::
+
+    python -m Guia_landing.zero_js public
+
+removes the Next.js runtime and page chunks (and their preloads) from the
+marked pages, leaving the prerendered HTML and CSS. Inline first-party
+scripts are kept: the theme script, the service worker registration and the
+analytics beacon. So is the inert __NEXT_DATA__ JSON, which carries the
+build ID. Unmarked pages keep their normal output.
+"""
+
+import argparse
+import re
+import sys
+from pathlib import Path
+
+from reflex.components.component import Component
+
+MARKER_NAME = "guia-zero-js"
+
+MARKER_META = {"name": MARKER_NAME, "content": "stateless"}
+
+MARKER_RE = re.compile(rf'<meta\b[^>]*name="{MARKER_NAME}"[^>]*/?>')
+
+NEXT_SCRIPT_RE = re.compile(r'<script\b[^>]*\bsrc="/_next/[^"]*"[^>]*>\s*</script>')
+
+SCRIPT_PRELOAD_RE = re.compile(r'<link\b(?=[^>]*\bas="script")[^>]*\bhref="/_next/[^"]*"[^>]*/?>')
+
+
+def needs_javascript(component, on_load=None):
+    """Return whether a page needs client code to work."""
+    if on_load:
+        return True
+    if _has_event_triggers(component) or component._get_all_hooks():
+        return True
+    for var in component._get_vars(include_children=True):
+        var_data = var._get_all_var_data()
+        if var_data and (var_data.state or var_data.hooks):
+            return True
+    return False
+
+
+def _has_event_triggers(component):
+    """Return whether a component or a descendant handles events."""
+    if component.event_triggers:
+        return True
+    return any(
+        _has_event_triggers(child) for child in component.children if isinstance(child, Component)
+    )
+
+
+def strip_javascript(html):
+    """Remove the Next.js scripts of a marked page; returns the HTML unchanged otherwise."""
+    if not MARKER_RE.search(html):
+        return html
+    html = MARKER_RE.sub("", html)
+    html = NEXT_SCRIPT_RE.sub("", html)
+    return SCRIPT_PRELOAD_RE.sub("", html)
+
+
+def strip_export(public_dir):
+    """Strip every marked page of an export; returns (pages stripped, pages seen)."""
+    stripped = seen = 0
+    for path in sorted(Path(public_dir).rglob("*.html")):
+        if path.relative_to(public_dir).parts[0] == "_next":
+            continue
+        seen += 1
+        html = path.read_text()
+        result = strip_javascript(html)
+        if result != html:
+            path.write_text(result)
+            stripped += 1
+    return stripped, seen
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(
+        prog="python -m Guia_landing.zero_js", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument("public_dir", nargs="?", default="public")
+    args = parser.parse_args(argv)
+    if not Path(args.public_dir).is_dir():
+        parser.error(f"{args.public_dir} is not a directory")
+    stripped, seen = strip_export(args.public_dir)
+    print(f"Removed the JavaScript runtime from {stripped} of {seen} pages")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,34 @@
-python -m venv .venv
+set -e
+if python -m Guia_landing.build_cache check; then
+    echo "Export inputs unchanged, skipping the build."
+    exit 0
+fi
+if [ ! -d .venv ]; then
+    python -m venv .venv
+fi
 source .venv/bin/activate
 pip install --upgrade pip
 pip install -r requirements.txt
-rm -rf public
-reflex init
-reflex export --frontend-only
-unzip frontend.zip -d public
-rm -f frontend.zip
+if [ ! -d .web ]; then
+    reflex init
+fi
+reflex export --frontend-only --no-zip
+# GUIA_SOURCE_MAPS=1 also reports which packages and components the chunks are made of,
+# then removes the maps so that deterministic.py hashes and public/ gets the plain chunks.
+case "$GUIA_SOURCE_MAPS" in
+    1|true|yes|on) python -m Guia_landing.bundle_report .web/_static --strip-maps ;;
+esac
+python -m Guia_landing.deterministic .web/_static
+python -m Guia_landing.build_cache sync .web/_static public
+python -m Guia_landing.sitemap public
+python -m Guia_landing.zero_js public
+python -m Guia_landing.postbuild public
+# GUIA_ANALYTICS=1 adds the beacon; the site must then be served by Guia_landing.serve --analytics-dir.
+case "$GUIA_ANALYTICS" in
+    1|true|yes|on) python -m Guia_landing.analytics public ;;
+esac
+python -m Guia_landing.service_worker public
+python -m Guia_landing.headers public --out-dir deploy
+python -m Guia_landing.budget public --budget budget.json
+python -m Guia_landing.build_cache record
 deactivate
-  
\ No newline at end of file
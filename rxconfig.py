@@ -2,4 +2,6 @@ import reflex as rx
 
 config = rx.Config(
     app_name="Guia_landing",
+    # Exported with --frontend-only and hosted as files: ship no backend client (static_app.py).
+    static_app=True,
 )
\ No newline at end of file
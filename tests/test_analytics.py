@@ -0,0 +1,86 @@
+import asyncio
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from Guia_landing import analytics
+
+ROOT = Path(__file__).resolve().parents[1]
+
+PAGE = "<!DOCTYPE html><html><head></head><body><main id=\"welcome\"></main></body></html>"
+
+
+@pytest.fixture
+def public(tmp_path):
+    public = tmp_path / "public"
+    (public / "about").mkdir(parents=True)
+    (public / "index.html").write_text(PAGE)
+    (public / "about" / "index.html").write_text(PAGE)
+    return public
+
+
+def _pages(public):
+    return {path: path.read_text() for path in sorted(public.rglob("*.html"))}
+
+
+def test_beacon_is_injected_before_the_body_end(public):
+    assert analytics.add_beacon(public / "index.html")
+    html = (public / "index.html").read_text()
+    assert html.endswith(analytics.beacon_script() + "</body></html>")
+    script = analytics.beacon_script()
+    assert f"<script {analytics.BEACON_MARKER}>" in script
+    assert f'navigator.sendBeacon("{analytics.BEACON_PATH}"' in script
+    assert json.dumps(analytics.SECTION_IDS, separators=(",", ":")) in script
+
+
+def test_rerunning_adds_the_beacon_once(public):
+    assert analytics.main([str(public)]) == 0
+    first = _pages(public)
+    assert all(html.count(analytics.BEACON_MARKER) == 1 for html in first.values())
+    assert analytics.main([str(public)]) == 0
+    assert _pages(public) == first
+
+
+def _build_step(public, value):
+    """Run the analytics step of remote_build.sh with GUIA_ANALYTICS set to value."""
+    script = (ROOT / "remote_build.sh").read_text()
+    step = re.search(r'case "\$GUIA_ANALYTICS" in.*?esac\n', script, re.S)[0]
+    env = {
+        **os.environ,
+        "PYTHONPATH": str(ROOT),
+        "PATH": f"{Path(sys.executable).parent}:{os.environ['PATH']}",
+    }
+    env.pop("GUIA_ANALYTICS", None)
+    if value is not None:
+        env["GUIA_ANALYTICS"] = value
+    subprocess.run(["bash", "-c", step], cwd=public.parent, env=env, check=True)
+
+
+@pytest.mark.parametrize("value", [None, "", "0", "false"])
+def test_build_leaves_pages_untouched_without_analytics(public, value):
+    before = _pages(public)
+    _build_step(public, value)
+    assert _pages(public) == before
+
+
+def test_build_adds_the_beacon_with_analytics(public):
+    _build_step(public, "1")
+    assert all(analytics.BEACON_MARKER in html for html in _pages(public).values())
+
+
+def test_collector_counts_known_events_into_daily_rollups(tmp_path):
+    collector = analytics.BeaconCollector(tmp_path)
+    body = json.dumps(["view:hero", "click:cta", "view:hero", "bogus", 3]).encode()
+    assert collector.record(body) == 3
+    assert collector.record(b"not json") == 0
+    asyncio.run(collector.flush())
+    collector.close()
+    (rollup,) = tmp_path.glob("*.json")
+    totals = json.loads(rollup.read_text())
+    assert totals["view:hero"] == 2
+    assert totals["click:cta"] == 1
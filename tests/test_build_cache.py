@@ -0,0 +1,36 @@
+import os
+
+from Guia_landing import build_cache
+
+
+def _write(path, text, mtime=None):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+
+def test_sync_tree_only_rewrites_changed_files(tmp_path):
+    source, target = tmp_path / "export", tmp_path / "public"
+    _write(source / "index.html", "hola")
+    _write(source / "_next" / "app.js", "app")
+    _write(source / "old" / "index.html", "old")
+    assert build_cache.sync_tree(source, target) == (3, 0)
+    for path in target.rglob("*"):
+        if path.is_file():
+            os.utime(path, (1, 1))
+    # Precompressed siblings, as the postbuild stage writes them.
+    for name in ("index.html.gz", "_next/app.js.br", "old/index.html.gz"):
+        _write(target / name, "compressed", mtime=1)
+
+    _write(source / "index.html", "adiós")
+    (source / "old" / "index.html").unlink()
+    (source / "old").rmdir()
+    assert build_cache.sync_tree(source, target) == (1, 3)
+
+    assert (target / "index.html").read_text() == "adiós"
+    assert (target / "index.html").stat().st_mtime != 1
+    assert not (target / "index.html.gz").exists()
+    assert (target / "_next" / "app.js").stat().st_mtime == 1
+    assert (target / "_next" / "app.js.br").exists()
+    assert not (target / "old").exists()
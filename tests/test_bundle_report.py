@@ -0,0 +1,24 @@
+import json
+
+from Guia_landing import bundle_report, deterministic
+
+NAME = "main-0123456789abcdef.js"
+
+
+def test_strip_source_maps_leaves_plain_chunks(tmp_path):
+    chunks = tmp_path / "_next" / "static" / "chunks"
+    chunks.mkdir(parents=True)
+    (chunks / NAME).write_text(f"console.log(1);\n//# sourceMappingURL={NAME}.map\n")
+    (chunks / f"{NAME}.map").write_text(json.dumps({"version": 3, "file": NAME, "mappings": ""}))
+    css = tmp_path / "_next" / "static" / "css"
+    css.mkdir()
+    (css / "app.css").write_text("a{color:red}\n/*# sourceMappingURL=app.css.map */")
+    (css / "app.css.map").write_text("{}")
+
+    assert bundle_report.strip_source_maps(tmp_path) == 2
+    assert (chunks / NAME).read_text() == "console.log(1);"
+    assert (css / "app.css").read_text() == "a{color:red}"
+    assert not list(tmp_path.rglob("*.map"))
+    assert bundle_report.strip_source_maps(tmp_path) == 0
+    deterministic.stabilize_chunk_names(tmp_path)
+    assert deterministic.stabilize_chunk_names(tmp_path) == 0
@@ -0,0 +1,61 @@
+import json
+import re
+
+from Guia_landing import deterministic
+
+OLD = "main-0123456789abcdef.js"
+
+
+def _export(tmp_path, name=OLD):
+    chunks = tmp_path / "_next" / "static" / "chunks"
+    chunks.mkdir(parents=True)
+    (chunks / name).write_text(f"console.log(1);\n//# sourceMappingURL={name}.map")
+    (chunks / f"{name}.map").write_text(json.dumps({"version": 3, "file": name, "mappings": ""}))
+    (tmp_path / "index.html").write_text(f'<script src="/_next/static/chunks/{name}"></script>')
+    return chunks
+
+
+def test_self_referencing_chunk_settles_with_its_source_map(tmp_path):
+    chunks = _export(tmp_path)
+    assert deterministic.stabilize_chunk_names(tmp_path) == 1
+    (chunk,) = chunks.glob("*.js")
+    assert chunk.name != OLD
+    assert chunk.read_text().endswith(f"//# sourceMappingURL={chunk.name}.map")
+    source_map = chunks / f"{chunk.name}.map"
+    assert json.loads(source_map.read_text())["file"] == chunk.name
+    assert not (chunks / f"{OLD}.map").exists()
+    assert chunk.name in (tmp_path / "index.html").read_text()
+    assert deterministic.stabilize_chunk_names(tmp_path) == 0
+
+
+def test_chunk_names_depend_only_on_content(tmp_path):
+    first = _export(tmp_path / "a")
+    second = _export(tmp_path / "b", "main-fedcba9876543210.js")
+    for chunks in (first, second):
+        deterministic.stabilize_chunk_names(chunks.parents[2])
+    assert [p.name for p in first.glob("*.js")] == [p.name for p in second.glob("*.js")]
+
+
+def test_lazy_chunks_stay_reachable_through_the_runtime_map(tmp_path):
+    static = tmp_path / "_next" / "static"
+    (static / "chunks").mkdir(parents=True)
+    (static / "css").mkdir()
+    (static / "chunks" / "859.aaaaaaaaaaaaaaaa.js").write_text("lazy();")
+    (static / "css" / "bbbbbbbbbbbbbbbb.css").write_text("a{color:red}")
+    runtime = (
+        'c.u=function(e){return"static/chunks/"+e+"."+{859:"aaaaaaaaaaaaaaaa"}[e]+".js"},'
+        'c.miniCssF=function(e){return"static/css/"+{859:"bbbbbbbbbbbbbbbb"}[e]+".css"};'
+    )
+    (static / "chunks" / "webpack-0123456789abcdef.js").write_text(runtime)
+    (tmp_path / "index.html").write_text(
+        '<script src="/_next/static/chunks/webpack-0123456789abcdef.js"></script>'
+    )
+
+    deterministic.stabilize_chunk_names(tmp_path)
+    assert not (static / "chunks" / "859.aaaaaaaaaaaaaaaa.js").exists()
+    (runtime,) = (static / "chunks").glob("webpack-*.js")
+    chunk_hash, css_hash = re.findall(r'\{859:"([0-9a-f]+)"\}', runtime.read_text())
+    assert (static / "chunks" / f"859.{chunk_hash}.js").read_text() == "lazy();"
+    assert (static / "css" / f"{css_hash}.css").read_text() == "a{color:red}"
+    assert runtime.name in (tmp_path / "index.html").read_text()
+    assert deterministic.stabilize_chunk_names(tmp_path) == 0
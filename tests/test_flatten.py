@@ -0,0 +1,98 @@
+import reflex as rx
+
+from Guia_landing import flatten
+from Guia_landing.Guia_landing import index
+from Guia_landing.codigo_pagina import BELOW_FOLD_ATTRIBUTE
+
+
+def _find(component, predicate):
+    """Return every component of a tree matching predicate."""
+    found = [component] if predicate(component) else []
+    for child in component.children:
+        if isinstance(child, rx.Component):
+            found += _find(child, predicate)
+    return found
+
+
+def test_index_page_hands_deferred_rendering_down():
+    root, removed = flatten.flatten(index())
+    assert removed == 7
+    deferred = _find(root, lambda c: c.custom_attrs.get(BELOW_FOLD_ATTRIBUTE) == "true")
+    assert len(deferred) == 5
+    assert all("contentVisibility" in component.style for component in deferred)
+
+
+def _types(component):
+    return [type(child).__name__ for child in component.children]
+
+
+def test_bare_root_boxes_are_dropped():
+    root, removed = flatten.flatten(rx.box(rx.box(rx.heading("Hola"))))
+    assert type(root).__name__ == "Heading"
+    assert removed == 2
+
+
+def test_bare_box_of_blocks_is_replaced_by_its_children():
+    parent = rx.box(rx.box(rx.heading("a"), rx.text("b")), rx.text("c"), id="page")
+    root, removed = flatten.flatten(parent)
+    assert _types(root) == ["Heading", "Text", "Text"]
+    assert removed == 1
+
+
+def test_bare_box_stays_in_a_flex_parent_or_around_inline_children():
+    flex = rx.flex(rx.box(rx.heading("a"), rx.text("b")), rx.text("c"))
+    _, removed = flatten.flatten(flex)
+    assert removed == 0
+    inline = rx.box(rx.box(rx.link("a", href="/")), rx.text("c"), id="page")
+    _, removed = flatten.flatten(inline)
+    assert removed == 0
+
+
+def test_wrapper_hands_id_padding_and_attributes_down():
+    wrapper = rx.box(
+        rx.box(rx.text("a"), background_color="#fff"),
+        id="about",
+        padding_top="2em",
+        padding_bottom="2em",
+        custom_attrs={"data-below-fold": "true"},
+    )
+    root, removed = flatten.flatten(rx.box(wrapper, rx.text("b"), id="page"))
+    assert removed == 1
+    child = root.children[0]
+    assert _types(child) == ["Text"]
+    assert child.id == "about"
+    assert child.custom_attrs == {"data-below-fold": "true"}
+    assert {"paddingTop", "paddingBottom", "backgroundColor"} <= set(child.style)
+
+
+def test_wrapper_background_folds_only_when_inherited():
+    def page(background):
+        wrapper = rx.box(rx.box(rx.text("a"), color="red"), background_color=background, padding_top="1em")
+        return rx.box(wrapper, background_color="#fff", id="page")
+
+    assert flatten.flatten(page("#fff"))[1] == 1
+    assert flatten.flatten(page("#000"))[1] == 0
+
+
+def test_wrapper_with_props_is_kept():
+    def inner(**props):
+        return rx.box(rx.text("a"), color="red", **props)
+
+    wrappers = [
+        rx.box(inner(), class_name="card"),
+        rx.box(inner(), on_click=rx.console_log("hola")),
+        rx.box(inner(custom_attrs={"data-x": "child"}), custom_attrs={"data-x": "wrapper"}),
+        rx.box(inner(), padding_top="1em", margin_top="1em"),
+        rx.box(inner(margin_top="1em"), padding_top="1em"),
+        rx.box(inner(id="b"), id="a"),
+    ]
+    for wrapper in wrappers:
+        _, removed = flatten.flatten(rx.box(wrapper, rx.text("b"), id="page"))
+        assert removed == 0
+
+
+def test_plain_span_in_text_becomes_text():
+    text = rx.text(rx.text.span("Hola"), rx.text.span("mundo", color="red"))
+    root, removed = flatten.flatten(rx.box(text, id="page"))
+    assert removed == 1
+    assert _types(root.children[0]) == ["Bare", "Span"]
@@ -0,0 +1,20 @@
+from Guia_landing import headers
+
+
+def test_nginx_form_keeps_server_level_headers(tmp_path):
+    public = tmp_path / "public"
+    public.mkdir()
+    (public / "index.html").write_text('<link rel="stylesheet" href="/_next/static/css/a.css">')
+    out_dir = tmp_path / "deploy"
+
+    headers.generate(public, out_dir)
+
+    assert (public / headers.HEADERS_FILE).exists()
+    assert (out_dir / headers.JSON_FILE).exists()
+    nginx = (out_dir / headers.NGINX_FILE).read_text()
+    directives = [line for line in nginx.splitlines() if not line.startswith("#")]
+    assert not any("add_header" in line or "location" in line for line in directives)
+    assert "map $uri $guia_cache_control {" in nginx
+    assert '"~^/_next/static/" "public, max-age=31536000, immutable";' in nginx
+    assert '"/" "no-cache";' in nginx
+    assert '"/index.html" "</_next/static/css/a.css>; rel=preload; as=style";' in nginx
@@ -0,0 +1,28 @@
+from Guia_landing import headers
+from Guia_landing.image_pipeline import ResponsiveImage
+
+VARIANTS = {
+    640: [("avif", "image/avif", "/img/a.avif"), ("jpg", "image/jpeg", "/img/a.jpg")],
+    1280: [("avif", "image/avif", "/img/b.avif"), ("jpg", "image/jpeg", "/img/b.jpg")],
+}
+
+
+def test_preloads_are_limited_to_browsers_that_decode_the_format():
+    links = [str(link) for link in ResponsiveImage(VARIANTS, "data:").preload_links()]
+    assert len(links) == 2
+    for link, url in zip(links, ("/img/a.avif", "/img/b.avif")):
+        assert f'href={{"{url}"}}' in link
+        assert 'type={"image/avif"}' in link
+    assert 'media={"(min-width: 0px) and (max-width: 767.98px)"}' in links[0]
+    assert 'media={"(min-width: 768px)"}' in links[1]
+
+
+def test_early_hints_keep_the_preload_type():
+    html = (
+        '<link rel="preload" as="image" href="/img/b.avif" type="image/avif" '
+        'media="(min-width: 768px)" fetchpriority="high">'
+    )
+    assert headers.preload_links(html) == (
+        '</img/b.avif>; rel=preload; as=image; type="image/avif"; '
+        'media="(min-width: 768px)"; fetchpriority="high"'
+    )
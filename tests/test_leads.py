@@ -0,0 +1,133 @@
+import asyncio
+import sqlite3
+from urllib.parse import urlencode
+
+from Guia_landing import leads
+
+FORM = "application/x-www-form-urlencoded"
+
+
+def _body(**fields):
+    data = {"name": "Ana", "email": "ana@example.com", "message": "Hola", **fields}
+    return urlencode(data).encode()
+
+
+class RecordingStore(leads.LeadStore):
+    """A LeadStore that remembers the size of every transaction."""
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.batches = []
+
+    def _write(self, batch):
+        self.batches.append(len(batch))
+        return super()._write(batch)
+
+
+class FailingStore:
+    async def write(self, batch):
+        raise sqlite3.OperationalError("database is locked")
+
+
+def _rows(path):
+    with sqlite3.connect(path) as connection:
+        return connection.execute("SELECT name, email, ip FROM leads").fetchall()
+
+
+def _collector(store, **kwargs):
+    limiter = leads.RateLimiter(capacity=1_000_000)
+    return leads.LeadCollector(store, limiter=limiter, **kwargs)
+
+
+def test_rate_limiter_allows_a_burst_then_refills():
+    limiter = leads.RateLimiter(capacity=2, refill_seconds=10)
+    assert limiter.allow("a", now=0)
+    assert limiter.allow("a", now=0)
+    assert not limiter.allow("a", now=1)
+    assert limiter.allow("b", now=1)
+    assert limiter.allow("a", now=10)
+    assert not limiter.allow("a", now=10)
+
+
+def test_rate_limiter_forgets_the_oldest_clients():
+    limiter = leads.RateLimiter(capacity=1, max_buckets=2)
+    for client in ("a", "b", "c"):
+        assert limiter.allow(client, now=0)
+    assert list(limiter.buckets) == ["b", "c"]
+    assert limiter.allow("a", now=0)
+
+
+def test_submit_answers_429_once_the_bucket_is_empty(tmp_path):
+    collector = leads.LeadCollector(
+        leads.LeadStore(tmp_path / "leads.sqlite3"), limiter=leads.RateLimiter(capacity=2)
+    )
+    statuses = [collector.submit("1.2.3.4", _body(), FORM)[0] for _ in range(3)]
+    assert statuses == [201, 201, 429]
+    assert collector.submit("5.6.7.8", _body(), FORM)[0] == 201
+    assert len(collector.buffer) == 3
+
+
+def test_submit_validates_and_traps_bots(tmp_path):
+    collector = _collector(leads.LeadStore(tmp_path / "leads.sqlite3"))
+    assert collector.submit("ip", _body(email="not-an-email"), FORM)[0] == 422
+    assert collector.submit("ip", _body(website="http://spam"), FORM) == (201, "received")
+    assert collector.buffer == []
+
+
+def test_full_buffer_answers_503(tmp_path):
+    collector = _collector(leads.LeadStore(tmp_path / "leads.sqlite3"), buffer_size=2)
+    statuses = [collector.submit("ip", _body(), FORM)[0] for _ in range(3)]
+    assert statuses == [201, 201, 503]
+
+
+def test_flush_writes_one_transaction_per_batch(tmp_path):
+    store = RecordingStore(tmp_path / "leads.sqlite3")
+    collector = _collector(store, batch_size=4)
+    for index in range(10):
+        collector.submit(f"10.0.0.{index}", _body(name=f"Lead {index}"), FORM)
+
+    async def flush():
+        return await collector.flush()
+
+    try:
+        assert asyncio.run(flush()) == 10
+    finally:
+        store.close()
+    assert store.batches == [4, 4, 2]
+    assert collector.buffer == []
+    rows = _rows(tmp_path / "leads.sqlite3")
+    assert len(rows) == 10
+    assert rows[0] == ("Lead 0", "ana@example.com", "10.0.0.0")
+
+
+def test_failed_flush_keeps_the_batch():
+    collector = _collector(FailingStore(), batch_size=2)
+    for _ in range(3):
+        collector.submit("ip", _body(), FORM)
+    assert asyncio.run(collector.flush()) == 0
+    assert len(collector.buffer) == 3
+
+
+def test_run_flushes_as_soon_as_a_batch_fills(tmp_path):
+    store = RecordingStore(tmp_path / "leads.sqlite3")
+
+    async def scenario():
+        collector = _collector(store, batch_size=3, flush_interval=60)
+        task = collector.start()
+        for _ in range(4):
+            collector.submit("ip", _body(), FORM)
+        await asyncio.sleep(0.2)
+        early = list(store.batches)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        return early
+
+    try:
+        early = asyncio.run(scenario())
+    finally:
+        store.close()
+    assert early == [3, 1]
+    assert len(_rows(tmp_path / "leads.sqlite3")) == 4
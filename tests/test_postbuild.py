@@ -0,0 +1,63 @@
+from Guia_landing import postbuild
+
+CSS = ".hero{color:red}.below{color:blue}.icon{width:1rem}.footer-note{color:gray}"
+
+HTML = (
+    '<!DOCTYPE html><html><head><title>t</title>'
+    '<link rel="stylesheet" href="/_next/static/css/site.css"/></head><body>'
+    '<div class="hero"><img class="hero-img" src="/a.jpg"></div>'
+    '<section data-below-fold="true"><div class="below"><br><span class="icon"></span></div></section>'
+    '<p class="footer-note"></p></body></html>'
+)
+
+
+def _export(tmp_path):
+    css = tmp_path / "_next" / "static" / "css" / "site.css"
+    css.parent.mkdir(parents=True)
+    css.write_text(CSS)
+    page = tmp_path / "index.html"
+    page.write_text(HTML)
+    return page
+
+
+def test_critical_css_leaves_out_below_the_fold():
+    critical = postbuild.extract_critical_css(HTML, CSS)
+    assert ".hero{" in critical
+    assert ".footer-note{" in critical
+    assert ".below" not in critical
+    assert ".icon" not in critical
+
+
+def test_critical_css_without_markers_covers_the_whole_page():
+    html = HTML.replace(' data-below-fold="true"', "")
+    assert ".below{" in postbuild.extract_critical_css(html, CSS)
+
+
+def test_minify_keeps_descendant_combinators():
+    html = "<html><head><style>:is(.dark) :where(.theme) { color : red ; }</style></head></html>"
+    assert ":is(.dark) :where(.theme){color:red;}" in postbuild.minify_html(html)
+
+
+def test_stylesheet_is_deferred(tmp_path):
+    page = _export(tmp_path)
+    postbuild.optimize_page(page, tmp_path)
+    html = page.read_text()
+    assert '<style data-critical="">' in html
+    assert "media=\"print\" onload=\"this.media='all'\"" in html
+    assert '<noscript><link rel="stylesheet" href="/_next/static/css/site.css"/></noscript>' in html
+
+
+def test_rerun_is_a_no_op(tmp_path):
+    page = _export(tmp_path)
+    postbuild.optimize_page(page, tmp_path)
+    first = page.read_text()
+    postbuild.optimize_page(page, tmp_path)
+    assert page.read_text() == first
+
+
+def test_precompress_writes_smaller_siblings_once(tmp_path):
+    path = tmp_path / "app.js"
+    path.write_text("console.log('x');\n" * 200)
+    assert postbuild.precompress(path) >= 1
+    assert path.with_name("app.js.gz").exists()
+    assert postbuild.precompress(path) == 0
@@ -0,0 +1,205 @@
+import asyncio
+import gzip
+
+import pytest
+
+from Guia_landing import serve
+
+INDEX = b"<!DOCTYPE html><html><body>" + b"hola " * 200 + b"</body></html>"
+
+
+@pytest.fixture
+def root(tmp_path):
+    public = tmp_path / "public"
+    (public / "about").mkdir(parents=True)
+    (public / "index.html").write_bytes(INDEX)
+    (public / "index.html.gz").write_bytes(gzip.compress(INDEX, mtime=0))
+    (public / "index.html.br").write_bytes(b"brotli body")
+    (public / "404.html").write_bytes(b"not found")
+    (public / "about" / "index.html").write_bytes(b"about")
+    (public / "data.txt").write_bytes(b"0123456789")
+    (tmp_path / "secret.txt").write_bytes(b"secret")
+    return public
+
+
+def fetch(root, target, method="GET", loop_factory=None, **headers):
+    """Send one request to a StaticServer over TCP; returns (status, headers, body)."""
+
+    async def run():
+        server = serve.StaticServer(root, serve.FileCache())
+        listener = await asyncio.start_server(server.handle, "127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        lines = [f"{method} {target} HTTP/1.1", "Host: localhost", "Connection: close"]
+        lines += [f"{name.replace('_', '-')}: {value}" for name, value in headers.items()]
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        data = await asyncio.wait_for(reader.read(), 5)
+        writer.close()
+        listener.close()
+        await listener.wait_closed()
+        return data
+
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        data = runner.run(run())
+    head, _, body = data.partition(b"\r\n\r\n")
+    status_line, *header_lines = head.decode("latin-1").split("\r\n")
+    response = {}
+    for line in header_lines:
+        name, _, value = line.partition(":")
+        response[name.strip().lower()] = value.strip()
+    return int(status_line.split(" ")[1]), response, body
+
+
+def test_serves_a_file(root):
+    status, headers, body = fetch(root, "/data.txt")
+    assert status == 200
+    assert body == b"0123456789"
+    assert headers["content-length"] == "10"
+    assert headers["cache-control"] == "no-cache"
+
+
+def test_large_file_is_sent_whole_under_uvloop(root):
+    uvloop = pytest.importorskip("uvloop")
+    chunk = bytes(range(256)) * 560
+    assert len(chunk) > serve.DEFAULT_CACHE_ENTRY_BYTES
+    (root / "chunk.js").write_bytes(chunk)
+    for loop_factory in (None, uvloop.new_event_loop):
+        status, headers, body = fetch(root, "/chunk.js", loop_factory=loop_factory)
+        assert status == 200
+        assert headers["content-length"] == str(len(chunk))
+        assert body == chunk
+        status, _, body = fetch(root, "/chunk.js", loop_factory=loop_factory, range="bytes=70000-")
+        assert status == 206
+        assert body == chunk[70000:]
+
+
+@pytest.mark.parametrize(
+    "target", ["/../secret.txt", "/%2e%2e/secret.txt", "/about/../../secret.txt", "/..%2fsecret.txt"]
+)
+def test_traversal_stays_inside_the_root(root, target):
+    status, _, body = fetch(root, target)
+    assert status == 404
+    assert body == b"not found"
+
+
+@pytest.mark.parametrize("target", ["/%00", "/index.html%00.txt", "/a%0d%0aSet-Cookie:x"])
+def test_control_characters_are_a_bad_request(root, target):
+    status, headers, _ = fetch(root, target)
+    assert status == 400
+    assert headers["connection"] == "close"
+
+
+def test_directory_redirect_keeps_the_query(root):
+    status, headers, _ = fetch(root, "/about?utm=x")
+    assert status == 308
+    assert headers["location"] == "/about/?utm=x"
+
+
+def test_directory_redirect_is_never_protocol_relative(root):
+    (root / "evil.example").mkdir()
+    status, headers, _ = fetch(root, "//evil.example")
+    assert status == 308
+    assert headers["location"] == "/evil.example/"
+
+
+def test_head_announces_the_length_without_a_body(root):
+    status, headers, body = fetch(root, "/data.txt", method="HEAD")
+    assert status == 200
+    assert headers["content-length"] == "10"
+    assert body == b""
+
+
+def test_not_modified_has_no_content_length(root):
+    _, headers, _ = fetch(root, "/data.txt")
+    status, not_modified, body = fetch(root, "/data.txt", If_None_Match=headers["etag"])
+    assert status == 304
+    assert "content-length" not in not_modified
+    assert not_modified["etag"] == headers["etag"]
+    assert body == b""
+
+
+def test_stale_etag_gets_the_full_file(root):
+    status, _, body = fetch(root, "/data.txt", If_None_Match='"stale"')
+    assert status == 200
+    assert body == b"0123456789"
+
+
+@pytest.mark.parametrize(
+    "header, content_range, expected",
+    [
+        ("bytes=0-3", "bytes 0-3/10", b"0123"),
+        ("bytes=7-", "bytes 7-9/10", b"789"),
+        ("bytes=-3", "bytes 7-9/10", b"789"),
+        ("bytes=8-100", "bytes 8-9/10", b"89"),
+        ("bytes=-100", "bytes 0-9/10", b"0123456789"),
+    ],
+)
+def test_single_ranges(root, header, content_range, expected):
+    status, headers, body = fetch(root, "/data.txt", Range=header)
+    assert status == 206
+    assert headers["content-range"] == content_range
+    assert body == expected
+
+
+@pytest.mark.parametrize("header", ["bytes=10-", "bytes=5-2", "bytes=-0"])
+def test_unsatisfiable_ranges(root, header):
+    status, headers, _ = fetch(root, "/data.txt", Range=header)
+    assert status == 416
+    assert headers["content-range"] == "bytes */10"
+
+
+@pytest.mark.parametrize("header", ["bytes=0-1,4-5", "items=0-1"])
+def test_unsupported_ranges_get_the_full_file(root, header):
+    status, _, body = fetch(root, "/data.txt", Range=header)
+    assert status == 200
+    assert body == b"0123456789"
+
+
+def test_range_with_a_stale_if_range_gets_the_full_file(root):
+    status, _, body = fetch(root, "/data.txt", Range="bytes=0-3", If_Range='"stale"')
+    assert status == 200
+    assert body == b"0123456789"
+
+
+@pytest.mark.parametrize(
+    "accept, encoding, body",
+    [
+        ("gzip, br", "br", b"brotli body"),
+        ("gzip", "gzip", gzip.compress(INDEX, mtime=0)),
+        ("br;q=0, gzip", "gzip", gzip.compress(INDEX, mtime=0)),
+        ("identity", None, INDEX),
+    ],
+)
+def test_encoding_selection(root, accept, encoding, body):
+    status, headers, received = fetch(root, "/", Accept_Encoding=accept)
+    assert status == 200
+    assert headers.get("content-encoding") == encoding
+    assert headers["vary"] == "Accept-Encoding"
+    assert received == body
+
+
+def test_ranges_address_the_identity_representation(root):
+    status, headers, body = fetch(root, "/", Accept_Encoding="br, gzip", Range="bytes=0-8")
+    assert status == 206
+    assert "content-encoding" not in headers
+    assert body == INDEX[:9]
+
+
+def test_unknown_method_is_refused(root):
+    status, headers, _ = fetch(root, "/data.txt", method="PUT")
+    assert status == 405
+    assert headers["allow"] == "GET, HEAD"
+
+
+def test_etags_are_bounded(tmp_path):
+    cache = serve.FileCache(max_etags=2)
+    paths = []
+    for name in "abc":
+        path = tmp_path / name
+        path.write_bytes(name.encode())
+        paths.append(path)
+        cache.etag(path, path.stat())
+    assert list(cache.etags) == paths[1:]
+    paths[1].write_bytes(b"changed")
+    cache.etag(paths[1], paths[1].stat())
+    assert list(cache.etags) == [paths[2], paths[1]]
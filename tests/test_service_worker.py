@@ -0,0 +1,29 @@
+from Guia_landing import service_worker
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+def test_manifest_lists_only_the_assets_pages_load(tmp_path):
+    static = tmp_path / "_next" / "static"
+    _write(static / "css" / "site.css", "@font-face{src:url(../media/font.woff2)}")
+    _write(static / "media" / "font.woff2", "font")
+    _write(static / "chunks" / "main.js", "main")
+    _write(static / "chunks" / "polyfills.js", "polyfills")
+    _write(static / "chunks" / "unused.js", "unused")
+    _write(
+        tmp_path / "index.html",
+        '<link rel="stylesheet" href="/_next/static/css/site.css"/>'
+        '<script nomodule src="/_next/static/chunks/polyfills.js"></script>'
+        '<script src="/_next/static/chunks/main.js"></script>',
+    )
+    _write(tmp_path / "about" / "index.html", '<link rel="stylesheet" href="/_next/static/css/site.css"/>')
+    assert service_worker.build_manifest(tmp_path) == [
+        {"url": "/_next/static/css/site.css"},
+        {"url": "/_next/static/chunks/main.js"},
+        {"url": "/_next/static/media/font.woff2"},
+        {"url": "/about/", "page": True},
+        {"url": "/", "page": True},
+    ]
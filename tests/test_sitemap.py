@@ -0,0 +1,67 @@
+import os
+
+from Guia_landing import sitemap
+
+BASE = "https://example.com"
+
+
+def _entries(count, path="page"):
+    return [(f"{BASE}/{path}-{n}/", "2024-01-01T00:00:00Z") for n in range(count)]
+
+
+def _export(tmp_path, pages):
+    public = tmp_path / "public"
+    for route, body in pages.items():
+        path = sitemap.page_file(public, route)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(body)
+    return public
+
+
+def test_shards_split_at_the_url_limit(tmp_path):
+    names = sitemap.write_shards(tmp_path, _entries(5), max_urls=2)
+    assert names == ["sitemap-0.xml", "sitemap-1.xml", "sitemap-2.xml"]
+    assert (tmp_path / "sitemap-2.xml").read_text().count("<url>") == 1
+    assert sitemap.write_shards(tmp_path, _entries(1), max_urls=2) == ["sitemap-0.xml"]
+    assert not (tmp_path / "sitemap-1.xml").exists()
+
+
+def test_shards_split_at_the_encoded_size_limit(tmp_path):
+    entries = _entries(4, path="ñandú" * 20)
+    line = f"<url><loc>{entries[0][0]}</loc><lastmod>{entries[0][1]}</lastmod></url>\n"
+    # Room for one line and a bit, if characters were counted instead of bytes.
+    max_bytes = len(sitemap.URLSET_HEAD) + len(sitemap.URLSET_TAIL) + len(line.encode()) + len(line)
+    assert len(line.encode()) > len(line)
+    names = sitemap.write_shards(tmp_path, entries, max_bytes=max_bytes)
+    assert len(names) == 4
+    for name in names:
+        assert len((tmp_path / name).read_bytes()) <= max_bytes
+
+
+def test_index_lists_the_shards(tmp_path):
+    sitemap.write_index(tmp_path, BASE, ["sitemap-0.xml", "sitemap-1.xml"])
+    index = (tmp_path / "sitemap.xml").read_text()
+    assert "<sitemapindex" in index
+    assert f"<loc>{BASE}/sitemap-0.xml</loc>" in index
+    assert f"<loc>{BASE}/sitemap-1.xml</loc>" in index
+
+
+def test_lastmod_only_moves_for_changed_pages(tmp_path, monkeypatch):
+    public = _export(tmp_path, {"index": "<p>hola</p>", "about": "<p>about</p>"})
+    manifest = tmp_path / "manifest.json"
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "86400")
+    assert sitemap.generate(public, BASE, ["index", "about"], manifest)[:2] == (2, 2)
+    first = (public / "sitemap-0.xml").read_text()
+    os.utime(public / "sitemap-0.xml", (0, 0))
+
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "172800")
+    (public / "index.html").write_text('<p>hola</p><script src="/_next/static/x.js"></script>')
+    assert sitemap.generate(public, BASE, ["index", "about"], manifest)[:2] == (2, 0)
+    assert (public / "sitemap-0.xml").read_text() == first
+    assert (public / "sitemap-0.xml").stat().st_mtime == 0
+
+    (public / "about" / "index.html").write_text("<p>acerca</p>")
+    assert sitemap.generate(public, BASE, ["index", "about"], manifest)[:2] == (2, 1)
+    xml = (public / "sitemap-0.xml").read_text()
+    assert f"<loc>{BASE}/about/</loc><lastmod>1970-01-03T00:00:00Z</lastmod>" in xml
+    assert f"<loc>{BASE}/</loc><lastmod>1970-01-02T00:00:00Z</lastmod>" in xml
@@ -0,0 +1,33 @@
+import json
+
+from Guia_landing import codigo_pagina
+from Guia_landing.Guia_landing import index
+from Guia_landing.sites import load_site
+
+TEMPLATED = [
+    name
+    for name, helper in vars(codigo_pagina).items()
+    if callable(helper) and hasattr(helper, "templates")
+]
+
+
+def _output(page):
+    """Return the JSX and the render tree of a page, as text."""
+    return str(page), json.dumps(page.render(), sort_keys=True, default=str)
+
+
+def test_templated_page_is_identical_to_the_component_page(monkeypatch):
+    assert len(TEMPLATED) == 6
+    # Twice, so that the second page is filled from already built templates.
+    templated = [_output(index()) for _ in range(2)]
+    assert all(getattr(codigo_pagina, name).templates for name in TEMPLATED)
+    for name in TEMPLATED:
+        monkeypatch.setattr(codigo_pagina, name, getattr(codigo_pagina, name).__wrapped__)
+    direct = _output(index())
+    assert templated == [direct, direct]
+
+
+def test_no_placeholder_is_left():
+    jsx = str(index())
+    assert load_site()["brand"] in jsx
+    assert "__template_" not in jsx
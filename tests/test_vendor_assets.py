@@ -0,0 +1,79 @@
+import io
+
+import pytest
+
+from Guia_landing import vendor_assets
+from Guia_landing.vendor_assets import AssetCache, VendorError
+
+URL = "https://cdn.example/lib/site.css"
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """Serve URL from a dict instead of the network; returns the dict."""
+    content = {URL: b"body{color:red}"}
+
+    def urlopen(request, timeout):
+        return io.BytesIO(content[request.full_url])
+
+    monkeypatch.setattr(vendor_assets.urllib.request, "urlopen", urlopen)
+    return content
+
+
+def _cache(tmp_path, **kwargs):
+    return AssetCache(tmp_path / "cache", tmp_path / "lock.json", **kwargs)
+
+
+def test_fetch_locks_new_urls(tmp_path, upstream):
+    cache = _cache(tmp_path, fetch=True)
+    assert cache.get(URL) == upstream[URL]
+    cache.save()
+    assert _cache(tmp_path).get(URL) == upstream[URL]
+
+
+def test_fetch_restores_a_missing_file_from_the_lock(tmp_path, upstream):
+    cache = _cache(tmp_path, fetch=True)
+    cache.get(URL)
+    cache.save()
+    (tmp_path / "cache" / cache.lock[URL]["file"]).unlink()
+    assert _cache(tmp_path).get(URL) is None
+    assert _cache(tmp_path, fetch=True).get(URL) == upstream[URL]
+    assert _cache(tmp_path).get(URL) == upstream[URL]
+
+
+def test_restore_refuses_changed_upstream_content(tmp_path, upstream):
+    cache = _cache(tmp_path, fetch=True)
+    cache.get(URL)
+    cache.save()
+    (tmp_path / "cache" / cache.lock[URL]["file"]).unlink()
+    upstream[URL] = b"body{color:blue}"
+    with pytest.raises(VendorError):
+        _cache(tmp_path, fetch=True).get(URL)
+    assert _cache(tmp_path, fetch=True, update=True).get(URL) == upstream[URL]
+
+
+def test_tampered_cache_file_is_refused(tmp_path, upstream):
+    cache = _cache(tmp_path, fetch=True)
+    cache.get(URL)
+    cache.save()
+    (tmp_path / "cache" / cache.lock[URL]["file"]).write_bytes(b"tampered")
+    with pytest.raises(VendorError):
+        _cache(tmp_path).get(URL)
+
+
+def test_build_fails_without_a_cached_copy(tmp_path):
+    import reflex as rx
+
+    vendor = vendor_assets.AssetVendor(_cache(tmp_path), assets_dir=tmp_path / "assets")
+    page = rx.box(rx.el.link(rel="stylesheet", href=URL))
+    with pytest.raises(VendorError, match="commit vendor/assets/"):
+        vendor_assets.vendor_assets(page, vendor=vendor)
+
+
+def test_asset_cache_is_a_build_input(tmp_path):
+    from Guia_landing import build_cache
+
+    cached = tmp_path / "vendor" / "assets" / "cdn.example" / "site.css"
+    cached.parent.mkdir(parents=True)
+    cached.write_text("body{}")
+    assert cached in build_cache.input_files(tmp_path)